@@ -0,0 +1,122 @@
+"""Schéma initial (tables créées jusqu'ici par Base.metadata.create_all)
+
+Une base existante créée par create_all est marquée sans être modifiée :
+    alembic stamp 0001_baseline
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_baseline"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQLAlchemy stocke le nom des membres des enums Python
+user_role = sa.Enum("ADMIN", "TEACHER", "STUDENT", "PARENT", name="userrole")
+enrollment_status = sa.Enum("ACTIVE", "COMPLETED", "DROPPED", "SUSPENDED", name="enrollmentstatus")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("first_name", sa.String(), nullable=False),
+        sa.Column("last_name", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("role", user_role, nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("phone", sa.String(), nullable=True),
+        sa.Column("address", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+
+    op.create_table(
+        "classes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("level", sa.String(), nullable=False),
+        sa.Column("section", sa.String(), nullable=True),
+        sa.Column("academic_year", sa.String(), nullable=False),
+        sa.Column("max_students", sa.Integer(), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+    )
+    op.create_index("ix_classes_id", "classes", ["id"])
+    op.create_index("ix_classes_name", "classes", ["name"], unique=True)
+
+    op.create_table(
+        "students",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False, unique=True),
+        sa.Column("student_number", sa.String(), nullable=False),
+        sa.Column("date_of_birth", sa.Date(), nullable=False),
+        sa.Column("parent_name", sa.String(), nullable=True),
+        sa.Column("parent_phone", sa.String(), nullable=True),
+        sa.Column("parent_email", sa.String(), nullable=True),
+        sa.Column("emergency_contact", sa.String(), nullable=True),
+        sa.Column("medical_info", sa.String(), nullable=True),
+    )
+    op.create_index("ix_students_id", "students", ["id"])
+    op.create_index("ix_students_student_number", "students", ["student_number"], unique=True)
+
+    op.create_table(
+        "teachers",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False, unique=True),
+        sa.Column("employee_number", sa.String(), nullable=False),
+        sa.Column("hire_date", sa.Date(), nullable=False),
+        sa.Column("specialization", sa.String(), nullable=True),
+        sa.Column("qualifications", sa.Text(), nullable=True),
+        sa.Column("salary", sa.Integer(), nullable=True),
+    )
+    op.create_index("ix_teachers_id", "teachers", ["id"])
+    op.create_index("ix_teachers_employee_number", "teachers", ["employee_number"], unique=True)
+
+    op.create_table(
+        "subjects",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("code", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("credits", sa.Integer(), nullable=True),
+        sa.Column("hours_per_week", sa.Integer(), nullable=True),
+        sa.Column("teacher_id", sa.Integer(), sa.ForeignKey("teachers.id"), nullable=True),
+        sa.Column("classe_id", sa.Integer(), sa.ForeignKey("classes.id"), nullable=False),
+    )
+    op.create_index("ix_subjects_id", "subjects", ["id"])
+    op.create_index("ix_subjects_code", "subjects", ["code"], unique=True)
+
+    op.create_table(
+        "enrollments",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("student_id", sa.Integer(), sa.ForeignKey("students.id"), nullable=False),
+        sa.Column("classe_id", sa.Integer(), sa.ForeignKey("classes.id"), nullable=False),
+        sa.Column("enrollment_date", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("status", enrollment_status, nullable=True),
+    )
+    op.create_index("ix_enrollments_id", "enrollments", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("enrollments")
+    op.drop_table("subjects")
+    op.drop_table("teachers")
+    op.drop_table("students")
+    op.drop_table("classes")
+    op.drop_table("users")
+    enrollment_status.drop(op.get_bind(), checkfirst=True)
+    user_role.drop(op.get_bind(), checkfirst=True)
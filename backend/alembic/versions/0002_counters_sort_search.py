@@ -0,0 +1,143 @@
+"""Compteur d'inscriptions, index de tri et index de recherche
+
+Revision ID: 0002_counters_sort_search
+Revises: 0001_baseline
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_counters_sort_search"
+down_revision: Union[str, None] = "0001_baseline"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# DDL figé à cette révision : la migration ne doit pas suivre les évolutions de app/search.py
+PG_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    """
+    CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    AS $$ SELECT public.unaccent('public.unaccent', $1) $$
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_users_search_trgm ON users USING gin "
+    "((f_unaccent(lower(first_name || ' ' || last_name || ' ' || email || ' ' || username))) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_students_search_trgm ON students USING gin "
+    "((f_unaccent(lower(student_number || ' ' || coalesce(parent_name, '')))) gin_trgm_ops)",
+]
+
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+        first_name, last_name, email, username,
+        content='users', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN
+        INSERT INTO users_fts(rowid, first_name, last_name, email, username)
+        VALUES (new.id, new.first_name, new.last_name, new.email, new.username);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN
+        INSERT INTO users_fts(users_fts, rowid, first_name, last_name, email, username)
+        VALUES ('delete', old.id, old.first_name, old.last_name, old.email, old.username);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_fts_update AFTER UPDATE OF first_name, last_name, email, username ON users BEGIN
+        INSERT INTO users_fts(users_fts, rowid, first_name, last_name, email, username)
+        VALUES ('delete', old.id, old.first_name, old.last_name, old.email, old.username);
+        INSERT INTO users_fts(rowid, first_name, last_name, email, username)
+        VALUES (new.id, new.first_name, new.last_name, new.email, new.username);
+    END
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS students_fts USING fts5(
+        first_name, last_name, student_number, parent_name, email,
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS students_fts_insert AFTER INSERT ON students BEGIN
+        INSERT INTO students_fts(rowid, first_name, last_name, student_number, parent_name, email)
+        SELECT new.id, users.first_name, users.last_name, new.student_number, new.parent_name, users.email
+        FROM (SELECT 1) LEFT JOIN users ON users.id = new.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS students_fts_delete AFTER DELETE ON students BEGIN
+        DELETE FROM students_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS students_fts_update AFTER UPDATE OF user_id, student_number, parent_name ON students BEGIN
+        DELETE FROM students_fts WHERE rowid = old.id;
+        INSERT INTO students_fts(rowid, first_name, last_name, student_number, parent_name, email)
+        SELECT new.id, users.first_name, users.last_name, new.student_number, new.parent_name, users.email
+        FROM (SELECT 1) LEFT JOIN users ON users.id = new.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS students_fts_user_update AFTER UPDATE OF first_name, last_name, email ON users BEGIN
+        UPDATE students_fts SET first_name = new.first_name, last_name = new.last_name, email = new.email
+        WHERE rowid IN (SELECT id FROM students WHERE user_id = new.id);
+    END
+    """,
+    # Remplissage initial à partir des lignes existantes
+    "INSERT INTO users_fts(users_fts) VALUES ('rebuild')",
+    "DELETE FROM students_fts",
+    """
+    INSERT INTO students_fts(rowid, first_name, last_name, student_number, parent_name, email)
+    SELECT students.id, users.first_name, users.last_name, students.student_number, students.parent_name, users.email
+    FROM students LEFT JOIN users ON users.id = students.user_id
+    """,
+]
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("classes") as batch:
+        batch.add_column(sa.Column("active_enrollments", sa.Integer(), nullable=False, server_default="0"))
+    # Même calcul que `python -m app.enrollment_counters`
+    op.execute(
+        "UPDATE classes SET active_enrollments = ("
+        "SELECT count(*) FROM enrollments "
+        "WHERE enrollments.classe_id = classes.id AND enrollments.status = 'ACTIVE')"
+    )
+
+    op.create_index("ix_users_last_name", "users", ["last_name"])
+    op.create_index("ix_teachers_hire_date", "teachers", ["hire_date"])
+    op.create_index("ix_classes_academic_year", "classes", ["academic_year"])
+    op.create_index("ix_subjects_name", "subjects", ["name"])
+
+    dialect = op.get_context().dialect.name
+    for statement in {"postgresql": PG_SEARCH_DDL, "sqlite": SQLITE_SEARCH_DDL}.get(dialect, []):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        for name in ("users_fts_insert", "users_fts_delete", "users_fts_update", "students_fts_insert",
+                     "students_fts_delete", "students_fts_update", "students_fts_user_update"):
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+        op.execute("DROP TABLE IF EXISTS users_fts")
+        op.execute("DROP TABLE IF EXISTS students_fts")
+    elif bind.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_users_search_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_students_search_trgm")
+
+    op.drop_index("ix_subjects_name", table_name="subjects")
+    op.drop_index("ix_classes_academic_year", table_name="classes")
+    op.drop_index("ix_teachers_hire_date", table_name="teachers")
+    op.drop_index("ix_users_last_name", table_name="users")
+    with op.batch_alter_table("classes") as batch:
+        batch.drop_column("active_enrollments")
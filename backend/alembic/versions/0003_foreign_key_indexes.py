@@ -0,0 +1,34 @@
+"""Index des clés étrangères et des colonnes filtrées
+
+Revision ID: 0003_foreign_key_indexes
+Revises: 0002_counters_sort_search
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_foreign_key_indexes"
+down_revision: Union[str, None] = "0002_counters_sort_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_subjects_classe_id", "subjects", ["classe_id"])
+    op.create_index("ix_subjects_teacher_id", "subjects", ["teacher_id"])
+    op.create_index("ix_enrollments_student_id", "enrollments", ["student_id"])
+    # Sert aussi les recherches sur classe_id seul (colonne de tête)
+    op.create_index("ix_enrollments_classe_id_status", "enrollments", ["classe_id", "status"])
+    op.create_index("ix_users_role", "users", ["role"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_role", table_name="users")
+    op.drop_index("ix_enrollments_classe_id_status", table_name="enrollments")
+    op.drop_index("ix_enrollments_student_id", table_name="enrollments")
+    op.drop_index("ix_subjects_teacher_id", table_name="subjects")
+    op.drop_index("ix_subjects_classe_id", table_name="subjects")
@@ -0,0 +1,31 @@
+"""Versions par table (ETag des classes et matières)
+
+Revision ID: 0004_table_versions
+Revises: 0003_foreign_key_indexes
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_table_versions"
+down_revision: Union[str, None] = "0003_foreign_key_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    table_versions = op.create_table(
+        "table_versions",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.bulk_insert(table_versions, [{"name": "classes", "version": 0}, {"name": "subjects", "version": 0}])
+
+
+def downgrade() -> None:
+    op.drop_table("table_versions")
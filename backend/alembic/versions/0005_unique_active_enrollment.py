@@ -0,0 +1,43 @@
+"""Une seule inscription active par étudiant et par classe (index unique partiel)
+
+Revision ID: 0005_unique_active_enrollment
+Revises: 0004_table_versions
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_unique_active_enrollment"
+down_revision: Union[str, None] = "0004_table_versions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text("status = 'ACTIVE'")
+
+
+def upgrade() -> None:
+    # Doublons créés par des inscriptions concurrentes : seule la plus ancienne reste active
+    op.execute(
+        "UPDATE enrollments SET status = 'DROPPED' WHERE status = 'ACTIVE' AND id NOT IN ("
+        "SELECT min_id FROM (SELECT MIN(id) AS min_id FROM enrollments "
+        "WHERE status = 'ACTIVE' GROUP BY student_id, classe_id) AS first_enrollments)"
+    )
+    # Même calcul que `python -m app.enrollment_counters`
+    op.execute(
+        "UPDATE classes SET active_enrollments = ("
+        "SELECT count(*) FROM enrollments "
+        "WHERE enrollments.classe_id = classes.id AND enrollments.status = 'ACTIVE')"
+    )
+    op.create_index(
+        "uq_enrollments_active_student_classe", "enrollments", ["student_id", "classe_id"], unique=True,
+        postgresql_where=ACTIVE, sqlite_where=ACTIVE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_enrollments_active_student_classe", table_name="enrollments")
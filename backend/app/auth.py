@@ -1,35 +1,88 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from .database import get_db
-from .models.user import User
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from .cache import TTLCache
+from .database import get_async_db, get_db
+from .models.user import User, UserRole
 from .schemas.user import TokenData
 from .config import settings
 
-# Configuration du hachage des mots de passe
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=1)
+def get_pwd_context():
+    """Configuration du hachage des mots de passe (passlib chargé à la première utilisation)."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 
 # Configuration OAuth2
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Exécuteur borné pour bcrypt et les requêtes synchrones de l'authentification :
+# elles ne bloquent plus la boucle d'événements des endpoints async.
+auth_executor = ThreadPoolExecutor(max_workers=settings.auth_executor_workers, thread_name_prefix="auth")
+
+
+# Caches des tokens décodés (token -> username) et des utilisateurs résolus
+# (username -> copie détachée du User). Locaux au worker et bornés en taille et
+# en durée. `update_user` / `delete_user` retirent l'utilisateur de tous les
+# workers (`reference_cache.publish_principal_invalidation`) ; si une
+# notification est perdue, le changement est vu au plus tard après
+# `auth_cache_ttl_seconds`.
+token_cache = TTLCache(settings.auth_cache_max_size, settings.auth_cache_ttl_seconds)
+principal_cache = TTLCache(settings.auth_cache_max_size, settings.auth_cache_ttl_seconds)
+
+
+def invalidate_principal(username: str) -> None:
+    """Retirer un utilisateur du cache (modification, désactivation, suppression)."""
+    principal_cache.pop(username)
+
+
+def clear_auth_caches() -> None:
+    token_cache.clear()
+    principal_cache.clear()
+
+
+def _detached_copy(user: User) -> User:
+    """Copier les colonnes d'un utilisateur dans une instance indépendante de toute session."""
+    copy = User(**{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs})
+    make_transient_to_detached(copy)
+    return copy
+
+
+async def run_in_auth_executor(func, *args):
+    """Exécuter une fonction bloquante dans l'exécuteur d'authentification."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(auth_executor, func, *args)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Vérifier un mot de passe."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hacher un mot de passe."""
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
+
+
+def get_user_by_username(db: Session, username: str) -> Optional[User]:
+    """Obtenir un utilisateur par son nom d'utilisateur."""
+    return db.query(User).filter(User.username == username).first()
 
 
 def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
     """Authentifier un utilisateur."""
-    user = db.query(User).filter(User.username == username).first()
+    user = get_user_by_username(db, username)
     if not user:
         return None
     if not verify_password(password, user.hashed_password):
@@ -39,6 +92,8 @@ def authenticate_user(db: Session, username: str, password: str) -> Optional[Use
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Créer un token d'accès JWT."""
+    from jose import jwt  # import différé : jose charge toute la pile cryptography
+
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -49,25 +104,74 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    """Obtenir l'utilisateur actuel à partir du token."""
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _username_from_token(token: str) -> str:
+    """Décoder le token (ou le lire dans le cache) et renvoyer le nom d'utilisateur."""
+    username = token_cache.get(token)
+    if username is not None:
+        return username
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         username: str = payload.get("sub")
         if username is None:
-            raise credentials_exception
+            raise _credentials_exception()
         token_data = TokenData(username=username)
     except JWTError:
-        raise credentials_exception
-    
-    user = db.query(User).filter(User.username == token_data.username).first()
+        raise _credentials_exception()
+    # Ne jamais garder un token au-delà de son expiration
+    token_cache.set(token, token_data.username, ttl=payload["exp"] - time.time() if "exp" in payload else None)
+    return token_data.username
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    """Obtenir l'utilisateur actuel à partir du token."""
+    username = _username_from_token(token)
+
+    cached_user = principal_cache.get(username)
+    if cached_user is not None:
+        # Rattacher une copie à la session de la requête, sans requête SQL
+        return db.merge(cached_user, load=False)
+
+    user = await run_in_auth_executor(get_user_by_username, db, username)
+    if user is None:
+        raise _credentials_exception()
+    principal_cache.set(username, _detached_copy(user))
+    return user
+
+
+async def get_current_user_async(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)):
+    """Obtenir l'utilisateur actuel à partir du token (mode asynchrone)."""
+    username = _username_from_token(token)
+
+    cached_user = principal_cache.get(username)
+    if cached_user is not None:
+        return await db.merge(cached_user, load=False)
+
+    result = await db.execute(select(User).where(User.username == username))
+    user = result.scalars().first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
+    principal_cache.set(username, _detached_copy(user))
+    return user
+
+
+async def authenticate_user_async(db: AsyncSession, username: str, password: str) -> Optional[User]:
+    """Authentifier un utilisateur (requête asynchrone, bcrypt dans l'exécuteur)."""
+    result = await db.execute(select(User).where(User.username == username))
+    user = result.scalars().first()
+    if not user:
+        return None
+    if not await run_in_auth_executor(verify_password, password, user.hashed_password):
+        return None
     return user
 
 
@@ -76,3 +180,17 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+async def get_current_active_user_async(current_user: User = Depends(get_current_user_async)):
+    """Obtenir l'utilisateur actuel actif (mode asynchrone)."""
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+
+async def get_current_admin_user(current_user: User = Depends(get_current_active_user)):
+    """Obtenir l'utilisateur actuel, qui doit être administrateur."""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Accès réservé aux administrateurs")
+    return current_user
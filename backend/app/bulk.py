@@ -0,0 +1,89 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set
+
+from fastapi import HTTPException, status
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .config import settings
+from .schemas.bulk import BulkItemResult, BulkResponse
+
+
+def check_batch_size(items: Sequence[Any]) -> None:
+    """Refuser les lots vides ou trop volumineux."""
+    if not items:
+        raise HTTPException(status_code=400, detail="Le lot est vide")
+    if len(items) > settings.bulk_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Un lot ne peut pas dépasser {settings.bulk_max_items} éléments"
+        )
+
+
+def existing_values(db: Session, column, values: Iterable[Any]) -> Set[Any]:
+    """Renvoyer, en une seule requête, les valeurs déjà présentes dans `column`."""
+    values = {value for value in values if value is not None}
+    if not values:
+        return set()
+    return set(db.execute(select(column).where(column.in_(values))).scalars())
+
+
+def check_exists(items: Sequence[Any], key: Callable[[Any], Any], existing: Set[Any],
+                 message: str, errors: Dict[int, str]) -> None:
+    """Marquer en erreur les éléments dont la référence n'existe pas (une référence None n'est pas vérifiée)."""
+    for index, item in enumerate(items):
+        value = key(item)
+        if index not in errors and value is not None and value not in existing:
+            errors[index] = message
+
+
+def check_unique(items: Sequence[Any], key: Callable[[Any], Any], taken: Set[Any],
+                 message: str, errors: Dict[int, str]) -> None:
+    """Marquer en erreur les éléments dont la clé existe déjà en base ou est répétée dans le lot."""
+    seen = set()
+    for index, item in enumerate(items):
+        value = key(item)
+        if index in errors:
+            continue
+        if value in taken or value in seen:
+            errors[index] = message
+        else:
+            seen.add(value)
+
+
+def insert_valid(db: Session, model, items: Sequence[Any], errors: Dict[int, str],
+                 rows: Optional[Dict[int, dict]] = None, response_class=BulkResponse,
+                 **extra) -> BulkResponse:
+    """Insérer les éléments valides par instructions multi-lignes et construire la réponse.
+
+    `rows` permet de fournir les lignes déjà préparées (index -> valeurs) ;
+    sinon chaque élément valide est inséré tel quel.
+    """
+    valid = [index for index in range(len(items)) if index not in errors]
+    if rows is None:
+        rows = {index: items[index].dict() for index in valid}
+    created: Dict[int, int] = {}
+    if valid:
+        stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+        batch_size = settings.bulk_insert_batch_size
+        try:
+            ids = []
+            for start in range(0, len(valid), batch_size):
+                batch = valid[start:start + batch_size]
+                ids.extend(db.execute(stmt, [rows[index] for index in batch]).scalars().all())
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Conflit d'unicité pendant l'insertion du lot, veuillez réessayer"
+            )
+        created = dict(zip(valid, ids))
+
+    results: List[BulkItemResult] = [
+        BulkItemResult(index=index, success=True, id=created[index])
+        if index in created else
+        BulkItemResult(index=index, success=False, error=errors[index])
+        for index in range(len(items))
+    ]
+    return response_class(created=len(created), failed=len(items) - len(created), results=results, **extra)
@@ -1,50 +1,83 @@
 #!/usr/bin/env python3
 """
 Script pour vider la base de données
+
+Les tables sont vidées en bloc, sans parcourir les lignes :
+- PostgreSQL : `TRUNCATE ... RESTART IDENTITY CASCADE` (ni DELETE ligne à
+  ligne ni gonflement du WAL, séquences remises à 1) ;
+- SQLite : `DELETE FROM` sans condition, que SQLite exécute en vidant les pages
+  de la table tant qu'aucun déclencheur n'est défini dessus. Les déclencheurs
+  de la recherche FTS5 sont donc retirés le temps du nettoyage, puis recréés,
+  et les index vidés. Les clés primaires INTEGER sans AUTOINCREMENT repartent
+  de 1 sur une table vide.
 """
 
-from sqlalchemy.orm import Session
-from .database import SessionLocal, engine
-from .models.user import User
-from .models.student import Student
-from .models.teacher import Teacher
-from .models.classe import Classe
-from .models.subject import Subject
-from .models.enrollment import Enrollment
+import time
+from typing import List
+
+from sqlalchemy import Table
+from sqlalchemy.engine import Connection
+from .database import Base, SessionLocal
+from .models.table_version import TableVersion, VERSIONED_TABLES
+from .search import search_index_statements
+from .table_versions import bump_version
+
+
+def data_tables() -> List[Table]:
+    """Tables de données, des tables dépendantes vers les tables référencées (hors `table_versions`)."""
+    return [table for table in reversed(Base.metadata.sorted_tables) if table.name != TableVersion.__tablename__]
+
+
+def truncate_statement(tables: List[Table]) -> str:
+    return f"TRUNCATE {', '.join(table.name for table in tables)} RESTART IDENTITY CASCADE"
+
+
+def _truncate_sqlite(connection: Connection, tables: List[Table]) -> None:
+    names = ", ".join(f"'{table.name}'" for table in tables)
+    triggers = connection.exec_driver_sql(
+        f"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name IN ({names})"
+    ).all()
+    for name, _ in triggers:
+        connection.exec_driver_sql(f'DROP TRIGGER "{name}"')
+    for table in tables:
+        connection.exec_driver_sql(f'DELETE FROM "{table.name}"')
+    for _, sql in triggers:
+        connection.exec_driver_sql(sql)
+    # Reconstruire les index de recherche à partir des tables vides revient à les vider
+    for statement in search_index_statements("sqlite", backfill=True):
+        connection.exec_driver_sql(statement)
+
+
+def truncate_tables(connection: Connection) -> List[Table]:
+    """Vider toutes les tables de données dans la transaction de `connection`; renvoie les tables vidées."""
+    tables = data_tables()
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        connection.exec_driver_sql(truncate_statement(tables))
+    elif dialect == "sqlite":
+        _truncate_sqlite(connection, tables)
+    else:
+        for table in tables:
+            connection.execute(table.delete())
+    return tables
 
 
 def clear_database():
     """Vider toutes les tables de la base de données."""
     print("🗑️  Début du nettoyage de la base de données...")
-    
+    start = time.perf_counter()
+
     # Créer une session
     db = SessionLocal()
-    
+
     try:
-        # Supprimer dans l'ordre inverse des dépendances
-        print("   Suppression des inscriptions...")
-        db.query(Enrollment).delete()
-        
-        print("   Suppression des matières...")
-        db.query(Subject).delete()
-        
-        print("   Suppression des profils étudiants...")
-        db.query(Student).delete()
-        
-        print("   Suppression des profils enseignants...")
-        db.query(Teacher).delete()
-        
-        print("   Suppression des classes...")
-        db.query(Classe).delete()
-        
-        print("   Suppression des utilisateurs...")
-        db.query(User).delete()
-        
-        # Valider les suppressions
+        tables = truncate_tables(db.connection())
         db.commit()
-        
-        print("✅ Base de données vidée avec succès !")
-        
+        bump_version(db, *VERSIONED_TABLES)
+
+        print(f"   Tables vidées : {', '.join(table.name for table in tables)}")
+        print(f"✅ Base de données vidée avec succès ! ({time.perf_counter() - start:.2f} s)")
+
     except Exception as e:
         print(f"❌ Erreur lors du nettoyage: {e}")
         db.rollback()
@@ -1,14 +1,67 @@
+from fastapi import Depends, Request
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from .cache import TTLCache
 from .config import settings
+from .pool_metrics import TimedQueuePool, instrument_pool, read_pool_metrics
+
+
+def engine_options(database_url: str, for_async: bool = False) -> dict:
+    """Options du pool de connexions issues de la configuration."""
+    if database_url.startswith("sqlite"):
+        # SQLite garde les pools par défaut de SQLAlchemy
+        return {}
+    options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if not for_async:
+        # L'engine asynchrone garde son AsyncAdaptedQueuePool
+        options["poolclass"] = TimedQueuePool
+    if settings.db_statement_timeout_ms and database_url.startswith("postgresql"):
+        # Appliqué à chaque connexion dès son ouverture
+        if for_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(settings.db_statement_timeout_ms)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={settings.db_statement_timeout_ms}"}
+    return options
+
+
+def to_async_url(database_url: str) -> str:
+    """Convertir une URL synchrone vers le pilote asyncio équivalent."""
+    for prefix, async_prefix in (
+        ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+        ("postgresql://", "postgresql+asyncpg://"),
+        ("sqlite://", "sqlite+aiosqlite://"),
+    ):
+        if database_url.startswith(prefix):
+            return async_prefix + database_url[len(prefix):]
+    return database_url
+
 
 # Création de l'engine SQLAlchemy
-engine = create_engine(settings.database_url)
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
+instrument_pool(engine)
 
 # Session locale
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Réplique en lecture (optionnelle)
+read_engine = None
+ReadSessionLocal = None
+if settings.database_read_url:
+    read_engine = create_engine(settings.database_read_url, **engine_options(settings.database_read_url))
+    instrument_pool(read_engine, read_pool_metrics)
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# Clients ayant écrit récemment : leurs lectures restent sur la base principale
+# le temps que la réplique rattrape son retard (suivi local au worker)
+recent_writers = TTLCache(max_size=100000, ttl=settings.read_your_writes_seconds)
+
 # Base pour les modèles
 Base = declarative_base()
 
@@ -20,3 +73,95 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def client_key(headers, client) -> str:
+    """Identifier un client : son token s'il est authentifié, sinon son adresse."""
+    return headers.get("authorization") or (client[0] if client else "anonymous")
+
+
+# Dépendance pour les routes en lecture seule : réplique si elle est configurée,
+# sauf pour un client qui vient d'écrire
+def get_read_db(request: Request, db=Depends(get_db)):
+    if ReadSessionLocal is None or recent_writers.get(client_key(request.headers, request.client)):
+        yield db
+        return
+    read_db = ReadSessionLocal()
+    try:
+        yield read_db
+    finally:
+        read_db.close()
+
+
+class ReadYourWritesMiddleware:
+    """Mémoriser les clients dont une écriture (POST, PUT, DELETE...) a réussi."""
+
+    SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in self.SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        key = client_key(headers, scope.get("client"))
+
+        async def send_and_track(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                recent_writers.set(key, True)
+            await send(message)
+
+        await self.app(scope, receive, send_and_track)
+
+
+# Mode asynchrone (optionnel) : l'engine n'est créé qu'à la première utilisation
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def get_async_engine():
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        async_url = to_async_url(settings.database_url)
+        _async_engine = create_async_engine(async_url, **engine_options(async_url, for_async=True))
+        _AsyncSessionLocal = async_sessionmaker(_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_engine
+
+
+# Dépendance pour obtenir une session asynchrone
+async def get_async_db():
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
+
+
+# Réplique en lecture en mode asynchrone, créée elle aussi à la première utilisation
+_async_read_engine = None
+_AsyncReadSessionLocal = None
+
+
+def get_async_read_sessionmaker():
+    """Fabrique de sessions asynchrones sur la réplique (None sans réplique)."""
+    global _async_read_engine, _AsyncReadSessionLocal
+    if _AsyncReadSessionLocal is None and settings.database_read_url:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        async_url = to_async_url(settings.database_read_url)
+        _async_read_engine = create_async_engine(async_url, **engine_options(async_url, for_async=True))
+        _AsyncReadSessionLocal = async_sessionmaker(_async_read_engine, autoflush=False, expire_on_commit=False)
+    return _AsyncReadSessionLocal
+
+
+# Équivalent asynchrone de `get_read_db`
+async def get_async_read_db(request: Request, db=Depends(get_async_db)):
+    session_factory = get_async_read_sessionmaker()
+    if session_factory is None or recent_writers.get(client_key(request.headers, request.client)):
+        yield db
+        return
+    async with session_factory() as read_db:
+        yield read_db
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Maintenance du compteur d'inscriptions actives des classes (Classe.active_enrollments)
+
+Exécuté directement, recalcule tous les compteurs et affiche les écarts :
+    python -m app.enrollment_counters
+"""
+
+from typing import List
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import Session
+from .database import SessionLocal
+from .models.classe import Classe
+from .models.enrollment import Enrollment, EnrollmentStatus
+from .table_versions import bump_version
+
+
+def claim_seat(db: Session, classe_id: int) -> bool:
+    """Réserver une place de façon atomique; False si la classe est complète.
+
+    L'UPDATE conditionnel verrouille la seule ligne de la classe : deux
+    inscriptions concurrentes ne peuvent pas prendre la dernière place.
+    Une classe sans `max_students` n'a pas de limite (le compteur est tenu à jour).
+    """
+    result = db.execute(
+        update(Classe)
+        .where(Classe.id == classe_id,
+               or_(Classe.max_students.is_(None), Classe.active_enrollments < Classe.max_students))
+        .values(active_enrollments=Classe.active_enrollments + 1)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def release_seat(db: Session, classe_id: int) -> None:
+    """Libérer une place (inscription supprimée ou qui n'est plus active)."""
+    db.execute(
+        update(Classe)
+        .where(Classe.id == classe_id, Classe.active_enrollments > 0)
+        .values(active_enrollments=Classe.active_enrollments - 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _active_count():
+    return (
+        select(func.count(Enrollment.id))
+        .where(Enrollment.classe_id == Classe.id, Enrollment.status == EnrollmentStatus.ACTIVE)
+        .correlate(Classe)
+        .scalar_subquery()
+    )
+
+
+def reconcile_enrollment_counters(db: Session) -> List[dict]:
+    """Recalculer tous les compteurs en une instruction et renvoyer les écarts corrigés."""
+    actual = _active_count()
+    drift = [
+        {"classe_id": row.id, "name": row.name, "stored": row.active_enrollments, "actual": row.actual}
+        for row in db.execute(
+            select(Classe.id, Classe.name, Classe.active_enrollments, actual.label("actual"))
+            .where(Classe.active_enrollments != actual)
+            .order_by(Classe.id)
+        )
+    ]
+    if drift:
+        db.execute(
+            update(Classe)
+            .where(Classe.active_enrollments != actual)
+            .values(active_enrollments=actual)
+            .execution_options(synchronize_session=False)
+        )
+    db.commit()
+    if drift:
+        bump_version(db, "classes")
+    return drift
+
+
+def main():
+    print("🔢 Réconciliation des compteurs d'inscriptions...")
+    db = SessionLocal()
+    try:
+        drift = reconcile_enrollment_counters(db)
+        for row in drift:
+            print(f"   {row['name']} (id {row['classe_id']}) : {row['stored']} -> {row['actual']}")
+        print(f"✅ {len(drift)} classe(s) corrigée(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
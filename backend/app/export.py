@@ -0,0 +1,67 @@
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import Iterator, List, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Nombre de lignes lues par aller-retour avec le curseur côté serveur
+EXPORT_CHUNK_SIZE = 1000
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+def _plain(value):
+    """Convertir une valeur SQL en valeur sérialisable."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _csv_chunks(fields: List[str], partitions) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for rows in partitions:
+        writer.writerows([_plain(value) for value in row] for row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(fields: List[str], partitions) -> Iterator[str]:
+    for rows in partitions:
+        yield "".join(
+            json.dumps(dict(zip(fields, map(_plain, row))), ensure_ascii=False) + "\n" for row in rows
+        )
+
+
+def export_rows(db: Session, model, schema: Type[BaseModel], export_format: str, filename: str) -> StreamingResponse:
+    """Exporter une table en flux CSV ou NDJSON, à mémoire constante.
+
+    Seules les colonnes du schéma de réponse sont lues (jamais les mots de passe),
+    par paquets de `EXPORT_CHUNK_SIZE` via un curseur côté serveur (`yield_per`),
+    sans construire d'objets ORM. La session de la dépendance reste ouverte tant
+    que la réponse est envoyée.
+    """
+    fields = list(schema.model_fields)
+    stmt = (
+        select(*[getattr(model, field) for field in fields])
+        .order_by(model.id)
+        .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    )
+    partitions = db.execute(stmt).partitions()
+    chunks = _csv_chunks(fields, partitions) if export_format == "csv" else _ndjson_chunks(fields, partitions)
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
@@ -0,0 +1,77 @@
+"""
+Sélection de champs (`?fields=id,name`) sur les listes et les détails
+
+Chaque entité expose une dépendance qui valide les champs demandés contre son
+schéma de réponse et renvoie un `FieldSet` : les champs à renvoyer (`id`
+toujours inclus) et les colonnes à charger (`load_only`). Les colonnes non
+demandées, comme les champs Text, ne sont ni lues ni sérialisées.
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple, Type
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy.orm import load_only
+
+from .models.classe import Classe
+from .models.enrollment import Enrollment
+from .models.student import Student
+from .models.subject import Subject
+from .models.teacher import Teacher
+from .models.user import User
+from .schemas.classe import ClasseResponse
+from .schemas.enrollment import EnrollmentResponse
+from .schemas.student import StudentResponse
+from .schemas.subject import SubjectResponse
+from .schemas.teacher import TeacherResponse
+from .schemas.user import UserResponse
+
+
+class FieldSet(NamedTuple):
+    names: Optional[Tuple[str, ...]]  # None : tous les champs du schéma
+    columns: tuple
+
+    def load_options(self, *extra_columns) -> list:
+        """Options de requête : `load_only` des colonnes demandées et de `extra_columns` (colonne de tri)."""
+        if self.names is None:
+            return []
+        return [load_only(*self.columns, *(column for column in extra_columns if column is not None))]
+
+
+ALL_FIELDS = FieldSet(None, ())
+
+
+def fields_param(schema: Type[BaseModel], model, derived: Optional[Dict[str, Tuple[str, ...]]] = None):
+    """Construire la dépendance `?fields=a,b` limitée aux champs de `schema`.
+
+    `derived` : colonnes nécessaires aux champs calculés (propriétés du modèle).
+    """
+    allowed = tuple(schema.model_fields)
+    derived = derived or {}
+    choices = ", ".join(allowed)
+
+    def dependency(
+        fields: Optional[str] = Query(None, description=f"Champs à renvoyer, séparés par des virgules : {choices}")
+    ) -> FieldSet:
+        if fields is None:
+            return ALL_FIELDS
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = sorted(requested - set(allowed))
+        if unknown or not requested:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Champs inconnus : {', '.join(unknown)} (valeurs possibles : {choices})",
+            )
+        names = tuple(name for name in allowed if name in requested or name == "id")
+        columns = tuple(getattr(model, column) for name in names for column in derived.get(name, (name,)))
+        return FieldSet(names, columns)
+
+    return dependency
+
+
+user_fields = fields_param(UserResponse, User)
+student_fields = fields_param(StudentResponse, Student)
+teacher_fields = fields_param(TeacherResponse, Teacher)
+classe_fields = fields_param(ClasseResponse, Classe, derived={"fill_rate": ("active_enrollments", "max_students")})
+subject_fields = fields_param(SubjectResponse, Subject)
+enrollment_fields = fields_param(EnrollmentResponse, Enrollment)
@@ -0,0 +1,122 @@
+"""
+Filtres et tris des endpoints de liste
+
+Chaque entité expose une dépendance de filtres typés, qui renvoie les
+conditions SQL à appliquer (`query.filter(*conditions)` ou
+`select(...).where(*conditions)`), et une dépendance de tri limitée à une
+liste de colonnes indexées. Le tri est combiné avec l'`id` par `paginate`,
+ce qui garde la pagination par curseur stable.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from fastapi import HTTPException, Query
+from sqlalchemy import select
+
+from .models.classe import Classe
+from .models.enrollment import Enrollment, EnrollmentStatus
+from .models.student import Student
+from .models.subject import Subject
+from .models.teacher import Teacher
+from .models.user import User, UserRole
+
+
+class SortOrder(NamedTuple):
+    column: Any
+    descending: bool
+
+
+def equal_conditions(values: Dict[Any, Any]) -> list:
+    """Une condition `colonne = valeur` par filtre renseigné."""
+    return [column == value for column, value in values.items() if value is not None]
+
+
+def sort_param(allowed: Dict[str, Any]):
+    """Construire la dépendance `?sort=champ` / `?sort=-champ` limitée aux colonnes de `allowed`."""
+    choices = ", ".join(sorted(allowed))
+
+    def dependency(
+        sort: Optional[str] = Query(None, description=f"Tri (préfixe « - » pour décroissant) : {choices}")
+    ) -> SortOrder:
+        if sort is None:
+            return SortOrder(None, False)
+        descending = sort.startswith("-")
+        column = allowed.get(sort[1:] if descending else sort)
+        if column is None:
+            raise HTTPException(status_code=400, detail=f"Tri non autorisé (valeurs possibles : {choices})")
+        return SortOrder(column, descending)
+
+    return dependency
+
+
+# --- Utilisateurs ---
+
+def user_filters(role: Optional[UserRole] = None, is_active: Optional[bool] = None) -> List:
+    return equal_conditions({User.role: role, User.is_active: is_active})
+
+
+# L'ordre de création est celui des `id` : pas de tri distinct sur created_at
+user_sort = sort_param({
+    "id": User.id, "username": User.username, "email": User.email, "last_name": User.last_name,
+})
+
+
+# --- Étudiants ---
+
+def student_filters(classe_id: Optional[int] = None) -> List:
+    """`classe_id` : étudiants ayant une inscription active dans la classe."""
+    if classe_id is None:
+        return []
+    # IN plutôt qu'EXISTS corrélé : la sous-requête part de l'index (classe_id, status)
+    return [Student.id.in_(
+        select(Enrollment.student_id).where(
+            Enrollment.classe_id == classe_id, Enrollment.status == EnrollmentStatus.ACTIVE
+        )
+    )]
+
+
+student_sort = sort_param({"id": Student.id, "student_number": Student.student_number})
+
+
+# --- Enseignants ---
+
+def teacher_filters(specialization: Optional[str] = None) -> List:
+    return equal_conditions({Teacher.specialization: specialization})
+
+
+teacher_sort = sort_param({
+    "id": Teacher.id, "employee_number": Teacher.employee_number, "hire_date": Teacher.hire_date,
+})
+
+
+# --- Classes ---
+
+def classe_filters(level: Optional[str] = None, academic_year: Optional[str] = None) -> List:
+    return equal_conditions({Classe.level: level, Classe.academic_year: academic_year})
+
+
+classe_sort = sort_param({"id": Classe.id, "name": Classe.name, "academic_year": Classe.academic_year})
+
+
+# --- Matières ---
+
+def subject_filters(classe_id: Optional[int] = None, teacher_id: Optional[int] = None) -> List:
+    return equal_conditions({Subject.classe_id: classe_id, Subject.teacher_id: teacher_id})
+
+
+subject_sort = sort_param({"id": Subject.id, "code": Subject.code, "name": Subject.name})
+
+
+# --- Inscriptions ---
+
+def enrollment_filters(
+    status: Optional[EnrollmentStatus] = None,
+    classe_id: Optional[int] = None,
+    student_id: Optional[int] = None,
+) -> List:
+    return equal_conditions({
+        Enrollment.status: status, Enrollment.classe_id: classe_id, Enrollment.student_id: student_id,
+    })
+
+
+enrollment_sort = sort_param({"id": Enrollment.id})
@@ -0,0 +1,46 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from .auth import get_password_hash
+from .config import settings
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def hash_workers() -> int:
+    """Nombre de processus de hachage (0 dans la configuration = tous les cœurs)."""
+    return settings.password_hash_workers or os.cpu_count() or 1
+
+
+def get_hash_pool() -> ProcessPoolExecutor:
+    """Pool de processus partagé, créé à la première utilisation."""
+    global _pool
+    if _pool is None:
+        # "spawn" : on ne duplique pas les threads ni les connexions du serveur
+        _pool = ProcessPoolExecutor(
+            max_workers=hash_workers(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def shutdown_hash_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def hash_passwords(passwords: Sequence[str]) -> Tuple[List[str], float]:
+    """Hacher les mots de passe sur tous les cœurs; renvoie les hachages et la durée en secondes."""
+    start = time.perf_counter()
+    workers = hash_workers()
+    if workers <= 1 or len(passwords) <= 1:
+        hashes = [get_password_hash(password) for password in passwords]
+    else:
+        chunksize = max(1, len(passwords) // (workers * 4))
+        hashes = list(get_hash_pool().map(get_password_hash, passwords, chunksize=chunksize))
+    return hashes, time.perf_counter() - start
@@ -1,14 +1,31 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .config import settings
-from .database import engine, Base
-from .routers import auth, users, students, teachers, classes, subjects
+from .database import engine, Base, ReadYourWritesMiddleware, SessionLocal
+from .routers import auth, users, students, teachers, classes, subjects, enrollments, admin
+from .hashing import shutdown_hash_pool
+from .reference_cache import start_reference_cache, stop_reference_cache
 
 # Importer tous les modèles pour que SQLAlchemy puisse créer les tables
 from .models import user, student, teacher, classe, subject, enrollment
 
-# Créer les tables
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Démarrage et arrêt du worker.
+
+    L'import du module ne touche pas la base : le schéma est géré par les
+    migrations Alembic, `DB_CREATE_ALL=true` le crée au démarrage (développement).
+    """
+    if settings.db_create_all:
+        Base.metadata.create_all(bind=engine)
+    start_reference_cache(engine, SessionLocal)
+    yield
+    shutdown_hash_pool()
+    stop_reference_cache()
+
 
 # Créer l'application FastAPI
 app = FastAPI(
@@ -16,7 +33,8 @@ app = FastAPI(
     description="API pour la gestion d'une école privée",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Configuration CORS
@@ -28,6 +46,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Lectures sur la base principale juste après une écriture du même client
+if settings.database_read_url:
+    app.add_middleware(ReadYourWritesMiddleware)
+
+# Mode asynchrone : les lectures et la connexion sont servies par AsyncSession,
+# ces routes étant enregistrées avant leurs équivalents synchrones
+if settings.db_async_mode:
+    from .routers import async_reads
+
+    app.include_router(async_reads.auth_router, prefix="/auth", tags=["Authentication"])
+    app.include_router(async_reads.users_router, prefix="/users", tags=["Users"])
+    app.include_router(async_reads.students_router, prefix="/students", tags=["Students"])
+    app.include_router(async_reads.teachers_router, prefix="/teachers", tags=["Teachers"])
+    app.include_router(async_reads.classes_router, prefix="/classes", tags=["Classes"])
+    app.include_router(async_reads.subjects_router, prefix="/subjects", tags=["Subjects"])
+
 # Inclure les routeurs
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/users", tags=["Users"])
@@ -35,6 +69,8 @@ app.include_router(students.router, prefix="/students", tags=["Students"])
 app.include_router(teachers.router, prefix="/teachers", tags=["Teachers"])
 app.include_router(classes.router, prefix="/classes", tags=["Classes"])
 app.include_router(subjects.router, prefix="/subjects", tags=["Subjects"])
+app.include_router(enrollments.router, prefix="/enrollments", tags=["Enrollments"])
+app.include_router(admin.router, prefix="/admin", tags=["Administration"])
 
 
 @app.get("/")
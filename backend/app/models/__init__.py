@@ -4,5 +4,6 @@ from .teacher import Teacher
 from .classe import Classe
 from .subject import Subject
 from .enrollment import Enrollment
+from .table_version import TableVersion
 
-__all__ = ["User", "Student", "Teacher", "Classe", "Subject", "Enrollment"]
+__all__ = ["User", "Student", "Teacher", "Classe", "Subject", "Enrollment", "TableVersion"]
@@ -10,10 +10,19 @@ class Classe(Base):
     name = Column(String, unique=True, index=True, nullable=False)
     level = Column(String, nullable=False)  # Ex: "6ème", "5ème", "Terminale"
     section = Column(String, nullable=True)  # Ex: "A", "B", "Scientifique"
-    academic_year = Column(String, nullable=False)  # Ex: "2023-2024"
+    academic_year = Column(String, nullable=False, index=True)  # Ex: "2023-2024"
     max_students = Column(Integer, default=30)
     description = Column(Text, nullable=True)
+    # Nombre d'inscriptions actives, maintenu dans la même transaction que les inscriptions
+    active_enrollments = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relations
     enrollments = relationship("Enrollment", back_populates="classe")
     subjects = relationship("Subject", back_populates="classe")
+
+    @property
+    def fill_rate(self) -> float:
+        """Taux de remplissage (0.0 à 1.0) calculé sans requête."""
+        if not self.max_students:
+            return 0.0
+        return round((self.active_enrollments or 0) / self.max_students, 4)
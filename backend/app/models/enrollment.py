@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -14,9 +14,16 @@ class EnrollmentStatus(str, enum.Enum):
 
 class Enrollment(Base):
     __tablename__ = "enrollments"
+    __table_args__ = (
+        # Sert aussi les recherches sur classe_id seul (colonne de tête)
+        Index("ix_enrollments_classe_id_status", "classe_id", "status"),
+        # Une seule inscription active par étudiant et par classe, même entre requêtes concurrentes
+        Index("uq_enrollments_active_student_classe", "student_id", "classe_id", unique=True,
+              postgresql_where=text("status = 'ACTIVE'"), sqlite_where=text("status = 'ACTIVE'")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False, index=True)
     classe_id = Column(Integer, ForeignKey("classes.id"), nullable=False)
     enrollment_date = Column(DateTime(timezone=True), server_default=func.now())
     status = Column(Enum(EnrollmentStatus), default=EnrollmentStatus.ACTIVE)
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, event
+from ..database import Base
+
+# Tables dont les lectures sont servies avec un ETag
+VERSIONED_TABLES = ("classes", "subjects")
+
+
+class TableVersion(Base):
+    """Numéro de version d'une table, incrémenté à chaque écriture (ETag des données de référence)."""
+    __tablename__ = "table_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+@event.listens_for(TableVersion.__table__, "after_create")
+def _create_version_rows(target, connection, **kw):
+    connection.execute(target.insert(), [{"name": name, "version": 0} for name in VERSIONED_TABLES])
@@ -9,7 +9,7 @@ class Teacher(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
     employee_number = Column(String, unique=True, index=True, nullable=False)
-    hire_date = Column(Date, nullable=False)
+    hire_date = Column(Date, nullable=False, index=True)
     specialization = Column(String, nullable=True)
     qualifications = Column(Text, nullable=True)
     salary = Column(Integer, nullable=True)  # En centimes pour éviter les problèmes de float
@@ -0,0 +1,133 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional
+
+from fastapi import HTTPException, Response
+from sqlalchemy import Date, DateTime, Select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query
+
+# En-tête portant le curseur de la page suivante (absent sur la dernière page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_key: str, values: List[Any]) -> str:
+    """Encoder un curseur opaque à partir de la clé de tri et des valeurs de la dernière ligne."""
+    payload = json.dumps({"s": sort_key, "v": values}, separators=(",", ":"), default=_json_default)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Valeur de curseur non sérialisable : {value!r}")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> List[Any]:
+    """Décoder un curseur et vérifier qu'il correspond au tri demandé."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload["v"]
+        if payload["s"] != sort_key or not isinstance(values, list):
+            raise ValueError
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Curseur invalide")
+    return values
+
+
+def paginate(
+    query: Query,
+    response: Response,
+    id_column,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    sort_column=None,
+    descending: bool = False,
+) -> list:
+    """Paginer une requête par décalage (skip) ou par curseur (keyset).
+
+    Les résultats sont toujours triés par `sort_column` puis par `id_column`,
+    ce qui rend l'ordre stable. En mode curseur, `skip` est ignoré et la page
+    est lue à partir de la dernière ligne vue, via l'index : son coût ne dépend
+    pas de la profondeur. Le curseur de la page suivante est renvoyé dans
+    l'en-tête `X-Next-Cursor`.
+    """
+    query, columns, sort_key = _page_query(query, id_column, skip, limit, cursor, sort_column, descending)
+    return _page_rows(query.all(), response, columns, sort_key, limit)
+
+
+async def paginate_async(
+    db: AsyncSession,
+    stmt: Select,
+    response: Response,
+    id_column,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    sort_column=None,
+    descending: bool = False,
+) -> list:
+    """Équivalent de `paginate` pour une instruction `select()` sur une session asynchrone."""
+    stmt, columns, sort_key = _page_query(stmt, id_column, skip, limit, cursor, sort_column, descending)
+    rows = (await db.execute(stmt)).scalars().all()
+    return _page_rows(rows, response, columns, sort_key, limit)
+
+
+def _page_query(query, id_column, skip, limit, cursor, sort_column, descending):
+    """Appliquer le tri, la position de départ et la limite (Query ou Select)."""
+    columns = [id_column] if sort_column is None or sort_column is id_column else [sort_column, id_column]
+    sort_key = ("-" if descending else "") + columns[0].key
+
+    order_by = [column.desc() if descending else column.asc() for column in columns]
+    query = query.order_by(*order_by)
+
+    if cursor is not None:
+        values = decode_cursor(cursor, sort_key)
+        if len(values) != len(columns):
+            raise HTTPException(status_code=400, detail="Curseur invalide")
+        values = [_cursor_value(column, value) for column, value in zip(columns, values)]
+        query = query.filter(_after(columns, values, descending))
+    elif skip:
+        query = query.offset(skip)
+
+    # Une ligne de plus pour savoir s'il existe une page suivante
+    return query.limit(limit + 1), columns, sort_key
+
+
+def _page_rows(rows, response, columns, sort_key, limit):
+    """Tronquer à `limit` et publier le curseur de la page suivante."""
+    if len(rows) > limit and limit > 0:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            sort_key, [getattr(last, column.key) for column in columns]
+        )
+    return rows[:limit]
+
+
+def _cursor_value(column, value):
+    """Reconvertir les dates, sérialisées en ISO 8601 dans le curseur."""
+    try:
+        if isinstance(column.type, DateTime) and isinstance(value, str):
+            return datetime.fromisoformat(value)
+        if isinstance(column.type, Date) and isinstance(value, str):
+            return date.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Curseur invalide")
+    return value
+
+
+def _after(columns, values, descending):
+    """Construire la condition « strictement après la ligne (values) » dans l'ordre de tri."""
+    compare = (lambda column, value: column < value) if descending else (lambda column, value: column > value)
+    if len(columns) == 1:
+        return compare(columns[0], values[0])
+    (sort_column, id_column), (sort_value, id_value) = columns, values
+    return or_(
+        compare(sort_column, sort_value),
+        and_(sort_column == sort_value, compare(id_column, id_value)),
+    )
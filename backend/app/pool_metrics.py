@@ -0,0 +1,115 @@
+import bisect
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Bornes supérieures (ms) de l'histogramme des temps d'attente d'une connexion
+CHECKOUT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """Compteurs du pool de connexions, alimentés par les événements SQLAlchemy."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.connections_created = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.checkout_histogram = [0] * (len(CHECKOUT_BUCKETS_MS) + 1)
+
+    def observe_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self.checkout_histogram[bisect.bisect_left(CHECKOUT_BUCKETS_MS, seconds * 1000)] += 1
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            histogram = {
+                f"le_{bound}ms": count for bound, count in zip(CHECKOUT_BUCKETS_MS, self.checkout_histogram)
+            }
+            histogram["le_inf"] = self.checkout_histogram[-1]
+            waits = sum(self.checkout_histogram)
+            stats = {
+                "pool_class": type(pool).__name__,
+                "connections_created": self.connections_created,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "wait_ms_mean": round(self.wait_seconds_total * 1000 / waits, 3) if waits else 0.0,
+                "checkout_latency_histogram": histogram,
+            }
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        return stats
+
+
+# Un jeu de compteurs par engine : base principale et réplique en lecture
+pool_metrics = PoolMetrics()
+read_pool_metrics = PoolMetrics()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool qui mesure le temps d'attente de chaque demande de connexion."""
+
+    metrics = pool_metrics  # remplacé par `instrument_pool` pour chaque engine
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.increment("timeouts")
+            raise
+        finally:
+            self.metrics.observe_wait(time.perf_counter() - start)
+
+
+def instrument_pool(engine, metrics: PoolMetrics = pool_metrics) -> None:
+    """Brancher les compteurs `metrics` sur le pool de l'engine et sur ses événements."""
+    if isinstance(engine.pool, TimedQueuePool):
+        engine.pool.metrics = metrics
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.increment("connections_created")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.increment("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        metrics.increment("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.increment("invalidations")
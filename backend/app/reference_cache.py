@@ -0,0 +1,393 @@
+"""
+Cache en mémoire des données de référence (classes, matières), invalidé sur tous les workers
+
+Les lectures passent par le cache (par id et par requête de liste) ; les
+écritures appellent `bump_version`, qui vide le cache local et prévient les
+autres workers :
+- PostgreSQL : `NOTIFY reference_data, '<table>'`, reçu par un thread `LISTEN` ;
+- SQLite : un fichier signal par table à côté de la base, surveillé par un
+  thread (intervalle `REFERENCE_CACHE_POLL_SECONDS`).
+Le même canal retire des caches de `app.auth` un utilisateur modifié ou
+supprimé (`publish_principal_invalidation` / `signal_principal_invalidation`)
+et vide le cache des charges horaires (`app.workload`) après une écriture sur
+`subjects` ou `teachers` (`broadcast_invalidation` pour cette dernière).
+Chaque entrée garde la version de sa table (`app.table_versions`) : une entrée
+d'une autre version que celle lue par `conditional_get` est relue, même si
+la notification n'est pas encore arrivée.
+La durée de vie des entrées borne le décalage si une notification est perdue.
+"""
+
+import logging
+import os
+import select
+import threading
+from typing import Awaitable, Callable, Dict, Hashable, Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from .auth import invalidate_principal, principal_cache
+from .cache import TTLCache
+from . import database
+from .config import settings
+from .models.classe import Classe
+from .models.subject import Subject
+from .models.table_version import VERSIONED_TABLES, TableVersion
+from .pagination import NEXT_CURSOR_HEADER, paginate
+from .schemas.classe import ClasseResponse
+from .schemas.subject import SubjectResponse
+from .workload import invalidate_workloads
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "reference_data"
+# Utilisateurs authentifiés en cache : notification "principals:<username>", fichier signal "principals"
+PRINCIPALS = "principals"
+# Tables dont les écritures changent les charges horaires des enseignants
+WORKLOAD_TABLES = ("subjects", "teachers")
+_NOTIFY = text("SELECT pg_notify(:channel, :table)")
+
+# Modèle et schéma de réponse de chaque table en cache (préchauffage)
+REFERENCE_MODELS = {"classes": (Classe, ClasseResponse), "subjects": (Subject, SubjectResponse)}
+
+
+class ReferenceCache:
+    """Un TTLCache par table, avec compteur de génération contre les chargements concurrents.
+
+    Les valeurs sont stockées avec la version de la table au moment de la
+    lecture ; une version différente est traitée comme une absence.
+    """
+
+    def __init__(self, tables, max_size: int, ttl: float):
+        self._caches: Dict[str, TTLCache] = {table: TTLCache(max_size, ttl) for table in tables}
+        self._generations = {table: 0 for table in tables}
+        self._invalidations = {table: 0 for table in tables}
+        self._lock = threading.Lock()
+
+    def get(self, table: str, key: Hashable, version: Optional[int] = None):
+        entry = self._caches[table].get(key)
+        if entry is None or entry[0] != version:
+            return None
+        return entry[1]
+
+    def load(self, table: str, key: Hashable, loader: Callable[[], object], version: Optional[int] = None,
+             ttl: Optional[float] = None, bypass: bool = False):
+        """Lecture traversante : `loader()` en cas d'absence, résultat mis en cache s'il n'est pas None.
+
+        Un chargement qui chevauche une invalidation n'est pas mis en cache.
+        `bypass` force la lecture en base (le résultat, frais, est tout de même gardé).
+        """
+        value = None if bypass else self.get(table, key, version)
+        if value is None:
+            generation = self._generations[table]
+            value = loader()
+            self._store(table, key, value, version, generation, ttl)
+        return value
+
+    async def load_async(self, table: str, key: Hashable, loader: Callable[[], Awaitable[object]],
+                         version: Optional[int] = None, ttl: Optional[float] = None, bypass: bool = False):
+        """Équivalent de `load` pour un chargement asynchrone."""
+        value = None if bypass else self.get(table, key, version)
+        if value is None:
+            generation = self._generations[table]
+            value = await loader()
+            self._store(table, key, value, version, generation, ttl)
+        return value
+
+    def _store(self, table: str, key: Hashable, value, version: Optional[int], generation: int,
+               ttl: Optional[float]) -> None:
+        if value is not None:
+            with self._lock:
+                if generation == self._generations[table]:
+                    self._caches[table].set(key, (version, value), ttl=ttl)
+
+    def put(self, table: str, key: Hashable, value, version: Optional[int] = None) -> None:
+        self._caches[table].set(key, (version, value))
+
+    def invalidate(self, table: str) -> None:
+        if table not in self._caches:
+            return
+        with self._lock:
+            self._generations[table] += 1
+            self._invalidations[table] += 1
+            self._caches[table].clear()
+
+    def clear(self) -> None:
+        for table in self._caches:
+            self.invalidate(table)
+
+    def stats(self) -> dict:
+        return {
+            table: {**cache.stats(), "invalidations": self._invalidations[table]}
+            for table, cache in self._caches.items()
+        }
+
+
+reference_cache = ReferenceCache(
+    VERSIONED_TABLES, settings.reference_cache_max_size, settings.reference_cache_ttl_seconds
+)
+
+
+# --- Lectures ---
+
+def _read_options(request: Request, table: str) -> dict:
+    """Version de la table lue par `conditional_get`, et aiguillage de `get_read_db` avec une réplique.
+
+    Un client ayant écrit récemment lit la base principale sans passer par le
+    cache ; une ligne lue sur la réplique n'est gardée que le temps de son
+    retard présumé (`READ_YOUR_WRITES_SECONDS`).
+    """
+    options = {"version": table_version(request, table)}
+    if database.ReadSessionLocal is None:
+        return options
+    if database.recent_writers.get(database.client_key(request.headers, request.client)):
+        return {**options, "bypass": True}
+    return {**options, "ttl": settings.read_your_writes_seconds}
+
+
+def remember_version(request: Request, table: str, version: int) -> None:
+    """Noter la version lue par `conditional_get` : les entrées d'une autre version sont ignorées."""
+    if not hasattr(request.state, "table_versions"):
+        request.state.table_versions = {}
+    request.state.table_versions[table] = version
+
+
+def table_version(request: Request, table: str) -> Optional[int]:
+    return getattr(request.state, "table_versions", {}).get(table)
+
+
+def cached_list(table: str, schema, request: Request, response: Response, load: Callable[[], list]) -> list:
+    """Page de liste en cache, indexée par les paramètres de la requête (filtres, tri, pagination).
+
+    Les lignes sont gardées complètes : la sélection de champs s'applique à la sortie.
+    """
+    key = _list_key(request)
+
+    def loader():
+        rows = load()
+        return [_dump(schema, row) for row in rows], response.headers.get(NEXT_CURSOR_HEADER)
+
+    rows, next_cursor = reference_cache.load(table, key, loader, **_read_options(request, table))
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rows
+
+
+def cached_item(table: str, schema, request: Request, item_id: int,
+                load: Callable[[], Optional[object]]) -> Optional[dict]:
+    """Élément en cache par id ; None s'il n'existe pas (les absences ne sont pas mises en cache)."""
+    def loader():
+        row = load()
+        return None if row is None else _dump(schema, row)
+
+    return reference_cache.load(table, ("item", item_id), loader, **_read_options(request, table))
+
+
+async def cached_list_async(table: str, schema, request: Request, response: Response,
+                            load: Callable[[], Awaitable[list]]) -> list:
+    """Équivalent de `cached_list` pour les routeurs asynchrones."""
+    key = _list_key(request)
+
+    async def loader():
+        rows = await load()
+        return [_dump(schema, row) for row in rows], response.headers.get(NEXT_CURSOR_HEADER)
+
+    rows, next_cursor = await reference_cache.load_async(table, key, loader, **_read_options(request, table))
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rows
+
+
+async def cached_item_async(table: str, schema, request: Request, item_id: int,
+                            load: Callable[[], Awaitable[Optional[object]]]) -> Optional[dict]:
+    """Équivalent de `cached_item` pour les routeurs asynchrones."""
+    async def loader():
+        row = await load()
+        return None if row is None else _dump(schema, row)
+
+    return await reference_cache.load_async(table, ("item", item_id), loader, **_read_options(request, table))
+
+
+def _list_key(request: Request) -> tuple:
+    return ("list", tuple(sorted(item for item in request.query_params.multi_items() if item[0] != "fields")))
+
+
+def _dump(schema: BaseModel, row) -> dict:
+    return schema.model_validate(row).model_dump()
+
+
+def warm_up(db: Session) -> int:
+    """Précharger chaque ligne par id et la première page de chaque liste ; renvoie le nombre de lignes."""
+    loaded = 0
+    for table, (model, schema) in REFERENCE_MODELS.items():
+        version = db.query(TableVersion.version).filter(TableVersion.name == table).scalar() or 0
+        for row in db.query(model).order_by(model.id).yield_per(1000):
+            reference_cache.put(table, ("item", row.id), _dump(schema, row), version)
+            loaded += 1
+        response = Response()
+        rows = paginate(db.query(model), response, model.id)
+        reference_cache.put(table, ("list", ()), ([_dump(schema, row) for row in rows],
+                                                  response.headers.get(NEXT_CURSOR_HEADER)), version)
+    return loaded
+
+
+# --- Invalidation entre workers ---
+
+def signal_path(database: Optional[str], table: str) -> Optional[str]:
+    """Fichier signal SQLite d'une table (None pour une base en mémoire)."""
+    if not database or database == ":memory:":
+        return None
+    return f"{database}.{table}.signal"
+
+
+def publish_invalidation(db: Session, tables) -> None:
+    """Prévenir les autres workers, dans la transaction de `bump_version` (avant son commit)."""
+    bind = db.get_bind()
+    if bind.dialect.name == "postgresql":
+        for table in tables:
+            db.execute(_NOTIFY, {"channel": NOTIFY_CHANNEL, "table": table})
+
+
+def signal_invalidation(db: Session, tables) -> None:
+    """Après le commit : vider le cache local et, sous SQLite, toucher les fichiers signal."""
+    bind = db.get_bind()
+    for table in tables:
+        apply_invalidation(table)
+        _touch_signal(bind, table)
+
+
+def broadcast_invalidation(db: Session, *tables: str) -> None:
+    """Invalider les caches de tables sans version (ex. `teachers`) sur tous les workers, après le commit."""
+    publish_invalidation(db, tables)
+    db.commit()
+    signal_invalidation(db, tables)
+
+
+def publish_principal_invalidation(db: Session, username: str) -> None:
+    """Prévenir les autres workers qu'un utilisateur a changé ou a été supprimé (avant le commit)."""
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(_NOTIFY, {"channel": NOTIFY_CHANNEL, "table": f"{PRINCIPALS}:{username}"})
+
+
+def signal_principal_invalidation(db: Session, username: str) -> None:
+    """Après le commit : retirer l'utilisateur du cache local et, sous SQLite, toucher le fichier signal."""
+    invalidate_principal(username)
+    _touch_signal(db.get_bind(), PRINCIPALS)
+
+
+def _touch_signal(bind, name: str) -> None:
+    if bind.dialect.name == "sqlite":
+        path = signal_path(bind.engine.url.database, name)
+        if path is not None:
+            with open(path, "a"):
+                os.utime(path)
+
+
+def apply_invalidation(name: str) -> None:
+    """Appliquer une invalidation : nom de table, `principals:<username>` ou `principals`."""
+    kind, _, username = name.partition(":")
+    if kind != PRINCIPALS:
+        reference_cache.invalidate(name)
+        if name in WORKLOAD_TABLES:
+            invalidate_workloads()
+    elif username:
+        invalidate_principal(username)
+    else:
+        # Fichier signal SQLite : l'utilisateur concerné n'est pas connu
+        principal_cache.clear()
+
+
+class InvalidationListener(threading.Thread):
+    """Thread qui reçoit les invalidations des autres workers."""
+
+    def __init__(self, engine):
+        super().__init__(name="reference-cache-listener", daemon=True)
+        self.engine = engine
+        self.stopping = threading.Event()
+
+    def run(self):
+        if self.engine.dialect.name == "postgresql":
+            self._listen_postgres()
+        else:
+            self._watch_files()
+
+    def stop(self):
+        self.stopping.set()
+
+    def _listen_postgres(self):
+        while not self.stopping.is_set():
+            raw = None
+            try:
+                raw = self.engine.raw_connection()
+                raw.detach()  # connexion dédiée, rendue hors du pool
+                connection = raw.driver_connection
+                connection.autocommit = True
+                connection.cursor().execute(f"LISTEN {NOTIFY_CHANNEL}")
+                # Des notifications ont pu être manquées pendant la (re)connexion
+                reference_cache.clear()
+                principal_cache.clear()
+                invalidate_workloads()
+                while not self.stopping.is_set():
+                    if select.select([connection], [], [], 1.0) == ([], [], []):
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        apply_invalidation(connection.notifies.pop(0).payload)
+            except Exception:
+                logger.exception("Écoute des invalidations interrompue, nouvelle tentative")
+                self.stopping.wait(1.0)
+            finally:
+                if raw is not None:
+                    raw.close()
+
+    def _watch_files(self):
+        names = {*VERSIONED_TABLES, *WORKLOAD_TABLES, PRINCIPALS}
+        paths = {name: signal_path(self.engine.url.database, name) for name in names}
+        seen = {name: _mtime(path) for name, path in paths.items()}
+        while not self.stopping.wait(settings.reference_cache_poll_seconds):
+            for name, path in paths.items():
+                mtime = _mtime(path)
+                if mtime != seen[name]:
+                    seen[name] = mtime
+                    apply_invalidation(name)
+
+
+def _mtime(path: Optional[str]) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns if path else None
+    except FileNotFoundError:
+        return None
+
+
+_listener: Optional[InvalidationListener] = None
+
+
+def start_reference_cache(engine, session_factory) -> None:
+    """Démarrer l'écoute des invalidations puis préchauffer le cache (au démarrage du worker).
+
+    L'écoute sert aussi aux caches des utilisateurs authentifiés (`app.auth`)
+    et des charges horaires (`app.workload`).
+    """
+    global _listener
+    caching = (settings.reference_cache_ttl_seconds > 0 or settings.auth_cache_ttl_seconds > 0
+               or settings.workload_cache_ttl_seconds > 0)
+    listening = engine.dialect.name == "postgresql" or signal_path(engine.url.database, PRINCIPALS)
+    if caching and settings.cache_invalidation_listener and listening:
+        _listener = InvalidationListener(engine)
+        _listener.start()
+    if settings.reference_cache_ttl_seconds > 0 and settings.reference_cache_warm_up:
+        try:
+            with session_factory() as db:
+                logger.info("Cache de référence préchauffé : %d lignes", warm_up(db))
+        except SQLAlchemyError:
+            logger.warning("Préchauffage du cache de référence impossible", exc_info=True)
+
+
+def stop_reference_cache() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener.join(timeout=5)
+        _listener = None
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+from .. import database
+from ..models.user import User
+from ..pool_metrics import pool_metrics, read_pool_metrics
+from ..reference_cache import reference_cache
+from ..workload import workload_cache
+from ..auth import get_current_admin_user
+
+router = APIRouter()
+
+
+@router.get("/pool")
+def read_pool_stats(current_user: User = Depends(get_current_admin_user)):
+    """Statistiques du pool de connexions à la base principale et, sous `replica`, à la réplique."""
+    stats = pool_metrics.snapshot(database.engine.pool)
+    if database.read_engine is not None:
+        stats["replica"] = read_pool_metrics.snapshot(database.read_engine.pool)
+    return stats
+
+
+@router.get("/cache")
+def read_cache_stats(current_user: User = Depends(get_current_admin_user)):
+    """Compteurs (taille, succès, échecs, invalidations) des caches locaux du worker."""
+    return {"reference": reference_cache.stats(), "workload": workload_cache.stats()}
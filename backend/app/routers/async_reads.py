@@ -0,0 +1,141 @@
+"""
+Versions asynchrones (AsyncSession) des endpoints de lecture et de connexion.
+
+Activées par `DB_ASYNC_MODE=true` : ces routeurs sont inclus avant les routeurs
+synchrones, qui continuent de servir les écritures. Comme en mode synchrone,
+les lectures vont à la réplique (`get_async_read_db`) si elle est configurée,
+la connexion et l'authentification à la base principale. Les identifiants utilisent
+le convertisseur `:int` pour laisser passer les routes comme `/users/me`.
+"""
+
+from datetime import timedelta
+from typing import List, Optional, Type
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.security import OAuth2PasswordRequestForm
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_async_db, get_async_read_db
+from ..models.classe import Classe
+from ..models.student import Student
+from ..models.subject import Subject
+from ..models.teacher import Teacher
+from ..models.user import User
+from ..schemas.classe import ClasseResponse
+from ..schemas.student import StudentResponse
+from ..schemas.subject import SubjectResponse
+from ..schemas.teacher import TeacherResponse
+from ..schemas.user import Token, UserResponse
+from .. import fieldsets, filters
+from ..fieldsets import FieldSet
+from ..filters import SortOrder
+from ..pagination import paginate_async
+from ..serialization import item_response, list_response
+from ..reference_cache import cached_item_async, cached_list_async
+from ..table_versions import conditional_get_async
+from ..auth import authenticate_user_async, create_access_token, get_current_active_user_async
+from ..config import settings
+
+
+def read_router(model, response_schema: Type[BaseModel], not_found: str, filters, sort, fields,
+                versioned: bool = False) -> APIRouter:
+    """Construire le routeur de lecture (liste + détail) d'une entité, avec ses filtres, son tri et sa sélection de champs.
+
+    `versioned` : réponses avec ETag et 304 (tables de `VERSIONED_TABLES`), servies
+    par le cache de référence.
+    """
+    router = APIRouter()
+    table = model.__tablename__
+    dependencies = [Depends(conditional_get_async(table))] if versioned else []
+
+    @router.get("/", response_model=List[response_schema], dependencies=dependencies)
+    async def read_items(
+        request: Request,
+        response: Response,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        conditions: list = Depends(filters),
+        order: SortOrder = Depends(sort),
+        selection: FieldSet = Depends(fields),
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user: User = Depends(get_current_active_user_async)
+    ):
+        """Lister les éléments (filtres, tri, sélection de champs, pagination par décalage ou par curseur)."""
+        # Tables versionnées : lignes complètes en cache, la sélection s'applique à la sortie
+        options = [] if versioned else selection.load_options(order.column)
+
+        def load():
+            return paginate_async(
+                db, select(model).options(*options).where(*conditions), response, model.id, skip=skip, limit=limit,
+                cursor=cursor, sort_column=order.column, descending=order.descending,
+            )
+
+        if versioned:
+            rows = await cached_list_async(table, response_schema, request, response, load)
+        else:
+            rows = await load()
+        return list_response(response_schema, rows, response, selection)
+
+    @router.get("/{item_id:int}", response_model=response_schema, dependencies=dependencies)
+    async def read_item(
+        request: Request,
+        response: Response,
+        item_id: int,
+        selection: FieldSet = Depends(fields),
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user: User = Depends(get_current_active_user_async)
+    ):
+        """Obtenir un élément par son ID."""
+        if versioned:
+            item = await cached_item_async(table, response_schema, request, item_id, lambda: db.get(model, item_id))
+        else:
+            item = await db.get(model, item_id, options=selection.load_options())
+        if item is None:
+            raise HTTPException(status_code=404, detail=not_found)
+        return item_response(response_schema, item, response, selection)
+
+    return router
+
+
+users_router = APIRouter()
+
+
+@users_router.get("/me", response_model=UserResponse)
+async def read_users_me(current_user: User = Depends(get_current_active_user_async)):
+    """Obtenir les informations de l'utilisateur connecté."""
+    return current_user
+
+
+users_router.include_router(read_router(User, UserResponse, "Utilisateur non trouvé", filters.user_filters, filters.user_sort,
+                                       fieldsets.user_fields))
+students_router = read_router(Student, StudentResponse, "Étudiant non trouvé", filters.student_filters, filters.student_sort,
+                              fieldsets.student_fields)
+teachers_router = read_router(Teacher, TeacherResponse, "Enseignant non trouvé", filters.teacher_filters, filters.teacher_sort,
+                              fieldsets.teacher_fields)
+classes_router = read_router(Classe, ClasseResponse, "Classe non trouvée", filters.classe_filters, filters.classe_sort,
+                             fieldsets.classe_fields, versioned=True)
+subjects_router = read_router(Subject, SubjectResponse, "Matière non trouvée", filters.subject_filters, filters.subject_sort,
+                              fieldsets.subject_fields, versioned=True)
+
+auth_router = APIRouter()
+
+
+@auth_router.post("/login", response_model=Token)
+async def login_for_access_token(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Connexion utilisateur et génération du token d'accès."""
+    user = await authenticate_user_async(db, form_data.username, form_data.password)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Nom d'utilisateur ou mot de passe incorrect",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
+    access_token = create_access_token(
+        data={"sub": user.username}, expires_delta=access_token_expires
+    )
+    return {"access_token": access_token, "token_type": "bearer"}
@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from ..database import get_db
-from ..auth import authenticate_user, create_access_token
+from ..auth import authenticate_user, create_access_token, run_in_auth_executor
 from ..schemas.user import Token
 from ..config import settings
 
@@ -16,7 +16,8 @@ async def login_for_access_token(
     db: Session = Depends(get_db)
 ):
     """Connexion utilisateur et génération du token d'accès."""
-    user = authenticate_user(db, form_data.username, form_data.password)
+    # bcrypt et la requête SQL tournent hors de la boucle d'événements
+    user = await run_in_auth_executor(authenticate_user, db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
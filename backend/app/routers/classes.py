@@ -1,10 +1,20 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from ..database import get_db
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session, selectinload
+from ..database import get_db, get_read_db
 from ..models.classe import Classe
+from ..models.enrollment import Enrollment
+from ..models.student import Student
 from ..models.user import User
-from ..schemas.classe import ClasseCreate, ClasseUpdate, ClasseResponse
+from ..schemas.classe import ClasseCreate, ClasseUpdate, ClasseResponse, ClasseRoster, RosterEntry
+from ..schemas.bulk import BulkResponse
+from ..bulk import check_batch_size, check_unique, existing_values, insert_valid
+from ..filters import SortOrder, classe_filters, classe_sort
+from ..pagination import paginate
+from ..fieldsets import FieldSet, classe_fields
+from ..serialization import item_response, list_response
+from ..reference_cache import cached_item, cached_list
+from ..table_versions import bump_version, conditional_get
 from ..auth import get_current_active_user
 
 router = APIRouter()
@@ -29,33 +39,109 @@ def create_classe(
     db_classe = Classe(**classe.dict())
     db.add(db_classe)
     db.commit()
+    bump_version(db, "classes")
     db.refresh(db_classe)
     return db_classe
 
 
+@router.post("/bulk", response_model=BulkResponse)
+def create_classes_bulk(
+    classes: List[ClasseCreate],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Créer plusieurs classes en une seule requête."""
+    check_batch_size(classes)
+    errors = {}
+    check_unique(classes, lambda c: c.name,
+                 existing_values(db, Classe.name, {c.name for c in classes}),
+                 "Une classe avec ce nom existe déjà", errors)
+    result = insert_valid(db, Classe, classes, errors)
+    if result.created:
+        bump_version(db, "classes")
+    return result
+
+
 @router.get("/", response_model=List[ClasseResponse])
 def read_classes(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    cursor: Optional[str] = None,
+    conditions: list = Depends(classe_filters),
+    order: SortOrder = Depends(classe_sort),
+    fields: FieldSet = Depends(classe_fields),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+    not_modified: None = Depends(conditional_get("classes"))
 ):
-    """Lister toutes les classes."""
-    classes = db.query(Classe).offset(skip).limit(limit).all()
-    return classes
+    """Lister toutes les classes (filtres, tri, sélection de champs, pagination par décalage ou par curseur)."""
+    rows = cached_list("classes", ClasseResponse, request, response, lambda: paginate(
+        db.query(Classe).filter(*conditions), response, Classe.id, skip=skip, limit=limit, cursor=cursor,
+        sort_column=order.column, descending=order.descending,
+    ))
+    return list_response(ClasseResponse, rows, response, fields)
 
 
 @router.get("/{classe_id}", response_model=ClasseResponse)
 def read_classe(
+    request: Request,
+    response: Response,
     classe_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    fields: FieldSet = Depends(classe_fields),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+    not_modified: None = Depends(conditional_get("classes"))
 ):
     """Obtenir une classe par son ID."""
-    classe = db.query(Classe).filter(Classe.id == classe_id).first()
+    classe = cached_item(
+        "classes", ClasseResponse, request, classe_id, lambda: db.query(Classe).filter(Classe.id == classe_id).first()
+    )
     if classe is None:
         raise HTTPException(status_code=404, detail="Classe non trouvée")
-    return classe
+    return item_response(ClasseResponse, classe, response, fields)
+
+
+@router.get("/{classe_id}/roster", response_model=ClasseRoster)
+def read_classe_roster(
+    classe_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Obtenir la liste des élèves inscrits dans une classe."""
+    # Deux requêtes quel que soit l'effectif : la classe, puis ses inscriptions
+    # avec l'élève et son utilisateur en jointure
+    classe = (
+        db.query(Classe)
+        .options(selectinload(Classe.enrollments).joinedload(Enrollment.student).joinedload(Student.user))
+        .filter(Classe.id == classe_id)
+        .first()
+    )
+    if classe is None:
+        raise HTTPException(status_code=404, detail="Classe non trouvée")
+
+    students = [
+        RosterEntry(
+            enrollment_id=enrollment.id,
+            student_id=enrollment.student.id,
+            student_number=enrollment.student.student_number,
+            first_name=enrollment.student.user.first_name,
+            last_name=enrollment.student.user.last_name,
+            status=enrollment.status,
+            enrollment_date=enrollment.enrollment_date,
+        )
+        for enrollment in classe.enrollments
+    ]
+    students.sort(key=lambda entry: (entry.last_name, entry.first_name, entry.student_id))
+    return ClasseRoster(
+        id=classe.id,
+        name=classe.name,
+        level=classe.level,
+        academic_year=classe.academic_year,
+        max_students=classe.max_students,
+        students=students,
+    )
 
 
 @router.put("/{classe_id}", response_model=ClasseResponse)
@@ -75,6 +161,7 @@ def update_classe(
         setattr(db_classe, field, value)
     
     db.commit()
+    bump_version(db, "classes")
     db.refresh(db_classe)
     return db_classe
 
@@ -92,4 +179,5 @@ def delete_classe(
     
     db.delete(db_classe)
     db.commit()
+    bump_version(db, "classes")
     return {"message": "Classe supprimée avec succès"}
@@ -0,0 +1,173 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..database import get_db, get_read_db
+from ..models.classe import Classe
+from ..models.enrollment import Enrollment, EnrollmentStatus
+from ..models.student import Student
+from ..models.user import User
+from ..schemas.enrollment import EnrollmentCreate, EnrollmentUpdate, EnrollmentResponse
+from ..enrollment_counters import claim_seat, release_seat
+from ..filters import SortOrder, enrollment_filters, enrollment_sort
+from ..pagination import paginate
+from ..fieldsets import FieldSet, enrollment_fields
+from ..serialization import item_response, list_response
+from ..table_versions import bump_version
+from ..auth import get_current_active_user
+
+router = APIRouter()
+
+CLASSE_FULL = "Classe complète"
+ALREADY_ENROLLED = "Cet étudiant est déjà inscrit dans cette classe"
+
+
+def _already_enrolled(db: Session) -> HTTPException:
+    """Inscription active en double refusée par l'index unique (requête concurrente) : tout est annulé."""
+    db.rollback()
+    return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=ALREADY_ENROLLED)
+
+
+def enroll_student(db: Session, enrollment: EnrollmentCreate) -> Enrollment:
+    """Inscrire un étudiant sans jamais dépasser la capacité de la classe.
+
+    La place est réservée par un UPDATE conditionnel du compteur de la classe
+    (`claim_seat`), qui ne verrouille que la ligne de cette classe; l'inscription
+    est insérée dans la même transaction. En cas d'erreur, rien n'est validé.
+    La vérification préalable des doublons ne voit pas une inscription
+    concurrente : l'index unique partiel sur les inscriptions actives la
+    refuse alors (409).
+    """
+    if db.query(Student.id).filter(Student.id == enrollment.student_id).first() is None:
+        raise HTTPException(status_code=404, detail="Étudiant non trouvé")
+    if db.query(Classe.id).filter(Classe.id == enrollment.classe_id).first() is None:
+        raise HTTPException(status_code=404, detail="Classe non trouvée")
+
+    if enrollment.status == EnrollmentStatus.ACTIVE:
+        already_enrolled = db.query(Enrollment.id).filter(
+            Enrollment.student_id == enrollment.student_id,
+            Enrollment.classe_id == enrollment.classe_id,
+            Enrollment.status == EnrollmentStatus.ACTIVE,
+        ).first()
+        if already_enrolled:
+            raise HTTPException(status_code=400, detail=ALREADY_ENROLLED)
+        if not claim_seat(db, enrollment.classe_id):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=CLASSE_FULL)
+
+    db_enrollment = Enrollment(**enrollment.dict())
+    db.add(db_enrollment)
+    try:
+        db.commit()
+    except IntegrityError:
+        raise _already_enrolled(db)
+    if enrollment.status == EnrollmentStatus.ACTIVE:
+        bump_version(db, "classes")
+    db.refresh(db_enrollment)
+    return db_enrollment
+
+
+def get_enrollment_or_404(enrollment_id: int, db: Session = Depends(get_db)) -> Enrollment:
+    enrollment = db.query(Enrollment).filter(Enrollment.id == enrollment_id).first()
+    if not enrollment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inscription non trouvée")
+    return enrollment
+
+
+@router.post("/", response_model=EnrollmentResponse, status_code=status.HTTP_201_CREATED)
+def create_enrollment(
+    enrollment: EnrollmentCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Inscrire un étudiant dans une classe (409 si la classe est complète)."""
+    return enroll_student(db, enrollment)
+
+
+@router.get("/", response_model=List[EnrollmentResponse])
+def read_enrollments(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    conditions: list = Depends(enrollment_filters),
+    order: SortOrder = Depends(enrollment_sort),
+    fields: FieldSet = Depends(enrollment_fields),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Lister toutes les inscriptions (filtres, tri, sélection de champs, pagination par décalage ou par curseur)."""
+    enrollments = paginate(
+        db.query(Enrollment).options(*fields.load_options(order.column)).filter(*conditions),
+        response, Enrollment.id, skip=skip, limit=limit, cursor=cursor,
+        sort_column=order.column, descending=order.descending,
+    )
+    return list_response(EnrollmentResponse, enrollments, response, fields)
+
+
+@router.get("/{enrollment_id}", response_model=EnrollmentResponse)
+def read_enrollment(
+    enrollment_id: int,
+    response: Response,
+    fields: FieldSet = Depends(enrollment_fields),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Obtenir une inscription par son ID."""
+    enrollment = db.query(Enrollment).options(*fields.load_options()).filter(Enrollment.id == enrollment_id).first()
+    if not enrollment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inscription non trouvée")
+    return item_response(EnrollmentResponse, enrollment, response, fields)
+
+
+@router.put("/{enrollment_id}", response_model=EnrollmentResponse)
+def update_enrollment(
+    enrollment_update: EnrollmentUpdate,
+    enrollment: Enrollment = Depends(get_enrollment_or_404),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Changer le statut d'une inscription (réactiver une inscription consomme une place)."""
+    was_active = enrollment.status == EnrollmentStatus.ACTIVE
+    becomes_active = enrollment_update.status == EnrollmentStatus.ACTIVE
+    if becomes_active and not was_active and not claim_seat(db, enrollment.classe_id):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=CLASSE_FULL)
+    if was_active and not becomes_active:
+        release_seat(db, enrollment.classe_id)
+
+    # Le changement n'est appliqué que si le statut n'a pas bougé entre-temps,
+    # sinon le compteur serait ajusté deux fois
+    try:
+        result = db.execute(
+            update(Enrollment)
+            .where(Enrollment.id == enrollment.id, Enrollment.status == enrollment.status)
+            .values(status=enrollment_update.status)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Inscription modifiée simultanément")
+        db.commit()
+    except IntegrityError:
+        # Réactivation alors qu'une autre inscription de l'étudiant est active dans la classe
+        raise _already_enrolled(db)
+    if was_active != becomes_active:
+        bump_version(db, "classes")
+    db.refresh(enrollment)
+    return enrollment
+
+
+@router.delete("/{enrollment_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_enrollment(
+    enrollment: Enrollment = Depends(get_enrollment_or_404),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Supprimer une inscription."""
+    was_active = enrollment.status == EnrollmentStatus.ACTIVE
+    if was_active:
+        release_seat(db, enrollment.classe_id)
+    db.delete(enrollment)
+    db.commit()
+    if was_active:
+        bump_version(db, "classes")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
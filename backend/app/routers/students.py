@@ -1,10 +1,18 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Response # Added Response
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Response # Added Response
 from sqlalchemy.orm import Session
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..models.student import Student
 from ..models.user import User
 from ..schemas.student import StudentCreate, StudentUpdate, StudentResponse
+from ..schemas.bulk import BulkResponse
+from ..bulk import check_batch_size, check_exists, check_unique, existing_values, insert_valid
+from ..export import export_rows
+from ..filters import SortOrder, student_filters, student_sort
+from ..pagination import paginate
+from ..fieldsets import FieldSet, student_fields
+from ..serialization import item_response, list_response
+from .. import search
 from ..auth import get_current_active_user
 
 router = APIRouter()
@@ -16,6 +24,15 @@ def get_student_or_404(student_id: int, db: Session = Depends(get_db)) -> Studen
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Étudiant non trouvé")
     return student
 
+def read_student_or_404(
+    student_id: int, db: Session = Depends(get_read_db), fields: FieldSet = Depends(student_fields)
+) -> Student:
+    # Variante en lecture seule (réplique si configurée), limitée aux colonnes demandées
+    student = db.query(Student).options(*fields.load_options()).filter(Student.id == student_id).first()
+    if not student:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Étudiant non trouvé")
+    return student
+
 @router.post("/", response_model=StudentResponse, status_code=status.HTTP_201_CREATED)
 def create_student(
     student: StudentCreate,
@@ -44,27 +61,84 @@ def create_student(
     return db_student
 
 
+@router.post("/bulk", response_model=BulkResponse)
+def create_students_bulk(
+    students: List[StudentCreate],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Créer plusieurs profils étudiants en une seule requête."""
+    check_batch_size(students)
+    errors = {}
+
+    # Une requête par contrainte pour tout le lot
+    user_ids = {s.user_id for s in students}
+    check_exists(students, lambda s: s.user_id, existing_values(db, User.id, user_ids),
+                 "Utilisateur non trouvé", errors)
+    check_unique(students, lambda s: s.user_id, existing_values(db, Student.user_id, user_ids),
+                 "Cet utilisateur a déjà un profil étudiant", errors)
+    check_unique(students, lambda s: s.student_number,
+                 existing_values(db, Student.student_number, {s.student_number for s in students}),
+                 "Un étudiant avec ce numéro existe déjà", errors)
+
+    return insert_valid(db, Student, students, errors)
+
+
 @router.get("/", response_model=List[StudentResponse])
 def read_students(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    conditions: list = Depends(student_filters),
+    order: SortOrder = Depends(student_sort),
+    fields: FieldSet = Depends(student_fields),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Lister tous les étudiants (filtres, tri, sélection de champs, pagination par décalage ou par curseur)."""
+    students = paginate(
+        db.query(Student).options(*fields.load_options(order.column)).filter(*conditions),
+        response, Student.id, skip=skip, limit=limit, cursor=cursor,
+        sort_column=order.column, descending=order.descending,
+    )
+    return list_response(StudentResponse, students, response, fields)
+
+
+@router.get("/export")
+def export_students(
+    format: Literal["csv", "ndjson"] = "csv",
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Lister tous les étudiants."""
-    students = db.query(Student).offset(skip).limit(limit).all()
-    return students
+    """Exporter la liste complète des étudiants en flux CSV ou NDJSON."""
+    return export_rows(db, Student, StudentResponse, format, "students")
+
+
+@router.get("/search", response_model=List[StudentResponse])
+def search_students(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=100),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Rechercher des étudiants (insensible aux accents, les plus pertinents d'abord)."""
+    return list_response(StudentResponse, search.search_students(db, q, skip=skip, limit=limit), response)
 
 
 @router.get("/{student_id}", response_model=StudentResponse)
 def read_student(
-    student: Student = Depends(get_student_or_404),
+    response: Response,
+    student: Student = Depends(read_student_or_404),
+    fields: FieldSet = Depends(student_fields),
     current_user: User = Depends(get_current_active_user) # Keep for auth, db is in get_student_or_404
 ):
     """Obtenir un étudiant par son ID."""
     # student_id is implicitly handled by Depends(get_student_or_404)
     # db session is also handled by the dependency
-    return student
+    return item_response(StudentResponse, student, response, fields)
 
 
 @router.put("/{student_id}", response_model=StudentResponse)
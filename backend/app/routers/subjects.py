@@ -1,10 +1,20 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
-from ..database import get_db
+from ..database import get_db, get_read_db
+from ..models.classe import Classe
 from ..models.subject import Subject
+from ..models.teacher import Teacher
 from ..models.user import User
 from ..schemas.subject import SubjectCreate, SubjectUpdate, SubjectResponse
+from ..schemas.bulk import BulkResponse
+from ..bulk import check_batch_size, check_exists, check_unique, existing_values, insert_valid
+from ..filters import SortOrder, subject_filters, subject_sort
+from ..pagination import paginate
+from ..fieldsets import FieldSet, subject_fields
+from ..serialization import item_response, list_response
+from ..reference_cache import cached_item, cached_list
+from ..table_versions import bump_version, conditional_get
 from ..auth import get_current_active_user
 
 router = APIRouter()
@@ -29,33 +39,74 @@ def create_subject(
     db_subject = Subject(**subject.dict())
     db.add(db_subject)
     db.commit()
+    bump_version(db, "subjects")
     db.refresh(db_subject)
     return db_subject
 
 
+@router.post("/bulk", response_model=BulkResponse)
+def create_subjects_bulk(
+    subjects: List[SubjectCreate],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Créer plusieurs matières en une seule requête."""
+    check_batch_size(subjects)
+    errors = {}
+
+    # Une requête par contrainte pour tout le lot
+    check_exists(subjects, lambda s: s.classe_id, existing_values(db, Classe.id, {s.classe_id for s in subjects}),
+                 "Classe non trouvée", errors)
+    check_exists(subjects, lambda s: s.teacher_id, existing_values(db, Teacher.id, {s.teacher_id for s in subjects}),
+                 "Enseignant non trouvé", errors)
+    check_unique(subjects, lambda s: s.code,
+                 existing_values(db, Subject.code, {s.code for s in subjects}),
+                 "Une matière avec ce code existe déjà", errors)
+    result = insert_valid(db, Subject, subjects, errors)
+    if result.created:
+        bump_version(db, "subjects")
+    return result
+
+
 @router.get("/", response_model=List[SubjectResponse])
 def read_subjects(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    cursor: Optional[str] = None,
+    conditions: list = Depends(subject_filters),
+    order: SortOrder = Depends(subject_sort),
+    fields: FieldSet = Depends(subject_fields),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+    not_modified: None = Depends(conditional_get("subjects"))
 ):
-    """Lister toutes les matières."""
-    subjects = db.query(Subject).offset(skip).limit(limit).all()
-    return subjects
+    """Lister toutes les matières (filtres, tri, sélection de champs, pagination par décalage ou par curseur)."""
+    rows = cached_list("subjects", SubjectResponse, request, response, lambda: paginate(
+        db.query(Subject).filter(*conditions), response, Subject.id, skip=skip, limit=limit, cursor=cursor,
+        sort_column=order.column, descending=order.descending,
+    ))
+    return list_response(SubjectResponse, rows, response, fields)
 
 
 @router.get("/{subject_id}", response_model=SubjectResponse)
 def read_subject(
+    request: Request,
+    response: Response,
     subject_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    fields: FieldSet = Depends(subject_fields),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+    not_modified: None = Depends(conditional_get("subjects"))
 ):
     """Obtenir une matière par son ID."""
-    subject = db.query(Subject).filter(Subject.id == subject_id).first()
+    subject = cached_item(
+        "subjects", SubjectResponse, request, subject_id, lambda: db.query(Subject).filter(Subject.id == subject_id).first()
+    )
     if subject is None:
         raise HTTPException(status_code=404, detail="Matière non trouvée")
-    return subject
+    return item_response(SubjectResponse, subject, response, fields)
 
 
 @router.put("/{subject_id}", response_model=SubjectResponse)
@@ -75,6 +126,7 @@ def update_subject(
         setattr(db_subject, field, value)
     
     db.commit()
+    bump_version(db, "subjects")
     db.refresh(db_subject)
     return db_subject
 
@@ -92,4 +144,5 @@ def delete_subject(
     
     db.delete(db_subject)
     db.commit()
+    bump_version(db, "subjects")
     return {"message": "Matière supprimée avec succès"}
@@ -1,10 +1,19 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..models.teacher import Teacher
 from ..models.user import User
-from ..schemas.teacher import TeacherCreate, TeacherUpdate, TeacherResponse
+from ..schemas.teacher import TeacherCreate, TeacherUpdate, TeacherResponse, TeacherWorkload
+from ..schemas.bulk import BulkResponse
+from ..bulk import check_batch_size, check_exists, check_unique, existing_values, insert_valid
+from ..export import export_rows
+from ..filters import SortOrder, teacher_filters, teacher_sort
+from ..pagination import paginate
+from ..fieldsets import FieldSet, teacher_fields
+from ..serialization import item_response, list_response
+from ..reference_cache import broadcast_invalidation
+from ..workload import get_workload, get_workloads
 from ..auth import get_current_active_user
 
 router = APIRouter()
@@ -34,33 +43,107 @@ def create_teacher(
     db_teacher = Teacher(**teacher.dict())
     db.add(db_teacher)
     db.commit()
+    broadcast_invalidation(db, "teachers")
     db.refresh(db_teacher)
     return db_teacher
 
 
+@router.post("/bulk", response_model=BulkResponse)
+def create_teachers_bulk(
+    teachers: List[TeacherCreate],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Créer plusieurs profils enseignants en une seule requête."""
+    check_batch_size(teachers)
+    errors = {}
+
+    # Une requête par contrainte pour tout le lot
+    user_ids = {t.user_id for t in teachers}
+    check_exists(teachers, lambda t: t.user_id, existing_values(db, User.id, user_ids),
+                 "Utilisateur non trouvé", errors)
+    check_unique(teachers, lambda t: t.user_id, existing_values(db, Teacher.user_id, user_ids),
+                 "Cet utilisateur a déjà un profil enseignant", errors)
+    check_unique(teachers, lambda t: t.employee_number,
+                 existing_values(db, Teacher.employee_number, {t.employee_number for t in teachers}),
+                 "Un enseignant avec ce numéro d'employé existe déjà", errors)
+
+    result = insert_valid(db, Teacher, teachers, errors)
+    if result.created:
+        broadcast_invalidation(db, "teachers")
+    return result
+
+
 @router.get("/", response_model=List[TeacherResponse])
 def read_teachers(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    conditions: list = Depends(teacher_filters),
+    order: SortOrder = Depends(teacher_sort),
+    fields: FieldSet = Depends(teacher_fields),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Lister tous les enseignants (filtres, tri, sélection de champs, pagination par décalage ou par curseur)."""
+    teachers = paginate(
+        db.query(Teacher).options(*fields.load_options(order.column)).filter(*conditions),
+        response, Teacher.id, skip=skip, limit=limit, cursor=cursor,
+        sort_column=order.column, descending=order.descending,
+    )
+    return list_response(TeacherResponse, teachers, response, fields)
+
+
+@router.get("/export")
+def export_teachers(
+    format: Literal["csv", "ndjson"] = "csv",
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Exporter la liste complète des enseignants en flux CSV ou NDJSON."""
+    return export_rows(db, Teacher, TeacherResponse, format, "teachers")
+
+
+@router.get("/workload", response_model=List[TeacherWorkload])
+def read_teachers_workload(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Charge hebdomadaire de tous les enseignants (heures, matières, classes).
+
+    Calculée sur la base principale : le résultat est mis en cache pour tous
+    les clients, une réplique en retard y laisserait des charges périmées.
+    """
+    return list(get_workloads(db).values())
+
+
+@router.get("/{teacher_id}/workload", response_model=TeacherWorkload)
+def read_teacher_workload(
+    teacher_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Lister tous les enseignants."""
-    teachers = db.query(Teacher).offset(skip).limit(limit).all()
-    return teachers
+    """Charge hebdomadaire d'un enseignant (base principale, comme `read_teachers_workload`)."""
+    workload = get_workload(db, teacher_id)
+    if workload is None:
+        raise HTTPException(status_code=404, detail="Enseignant non trouvé")
+    return workload
 
 
 @router.get("/{teacher_id}", response_model=TeacherResponse)
 def read_teacher(
     teacher_id: int,
-    db: Session = Depends(get_db),
+    response: Response,
+    fields: FieldSet = Depends(teacher_fields),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Obtenir un enseignant par son ID."""
-    teacher = db.query(Teacher).filter(Teacher.id == teacher_id).first()
+    teacher = db.query(Teacher).options(*fields.load_options()).filter(Teacher.id == teacher_id).first()
     if teacher is None:
         raise HTTPException(status_code=404, detail="Enseignant non trouvé")
-    return teacher
+    return item_response(TeacherResponse, teacher, response, fields)
 
 
 @router.put("/{teacher_id}", response_model=TeacherResponse)
@@ -97,4 +180,5 @@ def delete_teacher(
     
     db.delete(db_teacher)
     db.commit()
+    broadcast_invalidation(db, "teachers")
     return {"message": "Enseignant supprimé avec succès"}
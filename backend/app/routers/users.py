@@ -1,10 +1,19 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..models.user import User
-from ..schemas.user import UserCreate, UserUpdate, UserResponse
+from ..schemas.user import UserCreate, UserUpdate, UserResponse, UserBulkResponse
+from ..bulk import check_batch_size, check_unique, existing_values, insert_valid
+from ..hashing import hash_passwords
+from ..export import export_rows
+from ..filters import SortOrder, user_filters, user_sort
+from ..pagination import paginate
+from ..fieldsets import FieldSet, user_fields
+from ..serialization import item_response, list_response
+from .. import search
 from ..auth import get_current_active_user, get_password_hash
+from ..reference_cache import publish_principal_invalidation, signal_principal_invalidation
 
 router = APIRouter()
 
@@ -46,16 +55,80 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
     return db_user
 
 
+@router.post("/bulk", response_model=UserBulkResponse)
+def create_users_bulk(
+    users: List[UserCreate],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Importer plusieurs utilisateurs (hachage des mots de passe en parallèle)."""
+    check_batch_size(users)
+    errors = {}
+    check_unique(users, lambda u: u.email,
+                 existing_values(db, User.email, {u.email for u in users}),
+                 "Un utilisateur avec cet email existe déjà", errors)
+    check_unique(users, lambda u: u.username,
+                 existing_values(db, User.username, {u.username for u in users}),
+                 "Un utilisateur avec ce nom d'utilisateur existe déjà", errors)
+
+    # Hacher les mots de passe des éléments valides sur tous les cœurs
+    valid = [index for index in range(len(users)) if index not in errors]
+    hashes, elapsed = hash_passwords([users[index].password for index in valid])
+    rows = {}
+    for index, hashed_password in zip(valid, hashes):
+        row = users[index].dict(exclude={"password"})
+        row["hashed_password"] = hashed_password
+        rows[index] = row
+
+    return insert_valid(
+        db, User, users, errors, rows=rows, response_class=UserBulkResponse,
+        hashing_seconds=round(elapsed, 3),
+        hashes_per_second=round(len(hashes) / elapsed, 1) if elapsed > 0 else 0.0,
+    )
+
+
 @router.get("/", response_model=List[UserResponse])
 def read_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    conditions: list = Depends(user_filters),
+    order: SortOrder = Depends(user_sort),
+    fields: FieldSet = Depends(user_fields),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Lister tous les utilisateurs."""
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    """Lister tous les utilisateurs (filtres, tri, sélection de champs, pagination par décalage ou par curseur)."""
+    users = paginate(
+        db.query(User).options(*fields.load_options(order.column)).filter(*conditions),
+        response, User.id, skip=skip, limit=limit, cursor=cursor,
+        sort_column=order.column, descending=order.descending,
+    )
+    return list_response(UserResponse, users, response, fields)
+
+
+@router.get("/export")
+def export_users(
+    format: Literal["csv", "ndjson"] = "csv",
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Exporter la liste complète des utilisateurs en flux CSV ou NDJSON."""
+    return export_rows(db, User, UserResponse, format, "users")
+
+
+@router.get("/search", response_model=List[UserResponse])
+def search_users(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=100),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Rechercher des utilisateurs (insensible aux accents, les plus pertinents d'abord)."""
+    return list_response(UserResponse, search.search_users(db, q, skip=skip, limit=limit), response)
 
 
 @router.get("/me", response_model=UserResponse)
@@ -67,14 +140,16 @@ def read_users_me(current_user: User = Depends(get_current_active_user)):
 @router.get("/{user_id}", response_model=UserResponse)
 def read_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    response: Response,
+    fields: FieldSet = Depends(user_fields),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Obtenir un utilisateur par son ID."""
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = db.query(User).options(*fields.load_options()).filter(User.id == user_id).first()
     if db_user is None:
         raise HTTPException(status_code=404, detail="Utilisateur non trouvé")
-    return db_user
+    return item_response(UserResponse, db_user, response, fields)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -90,10 +165,14 @@ def update_user(
         raise HTTPException(status_code=404, detail="Utilisateur non trouvé")
     
     # Mettre à jour les champs fournis
+    previous_username = db_user.username
     for field, value in user_update.dict(exclude_unset=True).items():
         setattr(db_user, field, value)
     
+    # Retirer l'utilisateur du cache d'authentification de tous les workers
+    publish_principal_invalidation(db, previous_username)
     db.commit()
+    signal_principal_invalidation(db, previous_username)
     db.refresh(db_user)
     return db_user
 
@@ -110,5 +189,7 @@ def delete_user(
         raise HTTPException(status_code=404, detail="Utilisateur non trouvé")
     
     db.delete(db_user)
+    publish_principal_invalidation(db, db_user.username)
     db.commit()
+    signal_principal_invalidation(db, db_user.username)
     return {"message": "Utilisateur supprimé avec succès"}
@@ -1,13 +1,17 @@
 from .user import UserCreate, UserUpdate, UserResponse, UserLogin, Token
 from .student import StudentCreate, StudentUpdate, StudentResponse
-from .teacher import TeacherCreate, TeacherUpdate, TeacherResponse
-from .classe import ClasseCreate, ClasseUpdate, ClasseResponse
+from .teacher import TeacherCreate, TeacherUpdate, TeacherResponse, TeacherWorkload
+from .classe import ClasseCreate, ClasseUpdate, ClasseResponse, ClasseRoster, RosterEntry
 from .subject import SubjectCreate, SubjectUpdate, SubjectResponse
+from .enrollment import EnrollmentCreate, EnrollmentUpdate, EnrollmentResponse
+from .bulk import BulkItemResult, BulkResponse
 
 __all__ = [
     "UserCreate", "UserUpdate", "UserResponse", "UserLogin", "Token",
     "StudentCreate", "StudentUpdate", "StudentResponse",
-    "TeacherCreate", "TeacherUpdate", "TeacherResponse",
-    "ClasseCreate", "ClasseUpdate", "ClasseResponse",
-    "SubjectCreate", "SubjectUpdate", "SubjectResponse"
+    "TeacherCreate", "TeacherUpdate", "TeacherResponse", "TeacherWorkload",
+    "ClasseCreate", "ClasseUpdate", "ClasseResponse", "ClasseRoster", "RosterEntry",
+    "SubjectCreate", "SubjectUpdate", "SubjectResponse",
+    "EnrollmentCreate", "EnrollmentUpdate", "EnrollmentResponse",
+    "BulkItemResult", "BulkResponse"
 ]
@@ -1,5 +1,7 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
+from datetime import datetime
+from ..models.enrollment import EnrollmentStatus
 
 
 class ClasseBase(BaseModel):
@@ -26,6 +28,28 @@ class ClasseUpdate(BaseModel):
 
 class ClasseResponse(ClasseBase):
     id: int
+    max_students: Optional[int] = None  # colonne nullable : pas de limite
+    active_enrollments: int = 0
+    fill_rate: float = 0.0
 
     class Config:
         from_attributes = True
+
+
+class RosterEntry(BaseModel):
+    enrollment_id: int
+    student_id: int
+    student_number: str
+    first_name: str
+    last_name: str
+    status: EnrollmentStatus
+    enrollment_date: Optional[datetime] = None
+
+
+class ClasseRoster(BaseModel):
+    id: int
+    name: str
+    level: str
+    academic_year: str
+    max_students: Optional[int] = None
+    students: List[RosterEntry]
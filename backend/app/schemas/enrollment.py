@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+from ..models.enrollment import EnrollmentStatus
+
+
+class EnrollmentBase(BaseModel):
+    student_id: int
+    classe_id: int
+    status: EnrollmentStatus = EnrollmentStatus.ACTIVE
+
+
+class EnrollmentCreate(EnrollmentBase):
+    pass
+
+
+class EnrollmentUpdate(BaseModel):
+    status: EnrollmentStatus
+
+
+class EnrollmentResponse(EnrollmentBase):
+    id: int
+    enrollment_date: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
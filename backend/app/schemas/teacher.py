@@ -29,3 +29,10 @@ class TeacherResponse(TeacherBase):
 
     class Config:
         from_attributes = True
+
+
+class TeacherWorkload(BaseModel):
+    teacher_id: int
+    total_hours_per_week: int
+    subject_count: int
+    classe_count: int
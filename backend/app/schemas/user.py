@@ -2,6 +2,7 @@ from pydantic import BaseModel, EmailStr
 from typing import Optional
 from datetime import datetime
 from ..models.user import UserRole
+from .bulk import BulkResponse
 
 
 class UserBase(BaseModel):
@@ -38,6 +39,11 @@ class UserResponse(UserBase):
         from_attributes = True
 
 
+class UserBulkResponse(BulkResponse):
+    hashing_seconds: float
+    hashes_per_second: float
+
+
 class UserLogin(BaseModel):
     username: str
     password: str
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Recherche floue indexée sur les utilisateurs et les étudiants
+
+PostgreSQL : index GIN `pg_trgm` sur une expression normalisée (minuscules,
+sans accents via `unaccent`), classement par `word_similarity`.
+SQLite : tables FTS5 (`unicode61 remove_diacritics 2`) tenues à jour par des
+triggers, classement par niveaux (nom exact, préfixe du nom, autre colonne).
+
+Les index sont créés avec les tables (`Base.metadata.create_all`). Pour une
+base existante, les créer et les remplir avec :
+    python -m app.search
+"""
+
+import re
+from typing import List
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from .database import Base, SessionLocal
+from .models.student import Student
+from .models.user import User
+
+# --- PostgreSQL (pg_trgm) ---
+
+# L'expression de la requête doit être identique à celle de l'index pour qu'il soit utilisé
+_PG_USER_DOCUMENT = (
+    "f_unaccent(lower(first_name || ' ' || last_name || ' ' || email || ' ' || username))"
+)
+_PG_STUDENT_DOCUMENT = (
+    "f_unaccent(lower(student_number || ' ' || coalesce(parent_name, '')))"
+)
+
+_PG_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    # unaccent() n'est pas IMMUTABLE : cette enveloppe l'est et peut donc être indexée
+    """
+    CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    AS $$ SELECT public.unaccent('public.unaccent', $1) $$
+    """,
+    f"CREATE INDEX IF NOT EXISTS ix_users_search_trgm ON users USING gin (({_PG_USER_DOCUMENT}) gin_trgm_ops)",
+    f"CREATE INDEX IF NOT EXISTS ix_students_search_trgm ON students USING gin (({_PG_STUDENT_DOCUMENT}) gin_trgm_ops)",
+]
+
+_PG_SEARCH_USERS = text(f"""
+    SELECT id FROM users
+    WHERE f_unaccent(lower(:q)) <% {_PG_USER_DOCUMENT}
+    ORDER BY word_similarity(f_unaccent(lower(:q)), {_PG_USER_DOCUMENT}) DESC, id
+    LIMIT :limit OFFSET :skip
+""")
+
+# Un étudiant correspond par son dossier (numéro, parent) ou par son compte
+# utilisateur (nom, email) : chaque branche utilise son propre index
+_PG_SEARCH_STUDENTS = text(f"""
+    SELECT id FROM (
+        SELECT id, word_similarity(f_unaccent(lower(:q)), {_PG_STUDENT_DOCUMENT}) AS rank
+        FROM students
+        WHERE f_unaccent(lower(:q)) <% {_PG_STUDENT_DOCUMENT}
+        UNION ALL
+        SELECT students.id, word_similarity(f_unaccent(lower(:q)), {_PG_USER_DOCUMENT})
+        FROM users JOIN students ON students.user_id = users.id
+        WHERE f_unaccent(lower(:q)) <% {_PG_USER_DOCUMENT}
+    ) AS hits
+    GROUP BY id
+    ORDER BY max(rank) DESC, id
+    LIMIT :limit OFFSET :skip
+""")
+
+# --- SQLite (FTS5) ---
+
+_SQLITE_DDL = [
+    # Table à contenu externe : l'index lit les colonnes de `users`
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+        first_name, last_name, email, username,
+        content='users', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN
+        INSERT INTO users_fts(rowid, first_name, last_name, email, username)
+        VALUES (new.id, new.first_name, new.last_name, new.email, new.username);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN
+        INSERT INTO users_fts(users_fts, rowid, first_name, last_name, email, username)
+        VALUES ('delete', old.id, old.first_name, old.last_name, old.email, old.username);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_fts_update AFTER UPDATE OF first_name, last_name, email, username ON users BEGIN
+        INSERT INTO users_fts(users_fts, rowid, first_name, last_name, email, username)
+        VALUES ('delete', old.id, old.first_name, old.last_name, old.email, old.username);
+        INSERT INTO users_fts(rowid, first_name, last_name, email, username)
+        VALUES (new.id, new.first_name, new.last_name, new.email, new.username);
+    END
+    """,
+    # Les étudiants sont indexés avec le nom de leur compte : la table garde sa propre copie
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS students_fts USING fts5(
+        first_name, last_name, student_number, parent_name, email,
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS students_fts_insert AFTER INSERT ON students BEGIN
+        INSERT INTO students_fts(rowid, first_name, last_name, student_number, parent_name, email)
+        SELECT new.id, users.first_name, users.last_name, new.student_number, new.parent_name, users.email
+        FROM (SELECT 1) LEFT JOIN users ON users.id = new.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS students_fts_delete AFTER DELETE ON students BEGIN
+        DELETE FROM students_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS students_fts_update AFTER UPDATE OF user_id, student_number, parent_name ON students BEGIN
+        DELETE FROM students_fts WHERE rowid = old.id;
+        INSERT INTO students_fts(rowid, first_name, last_name, student_number, parent_name, email)
+        SELECT new.id, users.first_name, users.last_name, new.student_number, new.parent_name, users.email
+        FROM (SELECT 1) LEFT JOIN users ON users.id = new.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS students_fts_user_update AFTER UPDATE OF first_name, last_name, email ON users BEGIN
+        UPDATE students_fts SET first_name = new.first_name, last_name = new.last_name, email = new.email
+        WHERE rowid IN (SELECT id FROM students WHERE user_id = new.id);
+    END
+    """,
+]
+
+_SQLITE_REBUILD = [
+    "INSERT INTO users_fts(users_fts) VALUES ('rebuild')",
+    "DELETE FROM students_fts",
+    """
+    INSERT INTO students_fts(rowid, first_name, last_name, student_number, parent_name, email)
+    SELECT students.id, users.first_name, users.last_name, students.student_number, students.parent_name, users.email
+    FROM students LEFT JOIN users ON users.id = students.user_id
+    """,
+]
+
+_SQLITE_SEARCH = "SELECT rowid FROM {table} WHERE {table} MATCH :q ORDER BY rowid LIMIT :limit OFFSET :skip"
+_SQLITE_COUNT = "SELECT count(*) FROM {table} WHERE {table} MATCH :q"
+
+
+def search_index_statements(dialect: str, backfill: bool = False) -> List[str]:
+    """DDL des index de recherche du dialecte, suivi au besoin du remplissage initial."""
+    statements = list({"postgresql": _PG_DDL, "sqlite": _SQLITE_DDL}.get(dialect, []))
+    if backfill and dialect == "sqlite":
+        statements += _SQLITE_REBUILD
+    return statements
+
+
+def install_search_indexes(target, connection, **kw) -> None:
+    """Créer les index de recherche du dialecte courant (écouteur `after_create`)."""
+    for statement in search_index_statements(connection.dialect.name):
+        connection.exec_driver_sql(statement)
+
+
+def drop_search_indexes(target, connection, **kw) -> None:
+    """Supprimer les tables FTS5 avant `drop_all` (les index PostgreSQL suivent leurs tables)."""
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("DROP TABLE IF EXISTS users_fts")
+        connection.exec_driver_sql("DROP TABLE IF EXISTS students_fts")
+
+
+event.listen(Base.metadata, "after_create", install_search_indexes)
+event.listen(Base.metadata, "before_drop", drop_search_indexes)
+
+
+def rebuild_search_indexes(db: Session) -> None:
+    """Créer les index si besoin et les remplir à partir des données existantes."""
+    connection = db.connection()
+    for statement in search_index_statements(connection.dialect.name, backfill=True):
+        connection.exec_driver_sql(statement)
+    db.commit()
+
+
+def fts_tiers(q: str) -> List[str]:
+    """Traduire une saisie libre en requêtes FTS5 disjointes, de la plus pertinente à la moins pertinente.
+
+    Chaque mot est obligatoire : nom exact, puis préfixe du nom, puis préfixe
+    dans n'importe quelle colonne. Les niveaux s'excluent (NOT), ce qui évite
+    de calculer un score bm25 pour chaque ligne trouvée.
+    """
+    words = re.findall(r"\w+", q)
+    if not words:
+        return []
+    exact = " AND ".join(f'{{first_name last_name}}: "{word}"' for word in words)
+    prefix = " AND ".join(f'{{first_name last_name}}: "{word}"*' for word in words)
+    anywhere = " AND ".join(f'"{word}"*' for word in words)
+    return [exact, f"({prefix}) NOT ({exact})", f"({anywhere}) NOT ({prefix})"]
+
+
+def _sqlite_ranked_ids(db: Session, table: str, q: str, skip: int, limit: int) -> List[int]:
+    """Parcourir les niveaux dans l'ordre, chacun trié par id, jusqu'à remplir la page."""
+    ids: List[int] = []
+    for tier in fts_tiers(q):
+        if skip:
+            found = db.execute(text(_SQLITE_COUNT.format(table=table)), {"q": tier}).scalar()
+            if found <= skip:
+                skip -= found
+                continue
+        ids.extend(db.execute(
+            text(_SQLITE_SEARCH.format(table=table)), {"q": tier, "skip": skip, "limit": limit - len(ids)}
+        ).scalars())
+        skip = 0
+        if len(ids) >= limit:
+            break
+    return ids
+
+
+def _in_order(db: Session, model, ids: List[int]) -> list:
+    """Charger les lignes `ids` en conservant l'ordre du classement."""
+    if not ids:
+        return []
+    rows = {row.id: row for row in db.query(model).filter(model.id.in_(ids))}
+    return [rows[row_id] for row_id in ids if row_id in rows]
+
+
+def search_users(db: Session, q: str, skip: int = 0, limit: int = 20) -> List[User]:
+    """Utilisateurs dont le nom, l'email ou l'identifiant correspond à `q`, les plus pertinents d'abord."""
+    if db.get_bind().dialect.name == "sqlite":
+        ids = _sqlite_ranked_ids(db, "users_fts", q, skip, limit)
+    else:
+        ids = list(db.execute(_PG_SEARCH_USERS, {"q": q, "skip": skip, "limit": limit}).scalars())
+    return _in_order(db, User, ids)
+
+
+def search_students(db: Session, q: str, skip: int = 0, limit: int = 20) -> List[Student]:
+    """Étudiants dont le nom, l'email, le numéro ou le nom du parent correspond à `q`."""
+    if db.get_bind().dialect.name == "sqlite":
+        ids = _sqlite_ranked_ids(db, "students_fts", q, skip, limit)
+    else:
+        ids = list(db.execute(_PG_SEARCH_STUDENTS, {"q": q, "skip": skip, "limit": limit}).scalars())
+    return _in_order(db, Student, ids)
+
+
+def main():
+    print("🔎 Reconstruction des index de recherche...")
+    db = SessionLocal()
+    try:
+        rebuild_search_indexes(db)
+        print("✅ Index de recherche à jour")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
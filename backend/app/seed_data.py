@@ -2,13 +2,38 @@
 """
 Script de génération de données fictives pour l'application École Privée
 Utilise Faker pour créer des données réalistes de test
+
+Le jeu de démonstration (`scale=1` : 15 enseignants, 100 étudiants, 50 parents,
+23 classes) est multiplié par le facteur d'échelle :
+
+    python seed.py --scale 1000 --seed 42 --chunk-size 5000 --workers 8
+
+Les lignes sont générées par lots, chacun avec son propre générateur Faker
+initialisé à partir de la graine, répartis sur plusieurs processus
+(`--workers`, `SEED_WORKERS`) et insérés au fil de l'eau par `insert()`
+multi-lignes sans rechargement des objets. Le mot de passe de démonstration
+est haché une seule fois. À graine et taille de lot égales, le jeu de données
+est identique quel que soit le nombre de processus.
 """
 
+import argparse
+import multiprocessing
+import os
 import random
-from datetime import date, datetime, timedelta
-from faker import Faker
+import time
+import unicodedata
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import date
+from functools import lru_cache
+from itertools import accumulate
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from .database import SessionLocal, engine
+from .config import settings
+from .database import SessionLocal
 from .models.user import User, UserRole
 from .models.student import Student
 from .models.teacher import Teacher
@@ -16,10 +41,270 @@ from .models.classe import Classe
 from .models.subject import Subject
 from .models.enrollment import Enrollment, EnrollmentStatus
 from .auth import get_password_hash
+from .enrollment_counters import reconcile_enrollment_counters
+from .models.table_version import VERSIONED_TABLES
+from .table_versions import bump_version
+
+DEMO_PASSWORD = "password123"
+ACADEMIC_YEAR = "2024-2025"
+# Les dates sont tirées autour de la rentrée, pas du jour du lancement (reproductibilité)
+REFERENCE_DATE = date(2024, 9, 1)
+
+# Effectifs du jeu de démonstration, multipliés par le facteur d'échelle
+TEACHERS_PER_SCALE = 15
+STUDENTS_PER_SCALE = 100
+PARENTS_PER_SCALE = 50
+
+SPECIALIZATIONS = [
+    "Mathématiques", "Français", "Histoire-Géographie", "Sciences Physiques",
+    "Sciences de la Vie et de la Terre", "Anglais", "Espagnol", "Allemand",
+    "Éducation Physique et Sportive", "Arts Plastiques", "Musique", "Philosophie",
+    "Économie", "Informatique", "Technologie"
+]
+
+CLASSES_DATA = [
+    # Primaire
+    ("CP A", "CP", "A", 25),
+    ("CP B", "CP", "B", 25),
+    ("CE1 A", "CE1", "A", 25),
+    ("CE1 B", "CE1", "B", 25),
+    ("CE2 A", "CE2", "A", 25),
+    ("CM1 A", "CM1", "A", 25),
+    ("CM2 A", "CM2", "A", 25),
+
+    # Collège
+    ("6ème A", "6ème", "A", 28),
+    ("6ème B", "6ème", "B", 28),
+    ("5ème A", "5ème", "A", 28),
+    ("5ème B", "5ème", "B", 28),
+    ("4ème A", "4ème", "A", 28),
+    ("4ème B", "4ème", "B", 28),
+    ("3ème A", "3ème", "A", 28),
+    ("3ème B", "3ème", "B", 28),
+
+    # Lycée
+    ("2nde A", "2nde", "Générale", 30),
+    ("2nde B", "2nde", "Générale", 30),
+    ("1ère S", "1ère", "Scientifique", 30),
+    ("1ère ES", "1ère", "Économique et Social", 30),
+    ("1ère L", "1ère", "Littéraire", 30),
+    ("Terminale S", "Terminale", "Scientifique", 30),
+    ("Terminale ES", "Terminale", "Économique et Social", 30),
+    ("Terminale L", "Terminale", "Littéraire", 30),
+]
+
+SUBJECTS_BY_LEVEL = {
+    "CP": ["Français", "Mathématiques", "Découverte du monde", "Arts plastiques", "EPS"],
+    "CE1": ["Français", "Mathématiques", "Découverte du monde", "Arts plastiques", "EPS"],
+    "CE2": ["Français", "Mathématiques", "Sciences", "Histoire-Géographie", "Arts plastiques", "EPS"],
+    "CM1": ["Français", "Mathématiques", "Sciences", "Histoire-Géographie", "Arts plastiques", "EPS", "Anglais"],
+    "CM2": ["Français", "Mathématiques", "Sciences", "Histoire-Géographie", "Arts plastiques", "EPS", "Anglais"],
+    "6ème": ["Français", "Mathématiques", "Histoire-Géographie", "SVT", "Physique-Chimie", "Anglais", "Arts plastiques", "Musique", "EPS", "Technologie"],
+    "5ème": ["Français", "Mathématiques", "Histoire-Géographie", "SVT", "Physique-Chimie", "Anglais", "Espagnol", "Arts plastiques", "Musique", "EPS", "Technologie"],
+    "4ème": ["Français", "Mathématiques", "Histoire-Géographie", "SVT", "Physique-Chimie", "Anglais", "Espagnol", "Arts plastiques", "Musique", "EPS", "Technologie"],
+    "3ème": ["Français", "Mathématiques", "Histoire-Géographie", "SVT", "Physique-Chimie", "Anglais", "Espagnol", "Arts plastiques", "Musique", "EPS", "Technologie"],
+    "2nde": ["Français", "Mathématiques", "Histoire-Géographie", "SVT", "Physique-Chimie", "Anglais", "Espagnol", "EPS", "SES"],
+    "1ère": ["Français", "Mathématiques", "Histoire-Géographie", "Philosophie", "Anglais", "Espagnol", "EPS"],
+    "Terminale": ["Philosophie", "Mathématiques", "Histoire-Géographie", "Anglais", "Espagnol", "EPS"]
+}
+
+# Nombre de matières des classes précédentes d'une même série de CLASSES_DATA (codes des matières)
+_SUBJECT_OFFSETS = list(accumulate((len(SUBJECTS_BY_LEVEL[level]) for _, level, _, _ in CLASSES_DATA), initial=0))
+
+
+@lru_cache(maxsize=1)
+def get_faker():
+    """Générateur Faker en français, chargé à la première utilisation."""
+    from faker import Faker
+
+    return Faker('fr_FR')
+
+
+def block_faker(seed: int, kind: str, block: int):
+    """Générateur Faker réinitialisé pour le lot `block` de `kind` (graine dérivée de `seed`)."""
+    fake = get_faker()
+    fake.seed_instance(random.Random(f"{seed}:{kind}:{block}").getrandbits(64))
+    return fake
+
+
+def chunks(total: int, chunk_size: int) -> Iterator[Tuple[int, int, int]]:
+    """Découper `range(total)` en lots : (numéro du lot, début, fin)."""
+    for block, start in enumerate(range(0, total, chunk_size)):
+        yield block, start, min(start + chunk_size, total)
+
+
+def _slug(name: str) -> str:
+    """Nom en ASCII minuscule, sans espaces ni apostrophes (identifiants et emails)."""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    return "".join(char for char in ascii_name.lower() if char.isalnum())
+
+
+def _user_row(fake, role: UserRole, number: int, password_hash: str) -> dict:
+    first_name = fake.first_name()
+    last_name = fake.last_name()
+    username = f"{_slug(first_name)}.{_slug(last_name)}{number}"
+    return {
+        "email": f"{username}@ecole-prive.fr",
+        "username": username,
+        "first_name": first_name,
+        "last_name": last_name,
+        "hashed_password": password_hash,
+        "role": role,
+        "phone": fake.phone_number(),
+        "address": fake.address(),
+        "is_active": True,
+    }
+
+
+def _date_before(fake, years_min: int, years_max: int) -> date:
+    """Date tirée entre `years_max` et `years_min` ans avant la date de référence."""
+    return fake.date_between_dates(
+        date_start=REFERENCE_DATE.replace(year=REFERENCE_DATE.year - years_max),
+        date_end=REFERENCE_DATE.replace(year=REFERENCE_DATE.year - years_min),
+    )
+
+
+def classe_rows(start: int, stop: int) -> List[dict]:
+    """Classes `start` à `stop` : CLASSES_DATA répété, numéroté à partir de la deuxième série."""
+    rows = []
+    for i in range(start, stop):
+        name, level, section, max_students = CLASSES_DATA[i % len(CLASSES_DATA)]
+        series = i // len(CLASSES_DATA)
+        if series:
+            name = f"{name} ({series + 1})"
+        rows.append({
+            "name": name,
+            "level": level,
+            "section": section,
+            "academic_year": ACADEMIC_YEAR,
+            "max_students": max_students,
+            "description": f"Classe de {name} pour l'année scolaire {ACADEMIC_YEAR}",
+        })
+    return rows
+
+
+def teacher_rows(seed: int, block: int, start: int, stop: int, password_hash: str) -> Tuple[List[dict], List[dict]]:
+    """Comptes et profils des enseignants `start` à `stop` (sans `user_id`)."""
+    fake = block_faker(seed, "teachers", block)
+    users, teachers = [], []
+    for i in range(start, stop):
+        users.append(_user_row(fake, UserRole.TEACHER, i + 1, password_hash))
+        teachers.append({
+            "employee_number": f"ENS{2024}{i+1:03d}",
+            "hire_date": _date_before(fake, 0, 10),
+            "specialization": fake.random.choice(SPECIALIZATIONS),
+            "qualifications": fake.text(max_nb_chars=200),
+            "salary": fake.random.randint(250000, 450000),  # En centimes (2500€ à 4500€)
+        })
+    return users, teachers
+
+
+def subject_rows(seed: int, block: int, start: int, stop: int, teacher_count: int) -> List[dict]:
+    """Matières des classes `start` à `stop` (`classe_index` et `teacher_index` à résoudre en ids)."""
+    fake = block_faker(seed, "subjects", block)
+    per_series = _SUBJECT_OFFSETS[-1]
+    rows = []
+    for i in range(start, stop):
+        series, position = divmod(i, len(CLASSES_DATA))
+        name, level = CLASSES_DATA[position][:2]
+        if series:
+            name = f"{name} ({series + 1})"
+        counter = series * per_series + _SUBJECT_OFFSETS[position]
+        for subject_name in SUBJECTS_BY_LEVEL[level]:
+            counter += 1
+            rows.append({
+                "name": subject_name,
+                "code": f"{subject_name[:3].upper()}{counter:03d}",
+                "description": f"{subject_name} pour la classe {name}",
+                "credits": fake.random.randint(1, 4),
+                "hours_per_week": fake.random.randint(1, 6),
+                "teacher_index": fake.random.randrange(teacher_count),
+                "classe_index": i,
+            })
+    return rows
+
+
+def student_rows(seed: int, block: int, start: int, stop: int, password_hash: str,
+                 classe_count: int, user_offset: int) -> Tuple[List[dict], List[dict], List[dict]]:
+    """Comptes, profils et inscriptions des étudiants `start` à `stop`.
+
+    Chaque étudiant est inscrit dans une classe tirée au hasard (`classe_index`).
+    `user_offset` : comptes déjà numérotés (enseignants), les identifiants restant uniques.
+    """
+    fake = block_faker(seed, "students", block)
+    statuses = list(EnrollmentStatus)
+    users, students, enrollments = [], [], []
+    for i in range(start, stop):
+        users.append(_user_row(fake, UserRole.STUDENT, user_offset + i + 1, password_hash))
+        students.append({
+            "student_number": f"ETU{2024}{i+1:04d}",
+            "date_of_birth": _date_before(fake, 6, 18),
+            "parent_name": fake.name(),
+            "parent_phone": fake.phone_number(),
+            "parent_email": fake.email(),
+            "emergency_contact": fake.phone_number(),
+            "medical_info": fake.text(max_nb_chars=100) if fake.random.random() < 0.5 else None,
+        })
+        enrollments.append({
+            "classe_index": fake.random.randrange(classe_count),
+            "enrollment_date": _date_before(fake, 0, 1),
+            "status": fake.random.choice(statuses),
+        })
+    return users, students, enrollments
+
+
+def parent_rows(seed: int, block: int, start: int, stop: int, password_hash: str, user_offset: int) -> List[dict]:
+    """Comptes des parents `start` à `stop` (numérotés après `user_offset` comptes)."""
+    fake = block_faker(seed, "parents", block)
+    return [_user_row(fake, UserRole.PARENT, user_offset + i + 1, password_hash) for i in range(start, stop)]
+
+
+class SeedProgress:
+    """Avancement d'une étape du peuplement et débit en lignes insérées par seconde."""
+
+    def __init__(self, label: str, total: int):
+        self.label = label
+        self.total = total
+        self.done = 0
+        self.rows = 0
+        self.start = time.perf_counter()
+
+    def advance(self, items: int, rows: int) -> None:
+        self.done += items
+        self.rows += rows
+        print(f"\r   {self.label}: {self.done}/{self.total} ({self.done / max(self.total, 1):.0%}), "
+              f"{self.rate():,.0f} lignes/s", end="", flush=True)
 
-# Configuration Faker en français
-fake = Faker('fr_FR')
-Faker.seed(42)  # Pour des résultats reproductibles
+    def rate(self) -> float:
+        return self.rows / max(time.perf_counter() - self.start, 1e-9)
+
+    def finish(self) -> None:
+        elapsed = time.perf_counter() - self.start
+        print(f"\r✅ {self.total} {self.label} ({self.rows} lignes en {elapsed:.1f} s, "
+              f"{self.rate():,.0f} lignes/s)" + " " * 10)
+
+
+def _insert(db: Session, model, rows: Sequence[dict], returning: bool = False) -> List[int]:
+    """Insertion multi-lignes d'un lot; renvoie les ids dans l'ordre des lignes si `returning`."""
+    if not rows:
+        return []
+    if not returning:
+        db.execute(insert(model), rows)
+        return []
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return list(db.execute(stmt, rows).scalars())
+
+
+def _link(rows: List[dict], key: str, ids: Sequence[int]) -> List[dict]:
+    for row, row_id in zip(rows, ids):
+        row[key] = row_id
+    return rows
+
+
+def _resolve(rows: List[dict], index_key: str, key: str, ids: Sequence[int]) -> List[dict]:
+    for row in rows:
+        row[key] = ids[row.pop(index_key)]
+    return rows
 
 
 def create_admin_user(db: Session) -> User:
@@ -37,281 +322,164 @@ def create_admin_user(db: Session) -> User:
     )
     db.add(admin)
     db.commit()
-    db.refresh(admin)
     print(f"✅ Administrateur créé: {admin.email}")
     return admin
 
 
-def create_fake_users(db: Session, count: int, role: UserRole) -> list[User]:
-    """Créer des utilisateurs fictifs."""
-    users = []
-    
-    for i in range(count):
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        username = f"{first_name.lower()}.{last_name.lower()}{i+1}"
-        email = f"{username}@ecole-prive.fr"
-        
-        user = User(
-            email=email,
-            username=username,
-            first_name=first_name,
-            last_name=last_name,
-            hashed_password=get_password_hash("password123"),
-            role=role,
-            phone=fake.phone_number(),
-            address=fake.address(),
-            is_active=True
-        )
-        
-        db.add(user)
-        users.append(user)
-    
-    db.commit()
-    for user in users:
-        db.refresh(user)
-    
-    print(f"✅ {count} utilisateurs {role.value} créés")
-    return users
-
-
-def create_fake_teachers(db: Session, teacher_users: list[User]) -> list[Teacher]:
-    """Créer des profils enseignants fictifs."""
-    teachers = []
-    specializations = [
-        "Mathématiques", "Français", "Histoire-Géographie", "Sciences Physiques",
-        "Sciences de la Vie et de la Terre", "Anglais", "Espagnol", "Allemand",
-        "Éducation Physique et Sportive", "Arts Plastiques", "Musique", "Philosophie",
-        "Économie", "Informatique", "Technologie"
-    ]
-    
-    for i, user in enumerate(teacher_users):
-        teacher = Teacher(
-            user_id=user.id,
-            employee_number=f"ENS{2024}{i+1:03d}",
-            hire_date=fake.date_between(start_date='-10y', end_date='today'),
-            specialization=random.choice(specializations),
-            qualifications=fake.text(max_nb_chars=200),
-            salary=random.randint(250000, 450000)  # En centimes (2500€ à 4500€)
-        )
-        
-        db.add(teacher)
-        teachers.append(teacher)
-    
-    db.commit()
-    for teacher in teachers:
-        db.refresh(teacher)
-    
-    print(f"✅ {len(teachers)} profils enseignants créés")
-    return teachers
-
-
-def create_fake_students(db: Session, student_users: list[User]) -> list[Student]:
-    """Créer des profils étudiants fictifs."""
-    students = []
-    
-    for i, user in enumerate(student_users):
-        # Date de naissance entre 6 et 18 ans
-        birth_date = fake.date_between(start_date='-18y', end_date='-6y')
-        
-        student = Student(
-            user_id=user.id,
-            student_number=f"ETU{2024}{i+1:04d}",
-            date_of_birth=birth_date,
-            parent_name=fake.name(),
-            parent_phone=fake.phone_number(),
-            parent_email=fake.email(),
-            emergency_contact=fake.phone_number(),
-            medical_info=fake.text(max_nb_chars=100) if random.choice([True, False]) else None
-        )
-        
-        db.add(student)
-        students.append(student)
-    
-    db.commit()
-    for student in students:
-        db.refresh(student)
-    
-    print(f"✅ {len(students)} profils étudiants créés")
-    return students
-
-
-def create_fake_classes(db: Session) -> list[Classe]:
-    """Créer des classes fictives."""
-    classes_data = [
-        # Primaire
-        ("CP A", "CP", "A", 25),
-        ("CP B", "CP", "B", 25),
-        ("CE1 A", "CE1", "A", 25),
-        ("CE1 B", "CE1", "B", 25),
-        ("CE2 A", "CE2", "A", 25),
-        ("CM1 A", "CM1", "A", 25),
-        ("CM2 A", "CM2", "A", 25),
-        
-        # Collège
-        ("6ème A", "6ème", "A", 28),
-        ("6ème B", "6ème", "B", 28),
-        ("5ème A", "5ème", "A", 28),
-        ("5ème B", "5ème", "B", 28),
-        ("4ème A", "4ème", "A", 28),
-        ("4ème B", "4ème", "B", 28),
-        ("3ème A", "3ème", "A", 28),
-        ("3ème B", "3ème", "B", 28),
-        
-        # Lycée
-        ("2nde A", "2nde", "Générale", 30),
-        ("2nde B", "2nde", "Générale", 30),
-        ("1ère S", "1ère", "Scientifique", 30),
-        ("1ère ES", "1ère", "Économique et Social", 30),
-        ("1ère L", "1ère", "Littéraire", 30),
-        ("Terminale S", "Terminale", "Scientifique", 30),
-        ("Terminale ES", "Terminale", "Économique et Social", 30),
-        ("Terminale L", "Terminale", "Littéraire", 30),
-    ]
-    
-    classes = []
-    for name, level, section, max_students in classes_data:
-        classe = Classe(
-            name=name,
-            level=level,
-            section=section,
-            academic_year="2024-2025",
-            max_students=max_students,
-            description=f"Classe de {name} pour l'année scolaire 2024-2025"
-        )
-        
-        db.add(classe)
-        classes.append(classe)
-    
-    db.commit()
-    for classe in classes:
-        db.refresh(classe)
-    
-    print(f"✅ {len(classes)} classes créées")
-    return classes
-
-
-def create_fake_subjects(db: Session, classes: list[Classe], teachers: list[Teacher]) -> list[Subject]:
-    """Créer des matières fictives."""
-    subjects_by_level = {
-        "CP": ["Français", "Mathématiques", "Découverte du monde", "Arts plastiques", "EPS"],
-        "CE1": ["Français", "Mathématiques", "Découverte du monde", "Arts plastiques", "EPS"],
-        "CE2": ["Français", "Mathématiques", "Sciences", "Histoire-Géographie", "Arts plastiques", "EPS"],
-        "CM1": ["Français", "Mathématiques", "Sciences", "Histoire-Géographie", "Arts plastiques", "EPS", "Anglais"],
-        "CM2": ["Français", "Mathématiques", "Sciences", "Histoire-Géographie", "Arts plastiques", "EPS", "Anglais"],
-        "6ème": ["Français", "Mathématiques", "Histoire-Géographie", "SVT", "Physique-Chimie", "Anglais", "Arts plastiques", "Musique", "EPS", "Technologie"],
-        "5ème": ["Français", "Mathématiques", "Histoire-Géographie", "SVT", "Physique-Chimie", "Anglais", "Espagnol", "Arts plastiques", "Musique", "EPS", "Technologie"],
-        "4ème": ["Français", "Mathématiques", "Histoire-Géographie", "SVT", "Physique-Chimie", "Anglais", "Espagnol", "Arts plastiques", "Musique", "EPS", "Technologie"],
-        "3ème": ["Français", "Mathématiques", "Histoire-Géographie", "SVT", "Physique-Chimie", "Anglais", "Espagnol", "Arts plastiques", "Musique", "EPS", "Technologie"],
-        "2nde": ["Français", "Mathématiques", "Histoire-Géographie", "SVT", "Physique-Chimie", "Anglais", "Espagnol", "EPS", "SES"],
-        "1ère": ["Français", "Mathématiques", "Histoire-Géographie", "Philosophie", "Anglais", "Espagnol", "EPS"],
-        "Terminale": ["Philosophie", "Mathématiques", "Histoire-Géographie", "Anglais", "Espagnol", "EPS"]
-    }
-    
-    subjects = []
-    subject_counter = 1
-    
-    for classe in classes:
-        level = classe.level
-        if level in subjects_by_level:
-            for subject_name in subjects_by_level[level]:
-                # Assigner un enseignant aléatoire
-                teacher = random.choice(teachers)
-                
-                subject = Subject(
-                    name=subject_name,
-                    code=f"{subject_name[:3].upper()}{subject_counter:03d}",
-                    description=f"{subject_name} pour la classe {classe.name}",
-                    credits=random.randint(1, 4),
-                    hours_per_week=random.randint(1, 6),
-                    teacher_id=teacher.id,
-                    classe_id=classe.id
-                )
-                
-                db.add(subject)
-                subjects.append(subject)
-                subject_counter += 1
-    
-    db.commit()
-    for subject in subjects:
-        db.refresh(subject)
-    
-    print(f"✅ {len(subjects)} matières créées")
-    return subjects
-
-
-def create_fake_enrollments(db: Session, students: list[Student], classes: list[Classe]) -> list[Enrollment]:
-    """Créer des inscriptions fictives."""
-    enrollments = []
-    
-    # Répartir les étudiants dans les classes
-    for student in students:
-        # Choisir une classe aléatoire
-        classe = random.choice(classes)
-        
-        enrollment = Enrollment(
-            student_id=student.id,
-            classe_id=classe.id,
-            enrollment_date=fake.date_between(start_date='-1y', end_date='today'),
-            status=random.choice(list(EnrollmentStatus))
-        )
-        
-        db.add(enrollment)
-        enrollments.append(enrollment)
-    
-    db.commit()
-    for enrollment in enrollments:
-        db.refresh(enrollment)
-    
-    print(f"✅ {len(enrollments)} inscriptions créées")
-    return enrollments
+def seed_workers() -> int:
+    """Nombre de processus de génération (0 dans la configuration = tous les cœurs)."""
+    return settings.seed_workers or os.cpu_count() or 1
+
+
+@contextmanager
+def shard_pool(workers: int) -> Iterator[Optional[ProcessPoolExecutor]]:
+    """Pool de génération des lots (aucun pour un seul processus : génération sur place)."""
+    if workers <= 1:
+        yield None
+        return
+    # "spawn" : les processus de génération ne reçoivent ni la session ni ses connexions
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        yield pool
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def generate_shards(pool: Optional[ProcessPoolExecutor], fn, tasks: Sequence[tuple], queue_size: int) -> Iterator:
+    """Résultats de `fn(*task)` pour chaque lot, dans l'ordre des lots.
+
+    Avec un pool, au plus `queue_size` lots sont générés d'avance : la file
+    vers l'écrivain est bornée et la mémoire ne dépend pas du volume.
+    L'ordre et les graines par lot ne dépendent pas du nombre de processus,
+    le jeu de données non plus.
+    """
+    if pool is None:
+        for task in tasks:
+            yield fn(*task)
+        return
+    pending: Deque[Future] = deque()
+    for task in tasks:
+        if len(pending) >= queue_size:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, *task))
+    while pending:
+        yield pending.popleft().result()
 
 
-def seed_database():
+def generate_dataset(db: Session, scale: int = 1, seed: int = 42, chunk_size: Optional[int] = None,
+                     workers: Optional[int] = None) -> Dict[str, int]:
+    """Peupler la base par lots (un commit par lot) et renvoyer le nombre de lignes par table.
+
+    Les lots sont générés par `workers` processus (défaut : `SEED_WORKERS`) et
+    insérés au fil de l'eau par la session `db`.
+    """
+    chunk_size = chunk_size or settings.seed_chunk_size
+    workers = workers or seed_workers()
+    queue_size = 2 * workers  # lots générés d'avance pendant que l'écrivain insère
+    teacher_count = TEACHERS_PER_SCALE * scale
+    student_count = STUDENTS_PER_SCALE * scale
+    parent_count = PARENTS_PER_SCALE * scale
+    classe_count = len(CLASSES_DATA) * scale
+    counts = {"users": 1, "teachers": 0, "students": 0, "classes": 0, "subjects": 0, "enrollments": 0}
+
+    create_admin_user(db)
+    # bcrypt est volontairement lent : un seul hachage pour tous les comptes de démonstration
+    password_hash = get_password_hash(DEMO_PASSWORD)
+
+    progress = SeedProgress("classes", classe_count)
+    classe_ids: List[int] = []
+    for block, start, stop in chunks(classe_count, chunk_size):
+        classe_ids += _insert(db, Classe, classe_rows(start, stop), returning=True)
+        db.commit()
+        progress.advance(stop - start, stop - start)
+    progress.finish()
+    counts["classes"] = len(classe_ids)
+
+    with shard_pool(workers) as pool:
+        progress = SeedProgress("enseignants", teacher_count)
+        teacher_ids: List[int] = []
+        tasks = [(seed, *bounds, password_hash) for bounds in chunks(teacher_count, chunk_size)]
+        for users, teachers in generate_shards(pool, teacher_rows, tasks, queue_size):
+            user_ids = _insert(db, User, users, returning=True)
+            teacher_ids += _insert(db, Teacher, _link(teachers, "user_id", user_ids), returning=True)
+            db.commit()
+            progress.advance(len(users), 2 * len(users))
+        progress.finish()
+        counts["users"] += teacher_count
+        counts["teachers"] = teacher_count
+
+        # Les lots de matières sont comptés en classes (environ 8 matières par classe)
+        progress = SeedProgress("classes avec leurs matières", classe_count)
+        tasks = [(seed, *bounds, teacher_count) for bounds in chunks(classe_count, max(1, chunk_size // 8))]
+        for (_, _, start, stop, _), subjects in zip(tasks, generate_shards(pool, subject_rows, tasks, queue_size)):
+            _resolve(subjects, "teacher_index", "teacher_id", teacher_ids)
+            _insert(db, Subject, _resolve(subjects, "classe_index", "classe_id", classe_ids))
+            db.commit()
+            progress.advance(stop - start, len(subjects))
+            counts["subjects"] += len(subjects)
+        progress.finish()
+
+        progress = SeedProgress("étudiants inscrits", student_count)
+        tasks = [(seed, *bounds, password_hash, classe_count, teacher_count)
+                 for bounds in chunks(student_count, chunk_size)]
+        for users, students, enrollments in generate_shards(pool, student_rows, tasks, queue_size):
+            user_ids = _insert(db, User, users, returning=True)
+            student_ids = _insert(db, Student, _link(students, "user_id", user_ids), returning=True)
+            _link(enrollments, "student_id", student_ids)
+            _insert(db, Enrollment, _resolve(enrollments, "classe_index", "classe_id", classe_ids))
+            db.commit()
+            progress.advance(len(users), 3 * len(users))
+        progress.finish()
+        counts["users"] += student_count
+        counts["students"] = counts["enrollments"] = student_count
+
+        progress = SeedProgress("parents", parent_count)
+        tasks = [(seed, *bounds, password_hash, teacher_count + student_count)
+                 for bounds in chunks(parent_count, chunk_size)]
+        for users in generate_shards(pool, parent_rows, tasks, queue_size):
+            _insert(db, User, users)
+            db.commit()
+            progress.advance(len(users), len(users))
+        progress.finish()
+        counts["users"] += parent_count
+
+    # Mettre à jour les compteurs d'inscriptions des classes
+    reconcile_enrollment_counters(db)
+
+    # Invalider les ETags des données de référence
+    bump_version(db, *VERSIONED_TABLES)
+    return counts
+
+
+def seed_database(scale: int = 1, seed: int = 42, chunk_size: Optional[int] = None,
+                  workers: Optional[int] = None):
     """Fonction principale pour peupler la base de données."""
-    print("🌱 Début du peuplement de la base de données...")
-    
+    print(f"🌱 Début du peuplement de la base de données (échelle {scale}, graine {seed})...")
+    start = time.perf_counter()
+
     # Créer une session
     db = SessionLocal()
-    
+
     try:
-        # 1. Créer l'administrateur
-        admin = create_admin_user(db)
-        
-        # 2. Créer les utilisateurs
-        teacher_users = create_fake_users(db, 15, UserRole.TEACHER)
-        student_users = create_fake_users(db, 100, UserRole.STUDENT)
-        parent_users = create_fake_users(db, 50, UserRole.PARENT)
-        
-        # 3. Créer les profils enseignants
-        teachers = create_fake_teachers(db, teacher_users)
-        
-        # 4. Créer les profils étudiants
-        students = create_fake_students(db, student_users)
-        
-        # 5. Créer les classes
-        classes = create_fake_classes(db)
-        
-        # 6. Créer les matières
-        subjects = create_fake_subjects(db, classes, teachers)
-        
-        # 7. Créer les inscriptions
-        enrollments = create_fake_enrollments(db, students, classes)
-        
+        counts = generate_dataset(db, scale=scale, seed=seed, chunk_size=chunk_size, workers=workers)
+        elapsed = time.perf_counter() - start
+        total = sum(counts.values())
+
         print("\n🎉 Peuplement terminé avec succès !")
-        print(f"📊 Résumé:")
+        print(f"📊 Résumé ({total} lignes en {elapsed:.1f} s, {total / elapsed:,.0f} lignes/s):")
         print(f"   - 1 administrateur")
-        print(f"   - {len(teacher_users)} enseignants")
-        print(f"   - {len(student_users)} étudiants")
-        print(f"   - {len(parent_users)} parents")
-        print(f"   - {len(classes)} classes")
-        print(f"   - {len(subjects)} matières")
-        print(f"   - {len(enrollments)} inscriptions")
-        
+        print(f"   - {counts['teachers']} enseignants")
+        print(f"   - {counts['students']} étudiants")
+        print(f"   - {PARENTS_PER_SCALE * scale} parents")
+        print(f"   - {counts['classes']} classes")
+        print(f"   - {counts['subjects']} matières")
+        print(f"   - {counts['enrollments']} inscriptions")
+
         print(f"\n🔑 Compte administrateur:")
         print(f"   Email: admin@ecole-prive.fr")
         print(f"   Mot de passe: admin123")
-        
+        print(f"   Autres comptes: mot de passe {DEMO_PASSWORD}")
+
     except Exception as e:
         print(f"❌ Erreur lors du peuplement: {e}")
         db.rollback()
@@ -320,5 +488,21 @@ def seed_database():
         db.close()
 
 
+def add_seed_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Options du générateur (seed.py, reset_db.py)."""
+    parser.add_argument("--scale", type=int, default=1, help="facteur d'échelle (1 = 100 étudiants)")
+    parser.add_argument("--seed", type=int, default=42, help="graine des générateurs (jeu reproductible)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help=f"lignes par lot d'insertion (défaut : SEED_CHUNK_SIZE={settings.seed_chunk_size})")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processus de génération des lots (défaut : SEED_WORKERS, sinon un par cœur)")
+    return parser
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Peupler la base avec des données fictives")
+    return add_seed_arguments(parser).parse_args(argv)
+
+
 if __name__ == "__main__":
-    seed_database()
+    seed_database(**vars(parse_args()))
@@ -0,0 +1,95 @@
+"""
+Sérialisation des listes et des sélections de champs
+
+Par défaut, FastAPI valide chaque ligne avec le `response_model` (y compris
+les `EmailStr`) puis l'encode avec le module json. En mode rapide
+(`FAST_SERIALIZATION=true`), les colonnes des lignes ORM, écrites par
+l'application elle-même, sont lues directement et encodées en octets JSON par
+pydantic-core, sans validation de sortie. Le JSON produit est le même (dates
+ISO, énumérations par valeur).
+
+Une sélection de champs (`?fields=`) est encodée ici avec un schéma partiel,
+le `response_model` complet ne pouvant pas valider une réponse restreinte.
+"""
+
+from functools import lru_cache
+from operator import attrgetter
+from typing import Iterable, List, Mapping, Tuple, Type
+
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+from pydantic_core import to_json
+from .config import settings
+from .fieldsets import ALL_FIELDS, FieldSet
+
+
+@lru_cache(maxsize=None)
+def _columns(schema: Type[BaseModel]):
+    """Champs du schéma et lecteur de ces attributs sur une ligne ORM."""
+    fields = tuple(schema.model_fields)
+    return fields, attrgetter(*fields)
+
+
+@lru_cache(maxsize=None)
+def partial_schema(schema: Type[BaseModel], names: Tuple[str, ...]) -> Type[BaseModel]:
+    """Schéma réduit aux champs `names` (mêmes types et valeurs par défaut)."""
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (field.annotation, field) for name, field in schema.model_fields.items() if name in names},
+    )
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema: Type[BaseModel], many: bool) -> TypeAdapter:
+    return TypeAdapter(List[schema] if many else schema)
+
+
+def _row(fields, getter, row) -> dict:
+    if isinstance(row, Mapping):
+        return {name: row[name] for name in fields}
+    values = getter(row)
+    return dict(zip(fields, values if len(fields) > 1 else (values,)))
+
+
+def dump_json(schema: Type[BaseModel], rows: Iterable) -> bytes:
+    """Encoder des lignes ORM (ou des dicts déjà sérialisés) en tableau JSON, sans validation."""
+    fields, getter = _columns(schema)
+    return to_json([_row(fields, getter, row) for row in rows])
+
+
+def _encode(schema: Type[BaseModel], content, many: bool) -> bytes:
+    if settings.fast_serialization:
+        if many:
+            return dump_json(schema, content)
+        fields, getter = _columns(schema)
+        return to_json(_row(fields, getter, content))
+    adapter = _adapter(schema, many)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def _json_response(body: bytes, response: Response) -> Response:
+    encoded = Response(content=body, media_type="application/json")
+    encoded.raw_headers.extend(response.raw_headers)
+    return encoded
+
+
+def list_response(schema: Type[BaseModel], rows: list, response: Response, fields: FieldSet = ALL_FIELDS):
+    """Résultat d'un endpoint `response_model=List[schema]`.
+
+    Sans sélection de champs ni mode rapide : les lignes, validées et encodées
+    par FastAPI. Sinon : une réponse JSON déjà encodée, qui reprend les
+    en-têtes posés sur `response` (curseur, ETag).
+    """
+    if fields.names is None and not settings.fast_serialization:
+        return rows
+    if fields.names is not None:
+        schema = partial_schema(schema, fields.names)
+    return _json_response(_encode(schema, rows, many=True), response)
+
+
+def item_response(schema: Type[BaseModel], row, response: Response, fields: FieldSet = ALL_FIELDS):
+    """Équivalent de `list_response` pour un endpoint de détail (la sélection seule change l'encodage)."""
+    if fields.names is None:
+        return row
+    return _json_response(_encode(partial_schema(schema, fields.names), row, many=False), response)
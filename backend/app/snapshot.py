@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Instantanés des données : enregistrer un jeu peuplé une fois, le restaurer en quelques secondes
+
+    python -m app.snapshot dump snapshots/ecole.snapshot
+    python -m app.snapshot restore snapshots/ecole.snapshot
+
+- PostgreSQL : archive zip (un flux `COPY ... TO STDOUT` compressé par table
+  et un manifeste des colonnes). La restauration vide les tables
+  (`TRUNCATE ... RESTART IDENTITY CASCADE`), recharge chaque table par
+  `COPY ... FROM STDIN` dans la même transaction puis recale les séquences.
+- SQLite : copie compacte de la base (`VACUUM INTO`), restaurée par l'API de
+  sauvegarde de SQLite (copie page à page, index de recherche compris).
+
+Les versions des tables de référence sont incrémentées après une restauration :
+un ETag émis avant ne peut pas désigner les données restaurées.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+import zipfile
+from typing import Dict
+
+from sqlalchemy import select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from .clear_data import data_tables, truncate_statement
+from .database import engine as default_engine
+from .models.table_version import TableVersion, VERSIONED_TABLES
+from .table_versions import bump_version
+
+MANIFEST = "manifest.json"
+_ZIP_MAGIC = b"PK\x03\x04"
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+
+
+def _dump_postgresql(engine: Engine, path: str) -> None:
+    # Tables référencées d'abord : l'ordre de la restauration
+    tables = list(reversed(data_tables()))
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        # Une seule transaction en lecture : toutes les tables au même instant
+        cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY")
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            manifest = {"dialect": "postgresql", "tables": {t.name: [c.name for c in t.columns] for t in tables}}
+            archive.writestr(MANIFEST, json.dumps(manifest))
+            for table in tables:
+                columns = ", ".join(f'"{column.name}"' for column in table.columns)
+                with archive.open(f"{table.name}.copy", "w") as stream:
+                    cursor.copy_expert(f'COPY "{table.name}" ({columns}) TO STDOUT', stream)
+        raw.rollback()
+    finally:
+        raw.close()
+
+
+def _restore_postgresql(engine: Engine, path: str) -> None:
+    with zipfile.ZipFile(path) as archive, engine.begin() as connection:
+        manifest = json.loads(archive.read(MANIFEST))
+        # Vidées dans la même transaction : COPY peut alors se passer du WAL (wal_level=minimal)
+        connection.exec_driver_sql(truncate_statement(data_tables()))
+        cursor = connection.connection.cursor()
+        for name, columns in manifest["tables"].items():
+            column_list = ", ".join(f'"{column}"' for column in columns)
+            with archive.open(f"{name}.copy") as stream:
+                cursor.copy_expert(f'COPY "{name}" ({column_list}) FROM STDIN', stream)
+            if "id" in columns:
+                connection.exec_driver_sql(
+                    f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), COALESCE(MAX(id), 0) + 1, false) "
+                    f'FROM "{name}"'
+                )
+
+
+def _dump_sqlite(engine: Engine, path: str) -> None:
+    with engine.connect() as connection:
+        connection.exec_driver_sql("VACUUM INTO ?", (path,))
+
+
+def _restore_sqlite(engine: Engine, path: str) -> None:
+    source = sqlite3.connect(path)
+    raw = engine.raw_connection()
+    try:
+        source.backup(raw.driver_connection)
+    finally:
+        raw.close()
+        source.close()
+
+
+def _versions(engine: Engine) -> Dict[str, int]:
+    with Session(engine) as db:
+        return dict(db.execute(select(TableVersion.name, TableVersion.version)).all())
+
+
+def dump_snapshot(path: str, engine: Engine = default_engine) -> int:
+    """Enregistrer les données de la base dans `path`; renvoie la taille du fichier en octets."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if os.path.exists(path):
+        os.remove(path)
+    dialect = engine.dialect.name
+    if dialect == "postgresql":
+        _dump_postgresql(engine, path)
+    elif dialect == "sqlite":
+        _dump_sqlite(engine, path)
+    else:
+        raise ValueError(f"Instantanés non pris en charge pour {dialect}")
+    return os.path.getsize(path)
+
+
+def restore_snapshot(path: str, engine: Engine = default_engine) -> None:
+    """Remplacer les données de la base par celles de l'instantané `path` (même dialecte)."""
+    with open(path, "rb") as snapshot:
+        header = snapshot.read(len(_SQLITE_MAGIC))
+    dialect = engine.dialect.name
+    expected = {"postgresql": _ZIP_MAGIC, "sqlite": _SQLITE_MAGIC}.get(dialect)
+    if expected is None or not header.startswith(expected):
+        raise ValueError(f"{path} n'est pas un instantané {dialect}")
+
+    before = _versions(engine)
+    if dialect == "postgresql":
+        _restore_postgresql(engine, path)
+    else:
+        _restore_sqlite(engine, path)
+
+    with Session(engine) as db:
+        # SQLite restaure aussi table_versions : repartir des versions d'avant la restauration
+        for name, version in before.items():
+            db.execute(update(TableVersion).where(TableVersion.name == name).values(version=version))
+        db.commit()
+        bump_version(db, *VERSIONED_TABLES)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enregistrer ou restaurer un instantané des données")
+    parser.add_argument("action", choices=["dump", "restore"])
+    parser.add_argument("path")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.action == "dump":
+        size = dump_snapshot(args.path)
+        print(f"📸 Instantané enregistré : {args.path} ({size / 1e6:.1f} Mo, {time.perf_counter() - start:.1f} s)")
+    else:
+        restore_snapshot(args.path)
+        print(f"✅ Instantané restauré : {args.path} ({time.perf_counter() - start:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Versions par table et requêtes GET conditionnelles (ETag faible / If-None-Match)
+
+Chaque écriture sur une table de référence (classes, matières) incrémente sa
+version après le commit. Les réponses de lecture portent `ETag: W/"<table>.<version>"` ;
+si le client renvoie cet ETag dans `If-None-Match`, la réponse est un 304 vide,
+obtenu par une lecture de clé primaire, sans la requête de données ni la
+sérialisation.
+
+L'incrément suit le commit : un lecteur peut voir les nouvelles données avec
+l'ancienne version (le client relira une fois de plus), jamais l'inverse.
+"""
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from .database import get_async_read_db, get_read_db
+from .models.table_version import TableVersion
+from .models.user import User
+from .reference_cache import publish_invalidation, remember_version, signal_invalidation
+from .auth import get_current_active_user, get_current_active_user_async
+
+
+def get_version(db: Session, table: str) -> int:
+    return db.execute(select(TableVersion.version).where(TableVersion.name == table)).scalar() or 0
+
+
+def bump_version(db: Session, *tables: str) -> None:
+    """Incrémenter la version des tables, dans une transaction courte (à appeler après le commit).
+
+    Invalide aussi le cache de référence, localement et sur les autres workers.
+    """
+    for table in tables:
+        db.execute(
+            update(TableVersion)
+            .where(TableVersion.name == table)
+            .values(version=TableVersion.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+    publish_invalidation(db, tables)
+    db.commit()
+    signal_invalidation(db, tables)
+
+
+def etag_for(table: str, version: int) -> str:
+    return f'W/"{table}.{version}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    # Comparaison faible : les préfixes W/ sont ignorés
+    return "*" in candidates or etag.removeprefix("W/") in {c.removeprefix("W/") for c in candidates}
+
+
+def _check(request: Request, response: Response, table: str, version: int) -> None:
+    remember_version(request, table, version)
+    etag = etag_for(table, version)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+
+def conditional_get(table: str):
+    """Dépendance : publier l'ETag de `table`, ou répondre 304 s'il correspond à `If-None-Match`.
+
+    L'authentification est vérifiée d'abord : sans token valide, la réponse reste 401.
+    """
+    def dependency(
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_read_db),
+        current_user: User = Depends(get_current_active_user),
+    ) -> None:
+        _check(request, response, table, get_version(db, table))
+
+    return dependency
+
+
+def conditional_get_async(table: str):
+    """Équivalent de `conditional_get` pour les routeurs asynchrones."""
+    async def dependency(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_read_db),
+        current_user: User = Depends(get_current_active_user_async),
+    ) -> None:
+        version = (await db.execute(select(TableVersion.version).where(TableVersion.name == table))).scalar()
+        _check(request, response, table, version or 0)
+
+    return dependency
@@ -0,0 +1,80 @@
+"""
+Charge horaire hebdomadaire des enseignants, calculée en une requête GROUP BY
+
+Le résultat complet (quelques octets par enseignant) est mis en cache et
+invalidé à chaque création, modification ou suppression de matière ou
+d'enseignant, sur tous les workers : `bump_version(db, "subjects")` et
+`broadcast_invalidation(db, "teachers")` passent par le canal de
+`app.reference_cache`. La durée de vie borne le décalage si une
+notification est perdue. Le calcul se fait toujours sur la base principale :
+juste après une invalidation, une réplique en retard remettrait en cache des
+charges périmées pour toute la durée de vie.
+"""
+
+import threading
+from typing import Dict, Optional
+
+from sqlalchemy import distinct, func, select
+from sqlalchemy.orm import Session
+from .cache import TTLCache
+from .config import settings
+from .models.subject import Subject
+from .models.teacher import Teacher
+
+workload_cache = TTLCache(1, settings.workload_cache_ttl_seconds)
+_ALL = "all"
+
+# Incrémentée à chaque invalidation : un calcul commencé avant une écriture
+# n'est pas mis en cache
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def invalidate_workloads() -> None:
+    """Oublier les charges en cache (à appeler après un commit sur subjects/teachers)."""
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        workload_cache.clear()
+
+
+def compute_workloads(db: Session) -> Dict[int, dict]:
+    """Calculer la charge de tous les enseignants en une seule requête agrégée."""
+    stmt = (
+        select(
+            Teacher.id,
+            func.coalesce(func.sum(Subject.hours_per_week), 0),
+            func.count(Subject.id),
+            func.count(distinct(Subject.classe_id)),
+        )
+        .select_from(Teacher)
+        .outerjoin(Subject, Subject.teacher_id == Teacher.id)
+        .group_by(Teacher.id)
+        .order_by(Teacher.id)
+    )
+    return {
+        teacher_id: {
+            "teacher_id": teacher_id,
+            "total_hours_per_week": hours,
+            "subject_count": subjects,
+            "classe_count": classes,
+        }
+        for teacher_id, hours, subjects, classes in db.execute(stmt)
+    }
+
+
+def get_workloads(db: Session) -> Dict[int, dict]:
+    """Charges de tous les enseignants, depuis le cache si possible."""
+    workloads = workload_cache.get(_ALL)
+    if workloads is None:
+        generation = _generation
+        workloads = compute_workloads(db)
+        with _generation_lock:
+            if generation == _generation:
+                workload_cache.set(_ALL, workloads)
+    return workloads
+
+
+def get_workload(db: Session, teacher_id: int) -> Optional[dict]:
+    """Charge d'un enseignant, ou None s'il n'existe pas."""
+    return get_workloads(db).get(teacher_id)
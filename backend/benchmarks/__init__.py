@@ -0,0 +1 @@
+# Benchmarks de performance (à lancer depuis backend/ : python -m benchmarks.<nom>)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark : débit des lectures en mode synchrone vs asynchrone (DB_ASYNC_MODE)
+
+Chaque mode tourne dans un sous-processus (le mode est lu à l'import de l'application)
+sur la même base SQLite, avec `--concurrency` requêtes simultanées.
+
+    python -m benchmarks.bench_async_mode --requests 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def run_mode(args):
+    """Exécuté dans le sous-processus : mesure le débit d'un mode."""
+    import httpx
+
+    from app.auth import create_access_token
+    from app.main import app
+    from .common import summarize
+
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'bench'})}"}
+    durations = []
+
+    async def worker(client, count):
+        for _ in range(count):
+            start = time.perf_counter()
+            response = await client.get("/students/?limit=20", headers=headers)
+            durations.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+
+    async def main():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            per_worker = args.requests // args.concurrency
+            start = time.perf_counter()
+            await asyncio.gather(*(worker(client, per_worker) for _ in range(args.concurrency)))
+            return time.perf_counter() - start
+
+    elapsed = asyncio.run(main())
+    print(json.dumps({"rps": round(len(durations) / elapsed, 1), **summarize(durations)}))
+
+
+def seed(database_url: str, students: int):
+    from datetime import date
+    from sqlalchemy import insert
+    from app.models.student import Student
+    from app.models.user import User, UserRole
+    from .common import make_engine
+
+    engine = make_engine(database_url)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{
+            "email": "bench@ecole-prive.fr", "username": "bench", "first_name": "Bench",
+            "last_name": "User", "hashed_password": "x", "role": UserRole.ADMIN, "is_active": True,
+        }])
+        conn.execute(insert(Student), [
+            {"user_id": i + 1, "student_number": f"ETU{i:06d}", "date_of_birth": date(2010, 1, 1)}
+            for i in range(students)
+        ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--run-mode", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_mode:
+        run_mode(args)
+        return
+
+    database_url = os.environ.get("DATABASE_URL") or \
+        f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='ecole_bench_'), 'bench.db')}"
+    seed(database_url, args.students)
+
+    for async_mode in ("false", "true"):
+        env = {**os.environ, "DATABASE_URL": database_url, "DB_ASYNC_MODE": async_mode}
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_async_mode", "--run-mode",
+             "--requests", str(args.requests), "--concurrency", str(args.concurrency)],
+            env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        label = "asynchrone" if async_mode == "true" else "synchrone"
+        print(f"{label:>11} : {result}")
+
+
+if __name__ == "__main__":
+    main()
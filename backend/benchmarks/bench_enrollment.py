@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark : N inscriptions simultanées sur une classe de M places
+
+Vérifie qu'exactement M inscriptions réussissent et mesure leur latence.
+
+    python -m benchmarks.bench_enrollment --parallel 200 --seats 30
+    python -m benchmarks.bench_enrollment --database-url postgresql://...
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from fastapi import HTTPException
+from sqlalchemy import insert, select
+
+from app.models.classe import Classe
+from app.models.student import Student
+from app.routers.enrollments import enroll_student
+from app.schemas.enrollment import EnrollmentCreate
+from .common import make_engine, make_session_factory, summarize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parallel", type=int, default=200)
+    parser.add_argument("--seats", type=int, default=30)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    SessionLocal = make_session_factory(engine)
+    suffix = int(time.time())
+    with engine.begin() as conn:
+        classe_id = conn.execute(
+            insert(Classe).returning(Classe.id),
+            {"name": f"Bench {suffix}", "level": "CP", "academic_year": "2024-2025", "max_students": args.seats},
+        ).scalar()
+        first_id = conn.execute(select(Student.id).order_by(Student.id.desc())).scalar() or 0
+        conn.execute(insert(Student), [
+            {"user_id": first_id + i + 1, "student_number": f"BENCH{suffix}{i:05d}", "date_of_birth": date(2012, 1, 1)}
+            for i in range(args.parallel)
+        ])
+        student_ids = conn.execute(
+            select(Student.id).where(Student.student_number.like(f"BENCH{suffix}%"))
+        ).scalars().all()
+
+    def attempt(student_id):
+        start = time.perf_counter()
+        with SessionLocal() as db:
+            try:
+                enroll_student(db, EnrollmentCreate(student_id=student_id, classe_id=classe_id))
+                accepted = True
+            except HTTPException:
+                accepted = False
+        return accepted, (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        results = list(executor.map(attempt, student_ids))
+    elapsed = time.perf_counter() - start
+
+    accepted = sum(1 for ok, _ in results if ok)
+    print(f"{accepted} inscriptions acceptées pour {args.seats} places ({len(results)} tentatives)")
+    print(f"latence : {summarize([duration for _, duration in results])}")
+    print(f"débit   : {len(results) / elapsed:.1f} tentatives/s")
+    if accepted != min(args.seats, args.parallel):
+        raise SystemExit("❌ capacité non respectée")
+
+
+if __name__ == "__main__":
+    main()
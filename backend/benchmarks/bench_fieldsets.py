@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark : page de 10 000 lignes, complète ou limitée par `?fields=`
+
+    python -m benchmarks.bench_fieldsets --rows 10000 --repeat 10
+    python -m benchmarks.bench_fieldsets --database-url postgresql://...
+
+Pour les étudiants et les enseignants (dont les colonnes Text `medical_info`
+et `qualifications` sont volumineuses), compare la taille de la réponse et la
+latence de GET /<entité>/?limit=<rows> avec et sans sélection de champs.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import date
+
+PAGES = {
+    "students": "id,student_number",
+    "teachers": "id,employee_number,hire_date",
+}
+
+
+def seed(engine, rows: int):
+    from sqlalchemy import insert
+
+    from app.models.student import Student
+    from app.models.teacher import Teacher
+    from app.models.user import User, UserRole
+
+    with engine.begin() as conn:
+        user_ids = conn.execute(insert(User).returning(User.id), [
+            {"email": f"bench{i}@ecole-prive.fr", "username": f"bench{i}", "first_name": "Bench",
+             "last_name": f"Nom{i}", "hashed_password": "x",
+             "role": UserRole.STUDENT if i < rows else UserRole.TEACHER}
+            for i in range(2 * rows)
+        ]).scalars().all()
+        conn.execute(insert(Student), [
+            {"user_id": user_ids[i], "student_number": f"ETU{i:06d}", "date_of_birth": date(2012, 1 + i % 12, 1),
+             "medical_info": f"Dossier médical n°{i} : " + "allergie aux arachides, " * 20}
+            for i in range(rows)
+        ])
+        conn.execute(insert(Teacher), [
+            {"user_id": user_ids[rows + i], "employee_number": f"ENS{i:06d}", "hire_date": date(2010, 9, 1),
+             "qualifications": f"Dossier n°{i} : " + "CAPES de lettres modernes, " * 20}
+            for i in range(rows)
+        ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    # La base est configurée à l'import de l'application
+    os.environ["DATABASE_URL"] = args.database_url or (
+        f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='ecole_bench_'), 'bench.db')}"
+    )
+    import httpx
+
+    from app.auth import create_access_token
+    from app.database import Base, SessionLocal, engine
+    from app.main import app
+    from app.models.user import User, UserRole
+    from .common import summarize
+
+    Base.metadata.create_all(bind=engine)
+    seed(engine, args.rows)
+    with SessionLocal() as db:
+        db.add(User(email="bench-admin@ecole-prive.fr", username="bench-admin", first_name="Bench",
+                    last_name="Admin", hashed_password="x", role=UserRole.ADMIN))
+        db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'bench-admin'})}"}
+
+    async def measure(client, url):
+        durations, size = [], 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            response = await client.get(url, headers=headers)
+            durations.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+            assert len(response.json()) == args.rows, url
+            size = len(response.content)
+        return size, summarize(durations)["p50_ms"]
+
+    async def run():
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                await client.get("/users/me", headers=headers)  # authentification mise en cache
+                print(f"{'page':45s} {'octets':>11s} {'p50 (ms)':>9s}   ({args.rows} lignes)")
+                for entity, fields in PAGES.items():
+                    full = await measure(client, f"/{entity}/?limit={args.rows}")
+                    sparse = await measure(client, f"/{entity}/?limit={args.rows}&fields={fields}")
+                    print(f"{'/' + entity + '/':45s} {full[0]:11d} {full[1]:9.1f}")
+                    print(f"{'/' + entity + '/?fields=' + fields:45s} {sparse[0]:11d} {sparse[1]:9.1f}"
+                          f"   -{1 - sparse[0] / full[0]:.0%} octets, x{full[1] / sparse[1]:.1f}")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
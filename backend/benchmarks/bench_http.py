@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Banc de charge HTTP : débit et latences par scénario, en JSON comparable d'un commit à l'autre
+
+    python -m benchmarks.bench_http --scale 10 --output results/HEAD.json
+    python -m benchmarks.bench_http --database-url postgresql://... --scenarios login_storm,pagination
+    python -m benchmarks.bench_http --base-url http://localhost:8000 --database-url postgresql://...
+    python -m benchmarks.bench_http --compare results/avant.json results/après.json
+
+Le banc vide la base, la peuple avec `seed_data` (échelle `--scale`, ou
+restaure `--snapshot` s'il existe) puis envoie les requêtes avec un client
+httpx asynchrone : à l'application en processus (ASGI) par défaut, ou au
+serveur `--base-url` démarré sur la même base. Scénarios :
+
+- login_storm : connexions simultanées (bcrypt) sur les comptes générés ;
+- pagination : parcours des listes par curseur (X-Next-Cursor) ;
+- detail_reads : lectures par id (étudiants, utilisateurs, enseignants, classes) ;
+- bulk_writes : créations de classes par lots (POST /classes/bulk) ;
+- enrollment_contention : inscriptions simultanées dans une classe de `--seats`
+  places (201 ou 409, exactement `--seats` acceptées).
+
+Base SQLite temporaire par défaut. ⚠️ La base `--database-url` est vidée.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+
+class Recorder:
+    """Latence (ms) et code HTTP de chaque requête d'un scénario."""
+
+    def __init__(self):
+        self.durations: List[float] = []
+        self.statuses: Counter = Counter()
+
+    async def __call__(self, request: Awaitable):
+        start = time.perf_counter()
+        response = await request
+        self.durations.append((time.perf_counter() - start) * 1000)
+        self.statuses[response.status_code] += 1
+        return response
+
+
+class Scenario(NamedTuple):
+    # run(ctx, client, worker, count, record) : `count` requêtes d'un client virtuel
+    run: Callable
+    default_requests: int
+    expected: tuple  # codes HTTP attendus; les autres sont comptés en erreurs
+    setup: Optional[Callable] = None  # préparation asynchrone (ctx, client), hors mesure
+    check: Optional[Callable] = None  # vérification du résultat (ctx, statuts) -> message d'échec ou None
+
+
+async def login_storm(ctx, client, worker, count, record):
+    rng = random.Random(worker)
+    for _ in range(count):
+        await record(client.post("/auth/login", data={"username": rng.choice(ctx["usernames"]),
+                                                      "password": ctx["password"]}))
+
+
+PAGINATED = ["/students/?limit=100", "/users/?limit=100", "/enrollments/?limit=100", "/users/?limit=100&sort=last_name"]
+
+
+async def pagination(ctx, client, worker, count, record):
+    url, cursor = PAGINATED[worker % len(PAGINATED)], None
+    for _ in range(count):
+        response = await record(client.get(url + (f"&cursor={cursor}" if cursor else ""), headers=ctx["headers"]))
+        # Fin de la liste : on recommence au début
+        cursor = response.headers.get("X-Next-Cursor")
+
+
+async def detail_reads(ctx, client, worker, count, record):
+    rng = random.Random(worker)
+    for _ in range(count):
+        prefix, ids = rng.choice(ctx["details"])
+        await record(client.get(f"{prefix}{rng.choice(ids)}", headers=ctx["headers"]))
+
+
+async def bulk_writes(ctx, client, worker, count, record):
+    for i in range(count):
+        batch = [
+            {"name": f"Charge {ctx['run']}-{worker}-{i}-{k}", "level": "CP", "academic_year": "2024-2025"}
+            for k in range(ctx["batch"])
+        ]
+        await record(client.post("/classes/bulk", json=batch, headers=ctx["headers"]))
+
+
+async def setup_contention(ctx, client):
+    response = await client.post("/classes/", headers=ctx["headers"], json={
+        "name": f"Contention {ctx['run']}", "level": "CP", "academic_year": "2024-2025",
+        "max_students": ctx["seats"],
+    })
+    response.raise_for_status()
+    ctx["contention_classe"] = response.json()["id"]
+    ctx["contenders"] = iter(ctx["student_ids"])
+
+
+async def enrollment_contention(ctx, client, worker, count, record):
+    for _ in range(count):
+        student_id = next(ctx["contenders"])
+        await record(client.post("/enrollments/", headers=ctx["headers"],
+                                 json={"student_id": student_id, "classe_id": ctx["contention_classe"]}))
+
+
+def check_contention(ctx, statuses: Counter) -> Optional[str]:
+    attempts = sum(statuses.values())
+    if statuses[201] != min(ctx["seats"], attempts):
+        return f"{statuses[201]} inscriptions acceptées pour {ctx['seats']} places"
+    return None
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "login_storm": Scenario(login_storm, 100, (200,)),
+    "pagination": Scenario(pagination, 1000, (200,)),
+    "detail_reads": Scenario(detail_reads, 2000, (200,)),
+    "bulk_writes": Scenario(bulk_writes, 100, (200,)),
+    "enrollment_contention": Scenario(enrollment_contention, 300, (201, 409), setup_contention, check_contention),
+}
+
+
+async def run_scenario(scenario: Scenario, ctx: dict, client, requests: int, concurrency: int) -> dict:
+    from .common import summarize
+
+    if scenario.setup:
+        await scenario.setup(ctx, client)
+    record = Recorder()
+    quotas = [requests // concurrency + (worker < requests % concurrency) for worker in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        scenario.run(ctx, client, worker, count, record) for worker, count in enumerate(quotas) if count
+    ))
+    elapsed = time.perf_counter() - start
+    result = {
+        "requests": len(record.durations),
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(len(record.durations) / elapsed, 1),
+        **summarize(record.durations),
+        "statuses": {str(code): count for code, count in sorted(record.statuses.items())},
+        "errors": sum(count for code, count in record.statuses.items() if code not in scenario.expected),
+    }
+    failure = scenario.check(ctx, record.statuses) if scenario.check else None
+    if failure:
+        result["failure"] = failure
+    return result
+
+
+def prepare_database(args) -> dict:
+    """Vider et peupler la base (ou restaurer l'instantané), puis tirer les ids utilisés par les scénarios."""
+    from sqlalchemy import select
+
+    from app.auth import create_access_token
+    from app.clear_data import truncate_tables
+    from app.database import Base, SessionLocal, engine
+    from app.models import Classe, Student, Teacher, User
+    from app.models.user import UserRole
+    from app.seed_data import DEMO_PASSWORD, generate_dataset
+    from app.snapshot import dump_snapshot, restore_snapshot
+
+    Base.metadata.create_all(bind=engine)
+    start = time.perf_counter()
+    if args.snapshot and os.path.exists(args.snapshot):
+        restore_snapshot(args.snapshot)
+    else:
+        with engine.begin() as connection:
+            truncate_tables(connection)
+        with SessionLocal() as db:
+            generate_dataset(db, scale=args.scale, seed=args.seed)
+        if args.snapshot:
+            dump_snapshot(args.snapshot)
+    print(f"\n📦 Jeu de données prêt en {time.perf_counter() - start:.1f} s")
+
+    def sample(db, column, *where):
+        return db.execute(select(column).where(*where).order_by(column).limit(args.sample)).scalars().all()
+
+    with SessionLocal() as db:
+        student_ids = db.execute(select(Student.id).order_by(Student.id)).scalars().all()
+        return {
+            "headers": {"Authorization": f"Bearer {create_access_token(data={'sub': 'admin'})}"},
+            "password": DEMO_PASSWORD,
+            "usernames": sample(db, User.username, User.role != UserRole.ADMIN),
+            "details": [
+                ("/students/", student_ids[:args.sample]),
+                ("/users/", sample(db, User.id)),
+                ("/teachers/", sample(db, Teacher.id)),
+                ("/classes/", sample(db, Classe.id)),
+            ],
+            "student_ids": student_ids,
+            "seats": args.seats,
+            "batch": args.batch,
+            "run": int(time.time()),
+        }
+
+
+async def run_all(args, ctx: dict, names: List[str]) -> dict:
+    import httpx
+
+    from app.main import app
+
+    async def run(client):
+        # Requête préalable : authentification et caches chauds
+        (await client.get("/users/me", headers=ctx["headers"])).raise_for_status()
+        results = {}
+        for name in names:
+            scenario = SCENARIOS[name]
+            requests = args.requests or scenario.default_requests
+            if name == "enrollment_contention":
+                requests = min(requests, len(ctx["student_ids"]))
+            results[name] = await run_scenario(scenario, ctx, client, requests, args.concurrency)
+            print_result(name, results[name])
+        return results
+
+    timeout = httpx.Timeout(args.timeout)
+    if args.base_url:
+        limits = httpx.Limits(max_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=timeout, limits=limits) as client:
+            return await run(client)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=timeout) as client:
+            return await run(client)
+
+
+def print_result(name: str, result: dict) -> None:
+    status = f"❌ {result['failure']}" if "failure" in result else ("❌" if result["errors"] else "✅")
+    print(f"{name:22s} {result['rps']:9.1f} {result['p50_ms']:9.1f} {result['p95_ms']:9.1f} {result['p99_ms']:9.1f}"
+          f"  {result['statuses']} {status}")
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Afficher l'évolution du débit et des latences entre deux fichiers de résultats."""
+    with open(before_path) as before_file, open(after_path) as after_file:
+        before, after = json.load(before_file), json.load(after_file)
+    print(f"{before.get('commit') or before_path} → {after.get('commit') or after_path}")
+    print(f"{'scénario':22s} {'rps':>18s} {'p50 (ms)':>18s} {'p95 (ms)':>18s} {'p99 (ms)':>18s}")
+    for name in after["scenarios"]:
+        if name not in before["scenarios"]:
+            continue
+        old, new = before["scenarios"][name], after["scenarios"][name]
+        cells = [f"{old[key]:.1f}→{new[key]:.1f} {(new[key] / old[key] - 1) if old[key] else 0:+.0%}"
+                 for key in ("rps", "p50_ms", "p95_ms", "p99_ms")]
+        print(f"{name:22s} " + " ".join(f"{cell:>18s}" for cell in cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="scénarios séparés par des virgules")
+    parser.add_argument("--scale", type=int, default=10, help="échelle du jeu de données (10 = 1 000 étudiants)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--snapshot", default=None, help="instantané à restaurer (créé s'il n'existe pas)")
+    parser.add_argument("--requests", type=int, default=None, help="requêtes par scénario (défaut propre à chacun)")
+    parser.add_argument("--concurrency", type=int, default=20, help="clients virtuels simultanés")
+    parser.add_argument("--seats", type=int, default=30, help="places de la classe disputée")
+    parser.add_argument("--batch", type=int, default=50, help="classes par requête de bulk_writes")
+    parser.add_argument("--sample", type=int, default=1000, help="ids et comptes tirés pour les lectures")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--base-url", default=None, help="serveur à tester (par défaut : application en processus)")
+    parser.add_argument("--output", default="bench_http.json")
+    parser.add_argument("--compare", nargs=2, metavar=("AVANT", "APRÈS"), help="comparer deux fichiers de résultats")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"scénarios inconnus : {', '.join(sorted(unknown))}")
+
+    # La base est configurée à l'import de l'application
+    os.environ["DATABASE_URL"] = args.database_url or (
+        f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='ecole_bench_'), 'bench.db')}"
+    )
+    ctx = prepare_database(args)
+
+    print(f"\n{'scénario':22s} {'rps':>9s} {'p50 (ms)':>9s} {'p95 (ms)':>9s} {'p99 (ms)':>9s}  statuts")
+    results = asyncio.run(run_all(args, ctx, names))
+
+    report = {
+        "commit": git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "database": os.environ["DATABASE_URL"].split(":", 1)[0],
+        "target": args.base_url or "asgi",
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "scale": args.scale,
+        "concurrency": args.concurrency,
+        "scenarios": results,
+    }
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2, ensure_ascii=False)
+    print(f"\n📝 Résultats : {args.output}")
+    if any(result["errors"] or "failure" in result for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark : latence p99 d'un endpoint sans rapport (/health) pendant une vague de connexions
+
+    python -m benchmarks.bench_login_storm --logins 200 --probes 400
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+# La base de benchmark doit être configurée avant l'import de l'application
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='ecole_bench_'), 'bench.db')}"
+)
+
+import httpx  # noqa: E402
+
+from app.auth import get_password_hash  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from .common import summarize  # noqa: E402
+
+PASSWORD = "password123"
+
+
+def seed_users(count: int):
+    Base.metadata.create_all(bind=engine)
+    hashed_password = get_password_hash(PASSWORD)
+    with SessionLocal() as db:
+        db.query(User).delete()
+        db.add_all([
+            User(
+                email=f"storm{i}@ecole-prive.fr", username=f"storm{i}", first_name="Storm",
+                last_name=str(i), hashed_password=hashed_password, role=UserRole.STUDENT,
+            )
+            for i in range(count)
+        ])
+        db.commit()
+
+
+async def timed_get(client: httpx.AsyncClient, url: str, durations: list):
+    start = time.perf_counter()
+    response = await client.get(url)
+    durations.append((time.perf_counter() - start) * 1000)
+    response.raise_for_status()
+
+
+async def login(client: httpx.AsyncClient, username: str):
+    response = await client.post("/auth/login", data={"username": username, "password": PASSWORD})
+    response.raise_for_status()
+
+
+async def run(logins: int, probes: int, users: int):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        idle = []
+        await asyncio.gather(*(timed_get(client, "/health", idle) for _ in range(probes)))
+
+        storm = []
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(login(client, f"storm{i % users}") for i in range(logins)),
+            *(timed_get(client, "/health", storm) for _ in range(probes)),
+        )
+        elapsed = time.perf_counter() - start
+
+    print(f"exécuteur d'authentification : {settings.auth_executor_workers} threads")
+    print(f"/health au repos           : {summarize(idle)}")
+    print(f"/health pendant les logins : {summarize(storm)}")
+    print(f"{logins} connexions en {elapsed:.2f} s ({logins / elapsed:.1f} connexions/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--probes", type=int, default=400)
+    parser.add_argument("--users", type=int, default=20)
+    args = parser.parse_args()
+
+    seed_users(args.users)
+    asyncio.run(run(args.logins, args.probes, args.users))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark : latence d'une page selon sa profondeur, pagination par décalage vs par curseur
+
+    python -m benchmarks.bench_pagination --rows 200000 --limit 100
+"""
+
+import argparse
+from datetime import date
+
+from fastapi import Response
+from sqlalchemy import insert
+
+from app.models.student import Student
+from app.pagination import NEXT_CURSOR_HEADER, encode_cursor, paginate
+from .common import make_engine, make_session_factory, summarize, time_calls
+
+
+def seed_students(engine, rows: int, chunk: int = 10000):
+    with engine.begin() as conn:
+        for start in range(0, rows, chunk):
+            conn.execute(insert(Student), [
+                {
+                    "user_id": i + 1,
+                    "student_number": f"ETU{i + 1:08d}",
+                    "date_of_birth": date(2010, 1, 1),
+                    "parent_name": f"Parent {i}",
+                }
+                for i in range(start, min(start + chunk, rows))
+            ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    seed_students(engine, args.rows)
+    SessionLocal = make_session_factory(engine)
+
+    depths = [0, args.rows // 10, args.rows // 2, args.rows - args.limit - 1]
+    print(f"{'profondeur':>12} {'offset p50 (ms)':>16} {'curseur p50 (ms)':>17}")
+    with SessionLocal() as db:
+        for depth in depths:
+            # Le curseur équivalent à la profondeur : l'id de la ligne précédente
+            cursor = encode_cursor("id", [depth]) if depth else None
+
+            def offset_page():
+                paginate(db.query(Student), Response(), Student.id, skip=depth, limit=args.limit)
+
+            def cursor_page():
+                response = Response()
+                paginate(db.query(Student), response, Student.id, limit=args.limit, cursor=cursor)
+                assert NEXT_CURSOR_HEADER in response.headers
+
+            offset_stats = summarize(time_calls(offset_page, args.repeat))
+            cursor_stats = summarize(time_calls(cursor_page, args.repeat))
+            print(f"{depth:>12} {offset_stats['p50_ms']:>16} {cursor_stats['p50_ms']:>17}")
+
+
+if __name__ == "__main__":
+    main()
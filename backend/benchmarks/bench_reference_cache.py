@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark : débit de GET /classes/, /classes/{id} et /subjects/{id}, avec et sans cache de référence
+
+    python -m benchmarks.bench_reference_cache --classes 500 --subjects 5000 --requests 3000
+    python -m benchmarks.bench_reference_cache --database-url postgresql://...
+
+Chaque mode tourne dans un sous-processus (REFERENCE_CACHE_TTL_SECONDS=0 pour
+le mode sans cache) : le cache est configuré à l'import de l'application.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def run_mode(args) -> dict:
+    import httpx
+    from sqlalchemy import insert
+
+    from app.auth import create_access_token, get_password_hash
+    from app.database import Base, SessionLocal, engine
+    from app.main import app
+    from app.models.classe import Classe
+    from app.models.subject import Subject
+    from app.models.user import User, UserRole
+    from .common import summarize
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        classe_ids = conn.execute(insert(Classe).returning(Classe.id), [
+            {"name": f"Bench {i}", "level": f"N{i % 7}", "academic_year": "2024-2025"} for i in range(args.classes)
+        ]).scalars().all()
+        subject_ids = conn.execute(insert(Subject).returning(Subject.id), [
+            {"name": f"Matière {i % 23}", "code": f"BENCH-{args.mode}-{i}", "hours_per_week": 1 + i % 5,
+             "classe_id": classe_ids[i % len(classe_ids)]}
+            for i in range(args.subjects)
+        ]).scalars().all()
+    with SessionLocal() as db:
+        db.add(User(email=f"bench-{args.mode}@ecole-prive.fr", username=f"bench-{args.mode}", first_name="Bench",
+                    last_name="Admin", hashed_password=get_password_hash("password123"), role=UserRole.ADMIN))
+        db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': f'bench-{args.mode}'})}"}
+
+    rng = random.Random(42)
+    urls = [
+        rng.choice([
+            "/classes/",
+            f"/classes/{rng.choice(classe_ids)}",
+            f"/subjects/{rng.choice(subject_ids)}",
+            f"/subjects/?classe_id={rng.choice(classe_ids)}",
+        ])
+        for _ in range(args.requests)
+    ]
+
+    async def run():
+        durations = []
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def get(client, url):
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(url, headers=headers)
+                durations.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                await get(client, "/classes/")  # authentification mise en cache
+                start = time.perf_counter()
+                await asyncio.gather(*(get(client, url) for url in urls))
+                elapsed = time.perf_counter() - start
+        return {"rps": round(len(urls) / elapsed, 1), **summarize(durations)}
+
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--classes", type=int, default=500)
+    parser.add_argument("--subjects", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--mode", choices=["cache", "no-cache"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args)))
+        return
+
+    results = {}
+    for mode in ("no-cache", "cache"):
+        env = dict(os.environ)
+        env["DATABASE_URL"] = args.database_url or (
+            f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='ecole_bench_'), 'bench.db')}"
+        )
+        env["REFERENCE_CACHE_TTL_SECONDS"] = "0" if mode == "no-cache" else "300"
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_reference_cache", "--mode", mode, *sys.argv[1:]],
+            env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+        print(f"{mode:9s}: {results[mode]}")
+    print(f"gain de débit : x{results['cache']['rps'] / results['no-cache']['rps']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark : réinitialisation d'un jeu de données peuplé
+
+    python -m benchmarks.bench_reset --scale 100
+    python -m benchmarks.bench_reset --scale 100 --database-url postgresql://...
+
+Compare le nettoyage historique (`query(...).delete()` par table dans une
+transaction), le vidage en bloc (`clear_data.truncate_tables`) et la
+restauration d'un instantané, face au repeuplement complet.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy.orm import Session
+
+from app.clear_data import truncate_tables
+from app.models import Classe, Enrollment, Student, Subject, Teacher, User
+from app.seed_data import generate_dataset
+from app.snapshot import dump_snapshot, restore_snapshot
+from .common import make_engine
+
+
+def legacy_clear(engine) -> None:
+    with Session(engine) as db:
+        for model in (Enrollment, Subject, Student, Teacher, Classe, User):
+            db.query(model).delete()
+        db.commit()
+
+
+def truncate(engine) -> None:
+    with engine.begin() as connection:
+        truncate_tables(connection)
+
+
+def timed(label: str, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:38s} {elapsed:8.2f} s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    path = os.path.join(tempfile.mkdtemp(prefix="ecole_bench_"), "bench.snapshot")
+
+    def seed():
+        with Session(engine) as db:
+            generate_dataset(db, scale=args.scale)
+
+    seed_time = timed(f"peuplement (échelle {args.scale})", seed)
+    timed("instantané", lambda: dump_snapshot(path, engine))
+    print(f"{'taille de l’instantané':38s} {os.path.getsize(path) / 1e6:8.1f} Mo")
+    legacy = timed("nettoyage ORM (query.delete)", lambda: legacy_clear(engine))
+    restore = timed("restauration de l’instantané", lambda: restore_snapshot(path, engine))
+    fast = timed("vidage en bloc (truncate_tables)", lambda: truncate(engine))
+    print(f"vidage : x{legacy / fast:.1f} ; réinitialisation par instantané (vidage + restauration) : "
+          f"{fast + restore:.2f} s contre {legacy + seed_time:.1f} s (nettoyage + peuplement)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark : recherche indexée (`search_users`) sur un grand nombre d'utilisateurs
+
+    python -m benchmarks.bench_search --users 1000000
+    python -m benchmarks.bench_search --database-url postgresql://...
+"""
+
+import argparse
+import random
+import time
+
+from sqlalchemy import insert, select
+
+from app.models.user import User, UserRole
+from app.search import search_users
+from .common import make_engine, make_session_factory, summarize, time_calls
+
+FIRST_NAMES = ["Hélène", "Éloïse", "Jérôme", "François", "Zoé", "Anaïs", "Léa", "Noël", "Mathis", "Camille",
+               "Chloé", "Gaëlle", "Benoît", "Inès", "Théo", "Agnès", "Raphaël", "Maëlys", "Loïc", "Céline"]
+LAST_NAMES = ["Lefèvre", "Moreau", "Girard", "Dupré", "Bérénger", "Rousseau", "Fournier", "Mercier", "Lambert",
+              "Bonnet", "François", "Faure", "André", "Gauthier", "Chevalier", "Lemaître", "Perrin", "Blanchard"]
+QUERIES = ["helene", "lefevre", "eloise moreau", "jer", "anais girard", "raphael", "gaelle bon", "theo", "lemaitre"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    SessionLocal = make_session_factory(engine)
+    rng = random.Random(42)
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        offset = conn.execute(select(User.id).order_by(User.id.desc())).scalar() or 0
+        for first in range(0, args.users, args.batch):
+            conn.execute(insert(User), [
+                {"email": f"bench{offset + i}@ecole-prive.fr", "username": f"bench{offset + i}",
+                 "first_name": rng.choice(FIRST_NAMES), "last_name": f"{rng.choice(LAST_NAMES)}{i % 997}",
+                 "hashed_password": "x", "role": UserRole.PARENT}
+                for i in range(first, min(first + args.batch, args.users))
+            ])
+    print(f"{args.users} utilisateurs insérés et indexés en {time.perf_counter() - start:.1f} s")
+
+    with SessionLocal() as db:
+        for q in QUERIES:
+            durations = time_calls(lambda: search_users(db, q, limit=20), args.repeat)
+            print(f"{q!r:16} : {summarize(durations)}")
+        deep = time_calls(lambda: search_users(db, "lefevre", skip=200, limit=20), args.repeat)
+        print(f"{'page 11':16} : {summarize(deep)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark : génération de comptes fictifs (Faker fr_FR) selon le nombre de processus
+
+    python -m benchmarks.bench_seed_generation --users 1000000 --workers 1,2,4,8
+
+Mesure la seule génération (`seed_data.parent_rows`, lots consommés dans
+l'ordre à travers la file bornée de `generate_shards`), sans base de données :
+courbe de montée en charge, accélération et efficacité par processus.
+"""
+
+import argparse
+import os
+import time
+
+from app.seed_data import chunks, generate_shards, parent_rows, shard_pool
+
+
+def default_workers() -> str:
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return ",".join(map(str, counts))
+
+
+def generate(users: int, chunk_size: int, workers: int) -> float:
+    start = time.perf_counter()
+    with shard_pool(workers) as pool:
+        tasks = [(42, *bounds, "hash", 0) for bounds in chunks(users, chunk_size)]
+        generated = sum(len(rows) for rows in generate_shards(pool, parent_rows, tasks, 2 * workers))
+    assert generated == users
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--workers", default=default_workers(), help="nombres de processus, séparés par des virgules")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cœurs, {args.users} comptes, lots de {args.chunk_size}")
+    print(f"{'processus':>9s} {'durée (s)':>10s} {'comptes/s':>11s} {'accélération':>13s} {'efficacité':>11s}")
+    baseline = None
+    for workers in map(int, args.workers.split(",")):
+        elapsed = generate(args.users, args.chunk_size, workers)
+        baseline = baseline or elapsed * workers  # durée estimée sur un seul processus
+        speedup = baseline / elapsed
+        print(f"{workers:9d} {elapsed:10.1f} {args.users / elapsed:11,.0f} {speedup:12.2f}x {speedup / workers:10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark : sérialisation de 1 000 lignes ORM par schéma de réponse, validée (chemin FastAPI) ou rapide
+
+    python -m benchmarks.bench_serialization --rows 1000 --repeat 50
+
+Chemin validé : `TypeAdapter(List[Schema])` (validation depuis les attributs,
+EmailStr compris), `dump_python(mode="json")` puis `json.dumps`, comme
+FastAPI pour un `response_model`. Chemin rapide : `serialization.dump_json`.
+"""
+
+import argparse
+import enum
+import json
+from datetime import date, datetime
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import inspect
+
+from app.models import Classe, Enrollment, Student, Subject, Teacher, User
+from app.schemas import (
+    ClasseResponse, EnrollmentResponse, StudentResponse, SubjectResponse, TeacherResponse, UserResponse,
+)
+from app.serialization import dump_json
+from .common import summarize, time_calls
+
+# Schémas de réponse construits depuis des lignes ORM (les autres schémas
+# de app/schemas sont des entrées ou des agrégats)
+ROW_SCHEMAS = {
+    UserResponse: User, StudentResponse: Student, TeacherResponse: Teacher,
+    ClasseResponse: Classe, SubjectResponse: Subject, EnrollmentResponse: Enrollment,
+}
+
+
+def sample_value(column, i: int):
+    if "email" in column.key:
+        return f"personne{i}@ecole-prive.fr"
+    python_type = column.type.python_type
+    if issubclass(python_type, enum.Enum):
+        members = list(python_type)
+        return members[i % len(members)]
+    return {
+        int: i, float: i / 7, bool: i % 2 == 0, str: f"{column.key} n°{i} — élève",
+        date: date(2012, 1 + i % 12, 1 + i % 28), datetime: datetime(2024, 1 + i % 12, 1 + i % 28, 8, 30, i % 60),
+    }[python_type]
+
+
+def make_rows(model, count: int) -> list:
+    columns = [attr.columns[0] for attr in inspect(model).column_attrs]
+    return [model(**{column.key: sample_value(column, i) for column in columns}) for i in range(count)]
+
+
+def validated_json(adapter: TypeAdapter, rows: list) -> bytes:
+    content = adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'schéma':20s} {'validé (ms)':>12s} {'rapide (ms)':>12s} {'gain':>6s}   (p50 pour {args.rows} lignes)")
+    for schema, model in ROW_SCHEMAS.items():
+        rows = make_rows(model, args.rows)
+        adapter = TypeAdapter(List[schema])
+        assert json.loads(dump_json(schema, rows)) == json.loads(validated_json(adapter, rows))
+        validated = summarize(time_calls(lambda: validated_json(adapter, rows), args.repeat))["p50_ms"]
+        fast = summarize(time_calls(lambda: dump_json(schema, rows), args.repeat))["p50_ms"]
+        print(f"{schema.__name__:20s} {validated:12.2f} {fast:12.2f} {validated / fast:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
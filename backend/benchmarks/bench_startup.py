@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark : temps d'import de l'application (`python -X importtime`) et délai jusqu'à la première réponse
+
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --max-import-ms 1500 --max-first-request-ms 3000   # garde-fou (CI)
+
+Chaque mesure tourne dans un nouvel interpréteur. Le code de sortie vaut 1 si
+un budget est dépassé ou si un module à chargement différé (passlib, jose,
+Faker) est importé avec l'application.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+LAZY_MODULES = ["faker", "jose", "passlib"]
+
+FIRST_REQUEST = """
+import asyncio, httpx
+from app.main import app
+
+async def first_request():
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            (await client.get("/health")).raise_for_status()
+
+asyncio.run(first_request())
+"""
+
+
+def python(args, env) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=BACKEND_DIR, env=env, check=True,
+                          capture_output=True, text=True)
+
+
+def parse_importtime(stderr: str) -> dict:
+    """`module -> (self_us, cumulative_us)` depuis la sortie de `-X importtime`."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="modules les plus coûteux à afficher")
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-first-request-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='ecole_bench_'), 'bench.db')}")
+
+    import_ms, first_request_ms, modules = [], [], {}
+    for _ in range(args.runs):
+        result = python(["-X", "importtime", "-c",
+                         f"import json, sys, app.main; print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"],
+                        env)
+        modules = parse_importtime(result.stderr)
+        import_ms.append(modules["app.main"][1] / 1000)
+        loaded = json.loads(result.stdout)
+
+        start = time.perf_counter()
+        python(["-c", FIRST_REQUEST], env)
+        first_request_ms.append((time.perf_counter() - start) * 1000)
+
+    import_median = statistics.median(import_ms)
+    first_request_median = statistics.median(first_request_ms)
+    print(f"import app.main             : {import_median:.0f} ms (médiane de {args.runs})")
+    print(f"processus -> 1re réponse    : {first_request_median:.0f} ms (interpréteur compris)")
+    print(f"modules différés importés   : {loaded or 'aucun'}")
+    print("modules les plus coûteux (temps propre) :")
+    for name, (self_us, _) in sorted(modules.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"  {self_us / 1000:7.1f} ms  {name}")
+
+    failures = []
+    if loaded:
+        failures.append(f"modules chargés à l'import : {', '.join(loaded)}")
+    if args.max_import_ms is not None and import_median > args.max_import_ms:
+        failures.append(f"import {import_median:.0f} ms > {args.max_import_ms:.0f} ms")
+    if args.max_first_request_ms is not None and first_request_median > args.max_first_request_ms:
+        failures.append(f"1re réponse {first_request_median:.0f} ms > {args.max_first_request_ms:.0f} ms")
+    for failure in failures:
+        print(f"❌ {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
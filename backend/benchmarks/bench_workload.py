@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark : charge horaire des enseignants (GROUP BY) à froid et depuis le cache
+
+    python -m benchmarks.bench_workload --teachers 5000 --subjects 20000
+    python -m benchmarks.bench_workload --database-url postgresql://...
+"""
+
+import argparse
+import random
+from datetime import date
+
+from sqlalchemy import insert, select
+
+from app.models.classe import Classe
+from app.models.subject import Subject
+from app.models.teacher import Teacher
+from app.workload import compute_workloads, get_workloads, invalidate_workloads
+from .common import make_engine, make_session_factory, summarize, time_calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--teachers", type=int, default=5000)
+    parser.add_argument("--subjects", type=int, default=20000)
+    parser.add_argument("--classes", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    engine = make_engine(args.database_url)
+    SessionLocal = make_session_factory(engine)
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        first_user = conn.execute(select(Teacher.user_id).order_by(Teacher.user_id.desc())).scalar() or 0
+        teacher_ids = conn.execute(insert(Teacher).returning(Teacher.id), [
+            {"user_id": first_user + i + 1, "employee_number": f"BENCH-{first_user + i}", "hire_date": date(2020, 9, 1)}
+            for i in range(args.teachers)
+        ]).scalars().all()
+        classe_ids = conn.execute(insert(Classe).returning(Classe.id), [
+            {"name": f"Bench {i}", "level": "CP", "academic_year": "2024-2025"} for i in range(args.classes)
+        ]).scalars().all()
+        conn.execute(insert(Subject), [
+            {"name": "Bench", "code": f"BENCH-{first_user}-{i}", "hours_per_week": rng.randint(1, 6),
+             "teacher_id": rng.choice(teacher_ids), "classe_id": rng.choice(classe_ids)}
+            for i in range(args.subjects)
+        ])
+
+    with SessionLocal() as db:
+        cold = time_calls(lambda: compute_workloads(db), args.repeat)
+        invalidate_workloads()
+        get_workloads(db)
+        cached = time_calls(lambda: get_workloads(db), args.repeat * 100)
+
+    print(f"{args.teachers} enseignants, {args.subjects} matières")
+    print(f"GROUP BY     : {summarize(cold)}")
+    print(f"depuis cache : {summarize(cached)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Outils communs aux benchmarks : base SQLite temporaire, mesure du temps et percentiles
+"""
+
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, List, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app import models  # noqa: F401  (enregistre tous les modèles dans Base.metadata)
+
+
+def make_engine(database_url: Optional[str] = None):
+    """Créer un engine de benchmark (SQLite temporaire par défaut) avec toutes les tables."""
+    if database_url is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="ecole_bench_"), "bench.db")
+        database_url = f"sqlite:///{path}"
+    connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
+    engine = create_engine(database_url, connect_args=connect_args)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def make_session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def time_calls(fn: Callable[[], object], repeat: int) -> List[float]:
+    """Exécuter `fn` `repeat` fois et renvoyer les durées en millisecondes."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentile par rang le plus proche (pct entre 0 et 100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(values: List[float]) -> dict:
+    return {
+        "count": len(values),
+        "mean_ms": round(statistics.fmean(values), 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+    }
@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
 """
 Script pour réinitialiser complètement la base de données
+
+    python reset_db.py [--scale 1] [--seed 42] [--snapshot snapshots/ecole.snapshot]
+
+Avec `--snapshot`, l'instantané est restauré s'il existe; sinon la base est
+vidée, repeuplée puis enregistrée dans ce fichier pour les réinitialisations
+suivantes.
 """
 
+import argparse
 import sys
 import os
 
@@ -10,17 +17,31 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.clear_data import clear_database
-from app.seed_data import seed_database
+from app.seed_data import add_seed_arguments, seed_database
+from app.snapshot import dump_snapshot, restore_snapshot
 
 if __name__ == "__main__":
+    parser = add_seed_arguments(argparse.ArgumentParser(description="Réinitialiser la base de données"))
+    parser.add_argument("--snapshot", default=None, help="instantané à restaurer (créé s'il n'existe pas)")
+    args = parser.parse_args()
+    snapshot = args.snapshot
+
     print("🔄 Réinitialisation complète de la base de données...")
-    
-    # 1. Vider la base
-    clear_database()
-    
-    print("\n" + "="*50)
-    
-    # 2. Repeupler avec des données fictives
-    seed_database()
-    
+
+    if snapshot and os.path.exists(snapshot):
+        restore_snapshot(snapshot)
+        print(f"📸 Instantané restauré : {snapshot}")
+    else:
+        # 1. Vider la base
+        clear_database()
+
+        print("\n" + "="*50)
+
+        # 2. Repeupler avec des données fictives
+        seed_database(scale=args.scale, seed=args.seed, chunk_size=args.chunk_size, workers=args.workers)
+
+        if snapshot:
+            dump_snapshot(snapshot)
+            print(f"📸 Instantané enregistré : {snapshot}")
+
     print("\n🎉 Réinitialisation terminée !")
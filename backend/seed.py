@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Script d'exécution pour le peuplement de la base de données
+
+    python seed.py [--scale 1] [--seed 42] [--chunk-size 5000] [--workers N]
 """
 
 import sys
@@ -9,9 +11,10 @@ import os
 # Ajouter le répertoire parent au path pour les imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app.seed_data import seed_database
+from app.seed_data import parse_args, seed_database
 
 if __name__ == "__main__":
+    args = parse_args()
     print("🚀 Lancement du script de peuplement de données...")
-    seed_database()
+    seed_database(**vars(args))
     print("✅ Script terminé !")
@@ -2,11 +2,16 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from functools import lru_cache
+from typing import Dict, Generator
 
 from backend.app.main import app  # Main FastAPI application
 from backend.app.database import Base, get_db  # SQLAlchemy Base and get_db dependency
 from backend.app.config import settings # Application settings
+from backend.app.auth import clear_auth_caches, create_access_token, get_password_hash
+from backend.app.workload import invalidate_workloads
+from backend.app.reference_cache import reference_cache
+from backend.app.models.user import User, UserRole
 
 # --- Test Database Setup ---
 # Use an in-memory SQLite database for testing for simplicity and speed.
@@ -46,11 +51,15 @@ def db_session() -> Generator[Session, None, None]:
     connection.close()
 
 @pytest.fixture(scope="function")
-def client(db_session: Session) -> Generator[TestClient, None, None]:
+def client(db_session: Session, monkeypatch) -> Generator[TestClient, None, None]:
     """
     Provides a FastAPI TestClient that uses the test database session.
     Overrides the `get_db` dependency in the app for the scope of the test.
     """
+    # The startup listener and warm-up would use the application's DATABASE_URL, not the test session
+    monkeypatch.setattr(settings, "cache_invalidation_listener", False)
+    monkeypatch.setattr(settings, "reference_cache_warm_up", False)
+
     def override_get_db() -> Generator[Session, None, None]:
         try:
             yield db_session
@@ -58,8 +67,43 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
             db_session.close() # Ensure session is closed if not already by the db_session fixture
 
     app.dependency_overrides[get_db] = override_get_db
+    # Each test rolls back its data: cached principals, workloads and reference rows must not leak between tests
+    clear_auth_caches()
+    invalidate_workloads()
+    reference_cache.clear()
     
     with TestClient(app) as test_client:
         yield test_client
     
     del app.dependency_overrides[get_db] # Clean up override
+
+
+@lru_cache(maxsize=None)
+def _test_password_hash(password: str) -> str:
+    # bcrypt is deliberately slow: hash the shared test password only once per session.
+    return get_password_hash(password)
+
+
+@pytest.fixture(scope="function")
+def admin_user(db_session: Session) -> User:
+    """Creates an active admin user in the test database."""
+    user = User(
+        email="admin.test@ecole-prive.fr",
+        username="admin.test",
+        first_name="Admin",
+        last_name="Test",
+        hashed_password=_test_password_hash("testpassword"),
+        role=UserRole.ADMIN,
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+@pytest.fixture(scope="function")
+def auth_headers(admin_user: User) -> Dict[str, str]:
+    """Authorization header for the `admin_user` fixture."""
+    access_token = create_access_token(data={"sub": admin_user.username})
+    return {"Authorization": f"Bearer {access_token}"}
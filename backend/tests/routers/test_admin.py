@@ -0,0 +1,66 @@
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from backend.app.auth import create_access_token
+from backend.app.models.user import User, UserRole
+from backend.app import database
+from backend.app.pool_metrics import PoolMetrics, TimedQueuePool, instrument_pool, pool_metrics
+
+
+def test_pool_stats_requires_admin(client: TestClient, db_session: Session):
+    teacher = User(email="prof@ecole-prive.fr", username="prof", first_name="Prof", last_name="Test",
+                   hashed_password="not-a-real-hash", role=UserRole.TEACHER)
+    db_session.add(teacher)
+    db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'prof'})}"}
+
+    response = client.get("/admin/pool", headers=headers)
+    assert response.status_code == 403
+
+
+def test_pool_stats_counts_checkouts(client: TestClient, auth_headers: Dict[str, str], tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool, pool_size=1, max_overflow=0)
+    instrument_pool(engine)
+    pool_metrics.reset()
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    stats = pool_metrics.snapshot(engine.pool)
+    assert stats["checkouts"] == 3
+    assert stats["checkins"] == 3
+    assert stats["connections_created"] == 1
+    assert sum(stats["checkout_latency_histogram"].values()) == 3
+    assert stats["checked_out"] == 0
+
+    response = client.get("/admin/pool", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert "checkout_latency_histogram" in response.json()
+
+
+def test_replica_pool_has_its_own_metrics(client: TestClient, auth_headers: Dict[str, str], tmp_path, monkeypatch):
+    read_engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}", poolclass=TimedQueuePool, pool_size=1,
+                                max_overflow=0)
+    replica_metrics = PoolMetrics()
+    instrument_pool(read_engine, replica_metrics)
+    monkeypatch.setattr(database, "read_engine", read_engine)
+    monkeypatch.setattr("backend.app.routers.admin.read_pool_metrics", replica_metrics)
+    pool_metrics.reset()
+    for _ in range(2):
+        with read_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    # Replica waits and checkouts do not leak into the primary histogram
+    assert sum(pool_metrics.snapshot(read_engine.pool)["checkout_latency_histogram"].values()) == 0
+
+    response = client.get("/admin/pool", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    replica = response.json()["replica"]
+    assert replica["checkouts"] == 2
+    assert sum(replica["checkout_latency_histogram"].values()) == 2
+    # The metrics follow the pool when it is recreated (engine.dispose())
+    read_engine.dispose()
+    assert read_engine.pool.metrics is replica_metrics
+    read_engine.dispose()
@@ -0,0 +1,19 @@
+from fastapi.testclient import TestClient
+
+from backend.app.models.user import User
+
+
+def test_login_success(client: TestClient, admin_user: User):
+    response = client.post("/auth/login", data={"username": admin_user.username, "password": "testpassword"})
+    assert response.status_code == 200, response.text
+    token = response.json()["access_token"]
+
+    me = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+    assert me.status_code == 200, me.text
+    assert me.json()["username"] == admin_user.username
+
+
+def test_login_wrong_password(client: TestClient, admin_user: User):
+    response = client.post("/auth/login", data={"username": admin_user.username, "password": "wrong"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Nom d'utilisateur ou mot de passe incorrect"
@@ -0,0 +1,160 @@
+from datetime import date
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.app.models.classe import Classe
+from backend.app.models.enrollment import Enrollment, EnrollmentStatus
+from backend.app.models.student import Student
+from backend.app.models.user import User, UserRole
+
+
+def classe_payload(name: str, **overrides) -> dict:
+    return {"name": name, "level": "6ème", "section": "A", "academic_year": "2024-2025", **overrides}
+
+
+# --- POST /classes/bulk ---
+
+def test_create_classes_bulk(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    payload = [classe_payload(f"6ème {letter}") for letter in "ABC"]
+    response = client.post("/classes/bulk", json=payload, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["created"] == 3 and data["failed"] == 0
+    ids = [item["id"] for item in data["results"]]
+    names = {c.id: c.name for c in db_session.query(Classe).filter(Classe.id.in_(ids))}
+    assert [names[i] for i in ids] == ["6ème A", "6ème B", "6ème C"]
+
+
+def test_create_classes_bulk_rejects_duplicate_names(client: TestClient, auth_headers: Dict[str, str]):
+    client.post("/classes/", json=classe_payload("5ème A"), headers=auth_headers)
+    response = client.post("/classes/bulk", json=[classe_payload("5ème A"), classe_payload("5ème B")], headers=auth_headers)
+    data = response.json()
+    assert data["created"] == 1
+    assert data["results"][0] == {"index": 0, "success": False, "id": None, "error": "Une classe avec ce nom existe déjà"}
+
+
+def test_create_classes_bulk_empty(client: TestClient, auth_headers: Dict[str, str]):
+    response = client.post("/classes/bulk", json=[], headers=auth_headers)
+    assert response.status_code == 400
+
+
+# --- GET /classes/{id}/roster ---
+
+def enroll_students(db: Session, classe: Classe, count: int, prefix: str) -> None:
+    for i in range(count):
+        user = User(email=f"{prefix}{i}@ecole-prive.fr", username=f"{prefix}{i}", first_name="Élève",
+                    last_name=f"{prefix.capitalize()}{i:02d}", hashed_password="not-a-real-hash", role=UserRole.STUDENT)
+        student = Student(user=user, student_number=f"{prefix.upper()}{i:03d}", date_of_birth=date(2012, 1, 1))
+        db.add(Enrollment(student=student, classe=classe, status=EnrollmentStatus.ACTIVE))
+    db.commit()
+
+
+def count_roster_queries(client: TestClient, db_session: Session, classe_id: int, headers: Dict[str, str]):
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", count)
+    try:
+        response = client.get(f"/classes/{classe_id}/roster", headers=headers)
+    finally:
+        event.remove(bind, "before_cursor_execute", count)
+    assert response.status_code == 200, response.text
+    return response.json(), len(statements)
+
+
+def test_roster_query_count_is_constant(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    small = Classe(name="CP A", level="CP", academic_year="2024-2025")
+    large = Classe(name="CP B", level="CP", academic_year="2024-2025")
+    enroll_students(db_session, small, 2, "small")
+    enroll_students(db_session, large, 20, "large")
+    small_id, large_id = small.id, large.id
+    client.get("/users/me", headers=auth_headers)  # warm the principal cache
+
+    small_roster, small_queries = count_roster_queries(client, db_session, small_id, auth_headers)
+    large_roster, large_queries = count_roster_queries(client, db_session, large_id, auth_headers)
+
+    assert len(small_roster["students"]) == 2
+    assert len(large_roster["students"]) == 20
+    assert large_queries == small_queries <= 2
+    assert large_roster["students"][0]["last_name"] == "Large00"
+    assert large_roster["students"][0]["status"] == "active"
+
+
+def test_class_without_limit_is_served(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    classe = Classe(name="CP C", level="CP", academic_year="2024-2025")
+    enroll_students(db_session, classe, 1, "open")
+    classe_id = classe.id
+    response = client.put(f"/classes/{classe_id}", json={"max_students": None}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["max_students"] is None
+
+    roster = client.get(f"/classes/{classe_id}/roster", headers=auth_headers)
+    assert roster.status_code == 200, roster.text
+    assert roster.json()["max_students"] is None
+    assert client.get(f"/classes/{classe_id}", headers=auth_headers).json()["fill_rate"] == 0.0
+
+
+def test_roster_not_found(client: TestClient, auth_headers: Dict[str, str]):
+    assert client.get("/classes/99999/roster", headers=auth_headers).status_code == 404
+
+
+# --- Conditional GET (ETag / If-None-Match) ---
+
+def test_classes_etag_returns_304_without_querying_classes(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    classe_id = client.post("/classes/", json=classe_payload("5ème A"), headers=auth_headers).json()["id"]
+
+    for url in ["/classes/", f"/classes/{classe_id}"]:
+        response = client.get(url, headers=auth_headers)
+        assert response.status_code == 200, response.text
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"classes.')
+
+        statements = []
+        bind = db_session.get_bind()
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(bind, "before_cursor_execute", listener)
+        try:
+            response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        finally:
+            event.remove(bind, "before_cursor_execute", listener)
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert not [s for s in statements if "FROM classes" in s]
+
+    # Unauthenticated clients still get 401, even with a matching ETag
+    assert client.get("/classes/", headers={"If-None-Match": etag}).status_code == 401
+
+
+def test_classes_etag_changes_on_writes_and_enrollments(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    def etag() -> str:
+        return client.get("/classes/", headers=auth_headers).headers["ETag"]
+
+    seen = [etag()]
+    classe_id = client.post("/classes/", json=classe_payload("4ème A"), headers=auth_headers).json()["id"]
+    seen.append(etag())
+    client.put(f"/classes/{classe_id}", json={"max_students": 25}, headers=auth_headers)
+    seen.append(etag())
+
+    # Enrollments change active_enrollments, which is part of the class representation
+    user = User(email="etag@ecole-prive.fr", username="etag", first_name="E", last_name="Tag",
+                hashed_password="x", role=UserRole.STUDENT)
+    student = Student(user=user, student_number="ETAG0001", date_of_birth=date(2012, 1, 1))
+    db_session.add(student)
+    db_session.commit()
+    response = client.post("/enrollments/", json={"student_id": student.id, "classe_id": classe_id},
+                           headers=auth_headers)
+    assert response.status_code == 201, response.text
+    seen.append(etag())
+
+    empty_id = client.post("/classes/", json=classe_payload("4ème B"), headers=auth_headers).json()["id"]
+    seen.append(etag())
+    assert client.delete(f"/classes/{empty_id}", headers=auth_headers).status_code == 200
+    seen.append(etag())
+    assert len(set(seen)) == len(seen)
@@ -0,0 +1,225 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.app.database import Base
+from backend.app.enrollment_counters import reconcile_enrollment_counters
+from backend.app.models.classe import Classe
+from backend.app.models.enrollment import Enrollment, EnrollmentStatus
+from backend.app.models.student import Student
+from backend.app.models.user import User, UserRole
+from backend.app.routers.enrollments import enroll_student
+from backend.app.schemas.enrollment import EnrollmentCreate
+
+
+def create_students(db: Session, count: int, prefix: str = "eleve") -> List[int]:
+    students = []
+    for i in range(count):
+        user = User(email=f"{prefix}{i}@ecole-prive.fr", username=f"{prefix}{i}", first_name="Élève",
+                    last_name=str(i), hashed_password="not-a-real-hash", role=UserRole.STUDENT)
+        students.append(Student(user=user, student_number=f"{prefix.upper()}{i:04d}", date_of_birth=date(2012, 1, 1)))
+    db.add_all(students)
+    db.commit()
+    return [student.id for student in students]
+
+
+def create_classe(db: Session, max_students: int, name: str = "CM1 A") -> int:
+    classe = Classe(name=name, level="CM1", academic_year="2024-2025", max_students=max_students)
+    db.add(classe)
+    db.commit()
+    return classe.id
+
+
+# --- POST /enrollments/ ---
+
+def test_enrollment_capacity_is_enforced(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    student_ids = create_students(db_session, 3)
+    classe_id = create_classe(db_session, max_students=2)
+
+    statuses = [
+        client.post("/enrollments/", json={"student_id": sid, "classe_id": classe_id}, headers=auth_headers).status_code
+        for sid in student_ids
+    ]
+    assert statuses == [201, 201, 409]
+
+    # A non-active enrollment does not take a seat
+    response = client.post("/enrollments/", json={"student_id": student_ids[2], "classe_id": classe_id,
+                                                   "status": "suspended"}, headers=auth_headers)
+    assert response.status_code == 201, response.text
+    suspended_id = response.json()["id"]
+
+    # ...and cannot be reactivated while the class is full
+    response = client.put(f"/enrollments/{suspended_id}", json={"status": "active"}, headers=auth_headers)
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Classe complète"
+
+
+def test_class_without_limit_accepts_enrollments(client: TestClient, db_session: Session,
+                                                auth_headers: Dict[str, str]):
+    student_ids = create_students(db_session, 3)
+    classe_id = create_classe(db_session, max_students=1, name="Études")
+    # The ORM applies the column default on insert: clear the limit as PUT /classes does
+    db_session.execute(update(Classe).where(Classe.id == classe_id).values(max_students=None))
+    db_session.commit()
+
+    statuses = [
+        client.post("/enrollments/", json={"student_id": sid, "classe_id": classe_id}, headers=auth_headers).status_code
+        for sid in student_ids
+    ]
+    assert statuses == [201, 201, 201]
+    db_session.expire_all()
+    assert db_session.get(Classe, classe_id).active_enrollments == 3
+
+
+def test_enrollment_rejects_duplicate_and_unknown(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    student_id = create_students(db_session, 1)[0]
+    classe_id = create_classe(db_session, max_students=5)
+    payload = {"student_id": student_id, "classe_id": classe_id}
+
+    assert client.post("/enrollments/", json=payload, headers=auth_headers).status_code == 201
+    assert client.post("/enrollments/", json=payload, headers=auth_headers).status_code == 400
+    assert client.post("/enrollments/", json={**payload, "classe_id": 99999}, headers=auth_headers).status_code == 404
+    assert client.post("/enrollments/", json={**payload, "student_id": 99999}, headers=auth_headers).status_code == 404
+
+
+def test_reactivation_cannot_duplicate_an_active_enrollment(client: TestClient, db_session: Session,
+                                                            auth_headers: Dict[str, str]):
+    student_id = create_students(db_session, 1)[0]
+    classe_id = create_classe(db_session, max_students=5)
+    payload = {"student_id": student_id, "classe_id": classe_id}
+    assert client.post("/enrollments/", json=payload, headers=auth_headers).status_code == 201
+    suspended = client.post("/enrollments/", json={**payload, "status": "suspended"}, headers=auth_headers).json()
+
+    # The partial unique index rejects a second active enrollment (no pre-check on this path)
+    response = client.put(f"/enrollments/{suspended['id']}", json={"status": "active"}, headers=auth_headers)
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Cet étudiant est déjà inscrit dans cette classe"
+
+
+# --- Contention ---
+
+def test_parallel_enrollments_never_exceed_capacity(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'contention.db'}", connect_args={"timeout": 30})
+    Base.metadata.create_all(bind=engine)
+    SessionFactory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    parallel, seats = 40, 7
+    with SessionFactory() as db:
+        student_ids = create_students(db, parallel)
+        classe_id = create_classe(db, max_students=seats)
+
+    def attempt(student_id: int) -> bool:
+        with SessionFactory() as db:
+            try:
+                enroll_student(db, EnrollmentCreate(student_id=student_id, classe_id=classe_id))
+                return True
+            except HTTPException as exc:
+                assert exc.status_code == 409
+                return False
+
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        results = list(executor.map(attempt, student_ids))
+
+    assert results.count(True) == seats
+    with SessionFactory() as db:
+        active = db.query(Enrollment).filter(Enrollment.classe_id == classe_id,
+                                             Enrollment.status == EnrollmentStatus.ACTIVE).count()
+    assert active == seats
+    with SessionFactory() as db:
+        assert db.get(Classe, classe_id).active_enrollments == seats
+
+
+def test_parallel_duplicate_enrollments_take_one_seat(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'duplicates.db'}", connect_args={"timeout": 30})
+    Base.metadata.create_all(bind=engine)
+    SessionFactory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with SessionFactory() as db:
+        student_id = create_students(db, 1)[0]
+        classe_id = create_classe(db, max_students=10)
+
+    def attempt(_) -> bool:
+        with SessionFactory() as db:
+            try:
+                enroll_student(db, EnrollmentCreate(student_id=student_id, classe_id=classe_id))
+                return True
+            except HTTPException as exc:
+                # 400 from the pre-check, 409 when a concurrent request slipped past it
+                assert exc.status_code in (400, 409)
+                return False
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        results = list(executor.map(attempt, range(20)))
+
+    assert results.count(True) == 1
+    with SessionFactory() as db:
+        assert db.get(Classe, classe_id).active_enrollments == 1
+
+
+# --- Classe.active_enrollments counter ---
+
+def test_active_enrollment_counter_follows_lifecycle(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    student_ids = create_students(db_session, 2)
+    classe_id = create_classe(db_session, max_students=4)
+
+    def counter() -> dict:
+        data = client.get(f"/classes/{classe_id}", headers=auth_headers).json()
+        return {"active": data["active_enrollments"], "fill_rate": data["fill_rate"]}
+
+    ids = [client.post("/enrollments/", json={"student_id": sid, "classe_id": classe_id}, headers=auth_headers).json()["id"]
+           for sid in student_ids]
+    assert counter() == {"active": 2, "fill_rate": 0.5}
+
+    assert client.put(f"/enrollments/{ids[0]}", json={"status": "completed"}, headers=auth_headers).status_code == 200
+    assert counter() == {"active": 1, "fill_rate": 0.25}
+    # Repeating the same status change does not release a second seat
+    assert client.put(f"/enrollments/{ids[0]}", json={"status": "dropped"}, headers=auth_headers).status_code == 200
+    assert counter()["active"] == 1
+
+    assert client.put(f"/enrollments/{ids[0]}", json={"status": "active"}, headers=auth_headers).status_code == 200
+    assert counter()["active"] == 2
+
+    assert client.delete(f"/enrollments/{ids[1]}", headers=auth_headers).status_code == 204
+    assert counter() == {"active": 1, "fill_rate": 0.25}
+
+
+def test_reconcile_enrollment_counters_fixes_drift(db_session: Session):
+    student_ids = create_students(db_session, 3)
+    classe_id = create_classe(db_session, max_students=10)
+    other_id = create_classe(db_session, max_students=10, name="CM1 B")
+    db_session.add_all([Enrollment(student_id=sid, classe_id=classe_id) for sid in student_ids])
+    db_session.add(Enrollment(student_id=student_ids[0], classe_id=other_id, status=EnrollmentStatus.DROPPED))
+    db_session.commit()
+
+    drift = reconcile_enrollment_counters(db_session)
+    assert drift == [{"classe_id": classe_id, "name": "CM1 A", "stored": 0, "actual": 3}]
+    db_session.expire_all()
+    assert db_session.get(Classe, classe_id).active_enrollments == 3
+    assert reconcile_enrollment_counters(db_session) == []
+
+
+# --- Filters ---
+
+def test_enrollment_and_student_filters(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    student_ids = create_students(db_session, 3)
+    classe_id = create_classe(db_session, max_students=10)
+    other_id = create_classe(db_session, max_students=10, name="CM1 B")
+    db_session.add_all([
+        Enrollment(student_id=student_ids[0], classe_id=classe_id),
+        Enrollment(student_id=student_ids[1], classe_id=classe_id, status=EnrollmentStatus.DROPPED),
+        Enrollment(student_id=student_ids[2], classe_id=other_id),
+    ])
+    db_session.commit()
+
+    response = client.get(f"/enrollments/?classe_id={classe_id}&status=active", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert [e["student_id"] for e in response.json()] == [student_ids[0]]
+
+    response = client.get(f"/students/?classe_id={classe_id}", headers=auth_headers)
+    assert [s["id"] for s in response.json()] == [student_ids[0]]
+
+    response = client.get("/enrollments/?sort=-id&status=dropped", headers=auth_headers)
+    assert [e["student_id"] for e in response.json()] == [student_ids[1]]
@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional 
 from datetime import date 
 
-from backend.app.models.user import User
+from backend.app.models.user import User, UserRole
 from backend.app.models.student import Student
 from backend.app.schemas.student import StudentCreate, StudentUpdate
 from backend.app.auth import create_access_token, get_password_hash
@@ -48,6 +48,17 @@ def create_user_in_db(db: Session, username: str = "defaultuser@example.com", pa
         db.refresh(user)
     return user
 
+# Helper for bulk tests: a student account with the fields the User model requires
+def create_user_in_db_for_bulk(db: Session, username: str) -> User:
+    user = User(
+        username=username, email=f"{username}@example.com", first_name="Bulk", last_name="Owner",
+        hashed_password="not-a-real-hash", role=UserRole.STUDENT,
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
 # --- Test Cases for POST /students/ ---
 
 def test_create_student_success(client: TestClient, db_session: Session):
@@ -316,3 +327,59 @@ def test_delete_student_not_found(client: TestClient, db_session: Session):
     response = client.delete("/students/99999", headers=headers) 
     assert response.status_code == 404, response.text
     assert response.json()["detail"] == "Étudiant non trouvé"
+
+# --- Test Cases for POST /students/bulk ---
+
+def test_create_students_bulk_reports_per_item_errors(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    owners = [create_user_in_db_for_bulk(db_session, f"bulk_owner{i}") for i in range(4)]
+    existing = Student(user_id=owners[3].id, student_number="B00000", date_of_birth=date(2010, 1, 1))
+    db_session.add(existing)
+    db_session.commit()
+
+    payload = [
+        {"user_id": owners[0].id, "student_number": "B00001", "date_of_birth": "2010-02-01"},
+        {"user_id": owners[1].id, "student_number": "B00001", "date_of_birth": "2010-03-01"},  # duplicate in batch
+        {"user_id": owners[2].id, "student_number": "B00000", "date_of_birth": "2010-04-01"},  # duplicate in DB
+        {"user_id": 99999, "student_number": "B00004", "date_of_birth": "2010-05-01"},        # unknown user
+    ]
+    response = client.post("/students/bulk", json=payload, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["created"] == 1
+    assert data["failed"] == 3
+    results = data["results"]
+    assert results[0]["success"] and results[0]["id"] is not None
+    assert results[1]["error"] == "Un étudiant avec ce numéro existe déjà"
+    assert results[2]["error"] == "Un étudiant avec ce numéro existe déjà"
+    assert results[3]["error"] == "Utilisateur non trouvé"
+
+    created = db_session.query(Student).filter(Student.id == results[0]["id"]).first()
+    assert created.student_number == "B00001"
+
+
+# --- GET /students/search ---
+
+def test_search_students_matches_account_and_record(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    user = User(email="eloise@ecole-prive.fr", username="eloise", first_name="Éloïse", last_name="Moreau",
+                hashed_password="not-a-real-hash", role=UserRole.STUDENT)
+    other = User(email="paul@ecole-prive.fr", username="paul", first_name="Paul", last_name="Girard",
+                 hashed_password="not-a-real-hash", role=UserRole.STUDENT)
+    db_session.add_all([
+        Student(user=user, student_number="STU2024042", date_of_birth=date(2013, 5, 2), parent_name="Marc Moreau"),
+        Student(user=other, student_number="STU2024043", date_of_birth=date(2013, 6, 2), parent_name="Anaïs Girard"),
+    ])
+    db_session.commit()
+    user_id = user.id
+
+    def found(q: str) -> List[str]:
+        response = client.get("/students/search", params={"q": q}, headers=auth_headers)
+        assert response.status_code == 200, response.text
+        return [s["student_number"] for s in response.json()]
+
+    assert found("eloise") == ["STU2024042"]
+    assert found("anais") == ["STU2024043"]
+    assert found("STU2024043") == ["STU2024043"]
+
+    # Renaming the account is reflected in the student index
+    assert client.put(f"/users/{user_id}", json={"last_name": "Lambert"}, headers=auth_headers).status_code == 200
+    assert found("lambert") == ["STU2024042"]
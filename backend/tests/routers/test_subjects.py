@@ -0,0 +1,60 @@
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from backend.app.models.classe import Classe
+
+
+# --- POST /subjects/bulk ---
+
+def test_create_subjects_bulk_checks_references(client: TestClient, db_session: Session,
+                                                auth_headers: Dict[str, str]):
+    classe = Classe(name="CM2 A", level="CM2", academic_year="2024-2025")
+    db_session.add(classe)
+    db_session.commit()
+    classe_id = classe.id
+    etag = client.get("/subjects/", headers=auth_headers).headers["ETag"]
+
+    # Unknown references are reported per item instead of failing the whole batch
+    payload = [
+        {"name": "Unknown class", "code": "BULK-1", "classe_id": 99999},
+        {"name": "Unknown teacher", "code": "BULK-2", "classe_id": classe_id, "teacher_id": 99999},
+    ]
+    data = client.post("/subjects/bulk", json=payload, headers=auth_headers).json()
+    assert data["created"] == 0
+    assert [item["error"] for item in data["results"]] == ["Classe non trouvée", "Enseignant non trouvé"]
+    # Nothing inserted: the subjects version is unchanged
+    assert client.get("/subjects/", headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+
+    payload = [{"name": "Sciences", "code": "BULK-3", "classe_id": classe_id}]  # no teacher: not checked
+    data = client.post("/subjects/bulk", json=payload, headers=auth_headers).json()
+    assert data["created"] == 1, data
+
+
+# --- Conditional GET (ETag / If-None-Match) ---
+
+def test_subjects_etag_follows_subject_writes(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    classe = Classe(name="CE2 A", level="CE2", academic_year="2024-2025")
+    db_session.add(classe)
+    db_session.commit()
+    classe_id = classe.id
+
+    etag = client.get("/subjects/", headers=auth_headers).headers["ETag"]
+    assert client.get("/subjects/", headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+    # Class writes do not invalidate subjects
+    client.post("/classes/", json={"name": "CE2 B", "level": "CE2", "academic_year": "2024-2025"}, headers=auth_headers)
+    assert client.get("/subjects/", headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+
+    response = client.post("/subjects/", json={"name": "Anglais", "code": "ANG-CE2", "classe_id": classe_id},
+                           headers=auth_headers)
+    assert response.status_code == 201, response.text
+    response = client.get("/subjects/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [s["code"] for s in response.json()] == ["ANG-CE2"]
+
+    # Weak comparison and lists of candidates
+    new_etag = response.headers["ETag"]
+    headers = {**auth_headers, "If-None-Match": f'"other", {new_etag.removeprefix("W/")}'}
+    assert client.get(f"/subjects/{response.json()[0]['id']}", headers=headers).status_code == 304
@@ -0,0 +1,104 @@
+from datetime import date
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.app.models.classe import Classe
+from backend.app.models.subject import Subject
+from backend.app.models.teacher import Teacher
+from backend.app.models.user import User, UserRole
+
+
+def create_teacher(db: Session, name: str) -> int:
+    user = User(email=f"{name}@ecole-prive.fr", username=name, first_name="Prof", last_name=name,
+                hashed_password="not-a-real-hash", role=UserRole.TEACHER)
+    teacher = Teacher(user=user, employee_number=f"EMP-{name}", hire_date=date(2020, 9, 1))
+    db.add(teacher)
+    db.commit()
+    return teacher.id
+
+
+def create_classes(db: Session, count: int) -> list:
+    classes = [Classe(name=f"CE{i}", level="CE1", academic_year="2024-2025") for i in range(count)]
+    db.add_all(classes)
+    db.commit()
+    return [classe.id for classe in classes]
+
+
+# --- GET /teachers/workload ---
+
+def test_teacher_workload_aggregates_subjects(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    busy_id, idle_id = create_teacher(db_session, "busy"), create_teacher(db_session, "idle")
+    classe_ids = create_classes(db_session, 2)
+    db_session.add_all([
+        Subject(name="Maths", code="MATH-A", hours_per_week=4, teacher_id=busy_id, classe_id=classe_ids[0]),
+        Subject(name="Maths", code="MATH-B", hours_per_week=4, teacher_id=busy_id, classe_id=classe_ids[1]),
+        Subject(name="Sciences", code="SCI-A", hours_per_week=2, teacher_id=busy_id, classe_id=classe_ids[0]),
+        Subject(name="Sport", code="EPS-A", hours_per_week=3, teacher_id=None, classe_id=classe_ids[0]),
+    ])
+    db_session.commit()
+
+    response = client.get("/teachers/workload", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert response.json() == [
+        {"teacher_id": busy_id, "total_hours_per_week": 10, "subject_count": 3, "classe_count": 2},
+        {"teacher_id": idle_id, "total_hours_per_week": 0, "subject_count": 0, "classe_count": 0},
+    ]
+
+    response = client.get(f"/teachers/{busy_id}/workload", headers=auth_headers)
+    assert response.json()["total_hours_per_week"] == 10
+    assert client.get("/teachers/99999/workload", headers=auth_headers).status_code == 404
+
+
+def test_teacher_workload_is_cached_until_subject_write(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    teacher_id = create_teacher(db_session, "cached")
+    classe_id = create_classes(db_session, 1)[0]
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        def workload() -> tuple:
+            statements.clear()
+            data = client.get(f"/teachers/{teacher_id}/workload", headers=auth_headers).json()
+            return data, sum("GROUP BY" in statement for statement in statements)
+
+        assert workload() == ({"teacher_id": teacher_id, "total_hours_per_week": 0, "subject_count": 0,
+                               "classe_count": 0}, 1)
+        assert workload()[1] == 0  # served from the cache
+
+        response = client.post("/subjects/", json={"name": "Histoire", "code": "HIST-A", "hours_per_week": 2,
+                                                    "teacher_id": teacher_id, "classe_id": classe_id},
+                               headers=auth_headers)
+        assert response.status_code == 201, response.text
+        subject_id = response.json()["id"]
+        assert workload() == ({"teacher_id": teacher_id, "total_hours_per_week": 2, "subject_count": 1,
+                               "classe_count": 1}, 1)
+
+        client.put(f"/subjects/{subject_id}", json={"hours_per_week": 5}, headers=auth_headers)
+        assert workload()[0]["total_hours_per_week"] == 5
+
+        client.delete(f"/subjects/{subject_id}", headers=auth_headers)
+        assert workload()[0]["subject_count"] == 0
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
+# --- Sorting on GET /teachers/ ---
+
+def test_read_teachers_sorted_by_hire_date_with_cursor(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    for name, hired in [("c", date(2019, 9, 1)), ("a", date(2021, 9, 1)), ("b", date(2019, 9, 1))]:
+        db_session.add(Teacher(user=User(email=f"{name}@ecole-prive.fr", username=name, first_name="Prof",
+                                         last_name=name, hashed_password="x", role=UserRole.TEACHER),
+                               employee_number=f"EMP-{name}", hire_date=hired))
+    db_session.commit()
+
+    response = client.get("/teachers/?sort=hire_date&limit=2", headers=auth_headers)
+    assert [t["employee_number"] for t in response.json()] == ["EMP-c", "EMP-b"]
+    # The cursor carries the date as ISO 8601 and is converted back for the comparison
+    response = client.get(f"/teachers/?sort=hire_date&limit=2&cursor={response.headers['X-Next-Cursor']}",
+                          headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert [t["employee_number"] for t in response.json()] == ["EMP-a"]
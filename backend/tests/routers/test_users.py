@@ -0,0 +1,214 @@
+import json
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from backend.app.auth import create_access_token, verify_password
+from backend.app.config import settings
+from backend.app.hashing import shutdown_hash_pool
+from backend.app.models.user import User, UserRole
+
+
+def create_users(db: Session, count: int, prefix: str = "user") -> None:
+    for i in range(count):
+        db.add(User(
+            email=f"{prefix}{i}@ecole-prive.fr",
+            username=f"{prefix}{i:03d}",
+            first_name="Test",
+            last_name=f"User{i}",
+            hashed_password="not-a-real-hash",
+            role=UserRole.STUDENT,
+        ))
+    db.commit()
+
+
+# --- Pagination ---
+
+def test_read_users_offset_pagination_is_ordered(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    create_users(db_session, 5)
+    response = client.get("/users/?skip=1&limit=3", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    ids = [u["id"] for u in response.json()]
+    assert ids == sorted(ids)
+    assert len(ids) == 3
+
+
+def test_read_users_cursor_walks_every_row_once(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    create_users(db_session, 7)
+    seen = []
+    response = client.get("/users/?limit=3", headers=auth_headers)
+    while True:
+        assert response.status_code == 200, response.text
+        seen.extend(u["id"] for u in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        response = client.get(f"/users/?limit=3&cursor={next_cursor}", headers=auth_headers)
+
+    all_ids = [u.id for u in db_session.query(User).order_by(User.id)]
+    assert seen == all_ids
+
+
+def test_read_users_invalid_cursor(client: TestClient, auth_headers: Dict[str, str]):
+    response = client.get("/users/?cursor=not-a-cursor", headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Curseur invalide"
+
+
+# --- POST /users/bulk ---
+
+def user_payload(username: str) -> dict:
+    return {
+        "email": f"{username}@ecole-prive.fr", "username": username, "first_name": "Bulk",
+        "last_name": "Import", "role": "student", "password": f"{username}-secret",
+    }
+
+
+def test_create_users_bulk_hashes_in_process_pool(client: TestClient, db_session: Session, auth_headers: Dict[str, str], monkeypatch):
+    monkeypatch.setattr(settings, "password_hash_workers", 2)
+    monkeypatch.setattr(settings, "bulk_insert_batch_size", 2)
+    payload = [user_payload(f"bulk{i}") for i in range(3)] + [user_payload("admin.test")]
+
+    try:
+        response = client.post("/users/bulk", json=payload, headers=auth_headers)
+    finally:
+        shutdown_hash_pool()
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["created"] == 3
+    assert data["results"][3]["error"] == "Un utilisateur avec cet email existe déjà"
+    assert data["hashes_per_second"] > 0
+
+    user = db_session.query(User).filter(User.username == "bulk1").first()
+    assert verify_password("bulk1-secret", user.hashed_password)
+
+
+# --- Authenticated-principal cache ---
+
+def test_deactivated_user_is_rejected_despite_principal_cache(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    target = User(email="cached@ecole-prive.fr", username="cached", first_name="Cached", last_name="User",
+                  hashed_password="not-a-real-hash", role=UserRole.TEACHER)
+    db_session.add(target)
+    db_session.commit()
+    target_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'cached'})}"}
+
+    assert client.get("/users/me", headers=target_headers).status_code == 200  # principal now cached
+    response = client.put(f"/users/{target.id}", json={"is_active": False}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+
+    response = client.get("/users/me", headers=target_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+
+
+def test_deleted_user_is_rejected_despite_principal_cache(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    target = User(email="gone@ecole-prive.fr", username="gone", first_name="Gone", last_name="User",
+                  hashed_password="not-a-real-hash", role=UserRole.TEACHER)
+    db_session.add(target)
+    db_session.commit()
+    target_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'gone'})}"}
+
+    assert client.get("/users/me", headers=target_headers).status_code == 200
+    assert client.delete(f"/users/{target.id}", headers=auth_headers).status_code == 200
+    assert client.get("/users/me", headers=target_headers).status_code == 401
+
+
+# --- GET /users/export ---
+
+def test_export_users_csv_and_ndjson(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    create_users(db_session, 3, prefix="export")
+
+    response = client.get("/users/export?format=csv", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.strip().splitlines()
+    assert lines[0].split(",")[:3] == ["email", "username", "first_name"]
+    assert len(lines) == 1 + 4  # header + admin + 3 users
+    assert "hashed_password" not in response.text
+
+    response = client.get("/users/export?format=ndjson", headers=auth_headers)
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["username"] for row in rows] == ["admin.test", "export000", "export001", "export002"]
+    assert rows[1]["role"] == "student"
+
+
+def test_export_users_rejects_unknown_format(client: TestClient, auth_headers: Dict[str, str]):
+    assert client.get("/users/export?format=xml", headers=auth_headers).status_code == 422
+
+
+# --- GET /users/search ---
+
+def test_search_users_is_accent_insensitive_and_ranked(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    for username, first, last in [("hlefevre", "Hélène", "Lefèvre"), ("hmartin", "Hugo", "Martin"),
+                                  ("jhelene", "Jean", "Dupont-Hélène")]:
+        db_session.add(User(email=f"{username}@ecole-prive.fr", username=username, first_name=first, last_name=last,
+                            hashed_password="not-a-real-hash", role=UserRole.PARENT))
+    db_session.commit()
+
+    response = client.get("/users/search?q=helene lefevre", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert [u["username"] for u in response.json()] == ["hlefevre"]
+
+    # Prefix match, name columns outrank the username
+    response = client.get("/users/search?q=hel", headers=auth_headers)
+    assert [u["username"] for u in response.json()][:2] == ["hlefevre", "jhelene"]
+
+    response = client.get("/users/search?q=hel&skip=1&limit=1", headers=auth_headers)
+    assert [u["username"] for u in response.json()] == ["jhelene"]
+
+
+def test_search_users_follows_updates_and_deletes(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    user = User(email="renamed@ecole-prive.fr", username="renamed", first_name="Zoé", last_name="Avant",
+                hashed_password="not-a-real-hash", role=UserRole.PARENT)
+    db_session.add(user)
+    db_session.commit()
+    user_id = user.id
+
+    assert client.put(f"/users/{user_id}", json={"last_name": "Après"}, headers=auth_headers).status_code == 200
+    assert client.get("/users/search?q=avant", headers=auth_headers).json() == []
+    assert [u["id"] for u in client.get("/users/search?q=apres", headers=auth_headers).json()] == [user_id]
+
+    assert client.delete(f"/users/{user_id}", headers=auth_headers).status_code == 200
+    assert client.get("/users/search?q=apres", headers=auth_headers).json() == []
+
+
+def test_search_users_validates_query(client: TestClient, auth_headers: Dict[str, str]):
+    assert client.get("/users/search?q=a", headers=auth_headers).status_code == 422
+    assert client.get("/users/search?q=\"*()", headers=auth_headers).json() == []
+
+
+# --- Filters and sorting on GET /users/ ---
+
+def test_read_users_filters_by_role_and_active(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    create_users(db_session, 3)
+    db_session.add(User(email="prof@ecole-prive.fr", username="prof", first_name="Prof", last_name="Inactif",
+                        hashed_password="not-a-real-hash", role=UserRole.TEACHER, is_active=False))
+    db_session.commit()
+
+    response = client.get("/users/?role=student", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert [u["username"] for u in response.json()] == ["user000", "user001", "user002"]
+    response = client.get("/users/?role=teacher&is_active=false", headers=auth_headers)
+    assert [u["username"] for u in response.json()] == ["prof"]
+    assert client.get("/users/?role=janitor", headers=auth_headers).status_code == 422
+
+
+def test_read_users_sort_allowlist_and_cursor(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    create_users(db_session, 5)
+
+    seen = []
+    response = client.get("/users/?role=student&sort=-last_name&limit=2", headers=auth_headers)
+    while True:
+        assert response.status_code == 200, response.text
+        seen.extend(u["last_name"] for u in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        response = client.get(f"/users/?role=student&sort=-last_name&limit=2&cursor={next_cursor}", headers=auth_headers)
+    assert seen == ["User4", "User3", "User2", "User1", "User0"]
+
+    response = client.get("/users/?sort=created_at", headers=auth_headers)
+    assert response.status_code == 400
+    # A cursor is only valid for the sort it was issued with
+    assert client.get(f"/users/?sort=username&cursor={next_cursor or 'x'}", headers=auth_headers).status_code == 400
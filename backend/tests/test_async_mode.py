@@ -0,0 +1,97 @@
+from typing import AsyncGenerator
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from backend.app import database
+from backend.app.auth import clear_auth_caches, create_access_token
+from backend.app.database import Base, get_async_db, to_async_url
+from backend.app.models.user import User, UserRole
+from backend.app.routers import async_reads
+
+
+def test_to_async_url():
+    assert to_async_url("postgresql://u:p@db/ecole") == "postgresql+asyncpg://u:p@db/ecole"
+    assert to_async_url("sqlite:///./ecole.db") == "sqlite+aiosqlite:///./ecole.db"
+
+
+def test_async_read_routes_against_aiosqlite(tmp_path):
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(bind=sync_engine)
+    with Session(sync_engine) as db:
+        db.add_all([
+            User(email=f"async{i}@ecole-prive.fr", username=f"async{i}", first_name="Async", last_name=str(i),
+                 hashed_password="not-a-real-hash", role=UserRole.ADMIN)
+            for i in range(5)
+        ])
+        db.commit()
+
+    async_engine = create_async_engine(to_async_url(url))
+    AsyncTestingSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncTestingSession() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_reads.users_router, prefix="/users")
+    app.include_router(async_reads.classes_router, prefix="/classes")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    clear_auth_caches()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'async0'})}"}
+
+    with TestClient(app) as client:
+        assert client.get("/users/me", headers=headers).json()["username"] == "async0"
+
+        first_page = client.get("/users/?limit=3", headers=headers)
+        assert [u["username"] for u in first_page.json()] == ["async0", "async1", "async2"]
+        cursor = first_page.headers["X-Next-Cursor"]
+        second_page = client.get(f"/users/?limit=3&cursor={cursor}", headers=headers)
+        assert [u["username"] for u in second_page.json()] == ["async3", "async4"]
+
+        user_id = first_page.json()[1]["id"]
+        assert client.get(f"/users/{user_id}", headers=headers).json()["username"] == "async1"
+        assert client.get("/users/99999", headers=headers).status_code == 404
+
+        etag = client.get("/classes/", headers=headers).headers["ETag"]
+        assert client.get("/classes/", headers={**headers, "If-None-Match": etag}).status_code == 304
+    clear_auth_caches()
+
+
+def test_async_reads_use_replica_until_client_writes(tmp_path, monkeypatch):
+    def make_database(name: str, last_name: str) -> async_sessionmaker:
+        url = f"sqlite:///{tmp_path / name}"
+        sync_engine = create_engine(url)
+        Base.metadata.create_all(bind=sync_engine)
+        with Session(sync_engine) as db:
+            db.add(User(email="reader@ecole-prive.fr", username="reader", first_name="Async", last_name=last_name,
+                        hashed_password="not-a-real-hash", role=UserRole.ADMIN))
+            db.commit()
+        return async_sessionmaker(create_async_engine(to_async_url(url)), expire_on_commit=False)
+
+    PrimarySession = make_database("primary.db", "Principale")
+    monkeypatch.setattr(database, "_AsyncReadSessionLocal", make_database("replica.db", "Réplique"))
+
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with PrimarySession() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_reads.users_router, prefix="/users")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    clear_auth_caches()
+    database.recent_writers.clear()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'reader'})}"}
+
+    with TestClient(app) as client:
+        assert [u["last_name"] for u in client.get("/users/", headers=headers).json()] == ["Réplique"]
+        # Authentication stays on the primary; a recent writer reads the primary too
+        assert client.get("/users/me", headers=headers).json()["last_name"] == "Principale"
+        database.recent_writers.set(headers["Authorization"], True)
+        assert [u["last_name"] for u in client.get("/users/", headers=headers).json()] == ["Principale"]
+    database.recent_writers.clear()
+    clear_auth_caches()
@@ -0,0 +1,101 @@
+"""
+Memory test for the streaming export endpoint.
+
+Streams `/users/export` through the real route (dependencies, authentication,
+middleware) by calling the ASGI app directly: TestClient and httpx's
+ASGITransport buffer the whole body, which would hide a non-streaming response.
+
+The default run exports a small table and checks that the body arrives in
+batches. Set EXPORT_MEMORY_ROWS (e.g. 500000) for the full-size RSS check.
+"""
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from backend.app.auth import clear_auth_caches, create_access_token
+from backend.app.database import Base, get_db
+from backend.app.export import EXPORT_CHUNK_SIZE
+from backend.app.main import app
+from backend.app.models.user import User, UserRole
+
+EXPORT_ROWS = int(os.environ.get("EXPORT_MEMORY_ROWS", 20_000))
+MAX_RSS_GROWTH_BYTES = 64 * 1024 * 1024
+
+
+def current_rss() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+async def stream_get(path: str, query: str, token: str):
+    """GET through the ASGI app; returns (status, body chunks as line counts, RSS growth)."""
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http", "root_path": "",
+        "path": path, "raw_path": path.encode(), "query_string": query.encode(),
+        "headers": [(b"host", b"test"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("test", 50000), "server": ("test", 80),
+    }
+    requested = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    status, chunks = None, []
+    baseline = peak = current_rss()
+
+    async def send(message):
+        nonlocal status, peak
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and message.get("body"):
+            chunks.append(message["body"].count(b"\n"))
+            peak = max(peak, current_rss())
+
+    await app(scope, receive, send)
+    disconnected.set()
+    return status, chunks, peak - baseline
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="RSS sampling needs /proc")
+def test_users_export_endpoint_streams_with_bounded_rss(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for start in range(0, EXPORT_ROWS, 50_000):
+            conn.execute(insert(User), [
+                {"email": f"u{i}@ecole-prive.fr", "username": f"u{i}", "first_name": "Export",
+                 "last_name": f"User{i}", "hashed_password": "x", "role": UserRole.ADMIN, "is_active": True}
+                for i in range(start, min(start + 50_000, EXPORT_ROWS))
+            ])
+
+    def override_get_db():
+        with Session(engine) as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    clear_auth_caches()
+    try:
+        status, chunks, growth = asyncio.run(
+            stream_get("/users/export", "format=ndjson", create_access_token(data={"sub": "u0"}))
+        )
+    finally:
+        del app.dependency_overrides[get_db]
+        clear_auth_caches()
+        engine.dispose()
+
+    assert status == 200
+    assert sum(chunks) == EXPORT_ROWS
+    # One body message per batch read from the server-side cursor, never the whole export at once
+    assert len(chunks) >= EXPORT_ROWS // EXPORT_CHUNK_SIZE
+    assert max(chunks) <= EXPORT_CHUNK_SIZE
+    assert growth < MAX_RSS_GROWTH_BYTES, f"RSS grew by {growth / 2**20:.1f} MiB"
@@ -0,0 +1,92 @@
+from datetime import date
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.app.config import settings
+from backend.app.models.classe import Classe
+from backend.app.models.student import Student
+from backend.app.models.teacher import Teacher
+from backend.app.models.user import User, UserRole
+
+
+def add_people(db: Session, count: int = 3):
+    for i in range(count):
+        student_user = User(email=f"eleve{i}@ecole-prive.fr", username=f"eleve{i}", first_name="Élève",
+                            last_name=f"Nom{count - i}", hashed_password="x", role=UserRole.STUDENT)
+        teacher_user = User(email=f"prof{i}@ecole-prive.fr", username=f"prof{i}", first_name="Prof",
+                            last_name=f"Nom{i}", hashed_password="x", role=UserRole.TEACHER)
+        db.add(Student(user=student_user, student_number=f"ETU{i:04d}", date_of_birth=date(2012, 1, 1),
+                       medical_info="Allergie " * 50))
+        db.add(Teacher(user=teacher_user, employee_number=f"ENS{i:03d}", hire_date=date(2015, 9, 1),
+                       qualifications="Agrégation " * 50))
+    db.commit()
+
+
+def get_with_statements(client: TestClient, db_session: Session, url: str, headers: Dict[str, str]):
+    statements = []
+    bind = db_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(bind, "before_cursor_execute", listener)
+    try:
+        response = client.get(url, headers=headers)
+    finally:
+        event.remove(bind, "before_cursor_execute", listener)
+    assert response.status_code == 200, response.text
+    return response, statements
+
+
+def test_list_fields_are_projected_in_sql_and_output(client: TestClient, db_session: Session,
+                                                     auth_headers: Dict[str, str]):
+    add_people(db_session)
+    response, statements = get_with_statements(
+        client, db_session, "/students/?fields=student_number", auth_headers)
+    assert response.json() == [{"id": i + 1, "student_number": f"ETU{i:04d}"} for i in range(3)]
+    selects = [s for s in statements if "FROM students" in s]
+    assert selects and not [s for s in selects if "medical_info" in s]
+
+    full = client.get("/students/", headers=auth_headers).json()
+    assert full[0]["medical_info"].startswith("Allergie")
+
+
+def test_detail_fields(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    add_people(db_session, 1)
+    teacher_id = db_session.query(Teacher.id).scalar()
+    response, statements = get_with_statements(
+        client, db_session, f"/teachers/{teacher_id}?fields=employee_number,hire_date", auth_headers)
+    assert response.json() == {"id": teacher_id, "employee_number": "ENS000", "hire_date": "2015-09-01"}
+    assert not [s for s in statements if "qualifications" in s]
+
+
+def test_fields_with_sort_and_cursor(client: TestClient, db_session: Session, auth_headers: Dict[str, str]):
+    add_people(db_session)
+    url = "/users/?role=student&sort=last_name&limit=2&fields=username"
+    first = client.get(url, headers=auth_headers)
+    assert [set(u) for u in first.json()] == [{"id", "username"}] * 2
+    assert [u["username"] for u in first.json()] == ["eleve2", "eleve1"]
+    second = client.get(f"{url}&cursor={first.headers['X-Next-Cursor']}", headers=auth_headers)
+    assert [u["username"] for u in second.json()] == ["eleve0"]
+
+
+def test_fields_on_cached_reference_data(client: TestClient, db_session: Session, auth_headers: Dict[str, str],
+                                         monkeypatch):
+    db_session.add(Classe(name="CE1 A", level="CE1", academic_year="2024-2025", max_students=20,
+                          active_enrollments=5, description="Classe de CE1"))
+    db_session.commit()
+    for fast in (False, True):
+        monkeypatch.setattr(settings, "fast_serialization", fast)
+        response = client.get("/classes/?fields=name,fill_rate", headers=auth_headers)
+        assert response.json() == [{"id": 1, "name": "CE1 A", "fill_rate": 0.25}]
+        assert "ETag" in response.headers
+    # The full rows stay cached for requests without a selection
+    assert client.get("/classes/", headers=auth_headers).json()[0]["description"] == "Classe de CE1"
+    assert client.get("/classes/1?fields=level", headers=auth_headers).json() == {"id": 1, "level": "CE1"}
+
+
+def test_unknown_fields_are_rejected(client: TestClient, auth_headers: Dict[str, str]):
+    for url in ("/users/?fields=hashed_password", "/subjects/?fields=", "/enrollments/1?fields=id,nope"):
+        response = client.get(url, headers=auth_headers)
+        assert response.status_code == 400, url
+        assert "valeurs possibles" in response.json()["detail"]
@@ -0,0 +1,129 @@
+"""
+Query-plan regression tests: every hot query must be served by an index.
+
+Runs on a seeded SQLite file by default. Set QUERY_PLAN_DATABASE_URL to a
+(disposable) PostgreSQL database to check the PostgreSQL plans instead; there
+`enable_seqscan` is turned off so that a sequential scan only shows up when no
+index can serve the query, whatever the table sizes.
+"""
+
+import os
+import random
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, insert, select, text, update
+
+from backend.app.database import Base
+from backend.app.filters import enrollment_filters, student_filters, subject_filters, user_filters
+from backend.app.models.classe import Classe
+from backend.app.models.enrollment import Enrollment, EnrollmentStatus
+from backend.app.models.student import Student
+from backend.app.models.subject import Subject
+from backend.app.models.teacher import Teacher
+from backend.app.models.user import User, UserRole
+from backend.app.search import _PG_SEARCH_STUDENTS, _PG_SEARCH_USERS, _SQLITE_SEARCH, fts_tiers
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    url = os.environ.get("QUERY_PLAN_DATABASE_URL") or f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}"
+    engine = create_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    seed(engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+def seed(engine, classes=40, teachers=100, students=3000, subjects=400):
+    rng = random.Random(7)
+    roles = [UserRole.STUDENT] * students + [UserRole.TEACHER] * teachers + [UserRole.PARENT] * 500
+    with engine.begin() as conn:
+        user_ids = conn.execute(insert(User).returning(User.id, sort_by_parameter_order=True), [
+            {"email": f"u{i}@ecole-prive.fr", "username": f"u{i}", "first_name": f"Prénom{i % 97}",
+             "last_name": f"Nom{i % 389}", "hashed_password": "x", "role": role}
+            for i, role in enumerate(roles)
+        ]).scalars().all()
+        classe_ids = conn.execute(insert(Classe).returning(Classe.id, sort_by_parameter_order=True), [
+            {"name": f"Classe {i}", "level": f"N{i % 7}", "academic_year": f"{2015 + i % 10}-{2016 + i % 10}",
+             "max_students": 200}
+            for i in range(classes)
+        ]).scalars().all()
+        student_ids = conn.execute(insert(Student).returning(Student.id, sort_by_parameter_order=True), [
+            {"user_id": user_ids[i], "student_number": f"STU{i:06d}", "date_of_birth": date(2012, 1, 1),
+             "parent_name": f"Parent {i % 211}"}
+            for i in range(students)
+        ]).scalars().all()
+        teacher_ids = conn.execute(insert(Teacher).returning(Teacher.id, sort_by_parameter_order=True), [
+            {"user_id": user_ids[students + i], "employee_number": f"EMP{i:05d}", "hire_date": date(2010 + i % 12, 9, 1)}
+            for i in range(teachers)
+        ]).scalars().all()
+        conn.execute(insert(Subject), [
+            {"name": f"Matière {i % 23}", "code": f"SUB{i:05d}", "hours_per_week": 1 + i % 5,
+             "teacher_id": rng.choice(teacher_ids), "classe_id": rng.choice(classe_ids)}
+            for i in range(subjects)
+        ])
+        statuses = list(EnrollmentStatus)
+        # Two distinct classes per student: at most one active enrollment per (student, class)
+        conn.execute(insert(Enrollment), [
+            {"student_id": student_id, "classe_id": classe_id, "status": rng.choice(statuses)}
+            for student_id in student_ids for classe_id in rng.sample(classe_ids, 2)
+        ])
+        conn.exec_driver_sql("ANALYZE")
+
+
+def page(stmt, order_column):
+    """Same shape as `paginate`: ORDER BY ... LIMIT limit + 1."""
+    return stmt.order_by(order_column).limit(21)
+
+
+def search_query(dialect, pg_statement, fts_table, q, tier):
+    if dialect == "postgresql":
+        return pg_statement.bindparams(q=q, skip=0, limit=20)
+    return text(_SQLITE_SEARCH.format(table=fts_table)).bindparams(q=fts_tiers(q)[tier], skip=0, limit=20)
+
+
+HOT_QUERIES = {
+    "login": lambda d: select(User).where(User.username == "u42"),
+    "users_by_role": lambda d: page(select(User).where(*user_filters(role=UserRole.TEACHER)), User.id),
+    "users_sorted_by_last_name": lambda d: select(User).order_by(User.last_name, User.id).limit(21),
+    "students_in_classe": lambda d: page(select(Student).where(*student_filters(classe_id=3)), Student.id),
+    "subjects_by_classe": lambda d: page(select(Subject).where(*subject_filters(classe_id=3)), Subject.id),
+    "subjects_by_teacher": lambda d: page(select(Subject).where(*subject_filters(teacher_id=5)), Subject.id),
+    "enrollments_by_classe_and_status": lambda d: page(
+        select(Enrollment).where(*enrollment_filters(classe_id=3, status=EnrollmentStatus.ACTIVE)), Enrollment.id),
+    "enrollments_by_student": lambda d: page(select(Enrollment).where(*enrollment_filters(student_id=17)), Enrollment.id),
+    "enrollment_duplicate_check": lambda d: select(Enrollment.id).where(
+        Enrollment.student_id == 17, Enrollment.classe_id == 3, Enrollment.status == EnrollmentStatus.ACTIVE),
+    "roster": lambda d: select(Enrollment).where(Enrollment.classe_id == 3).order_by(Enrollment.id),
+    "claim_seat": lambda d: update(Classe).where(Classe.id == 3, Classe.active_enrollments < Classe.max_students)
+        .values(active_enrollments=Classe.active_enrollments + 1),
+    "search_users": lambda d: search_query(d, _PG_SEARCH_USERS, "users_fts", "nom12", tier=0),
+    "search_students": lambda d: search_query(d, _PG_SEARCH_STUDENTS, "students_fts", "parent 12", tier=2),
+}
+
+
+def explain(conn, stmt) -> str:
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    if conn.dialect.name == "postgresql":
+        conn.exec_driver_sql("SET enable_seqscan = off")
+        return "\n".join(row[0] for row in conn.exec_driver_sql(f"EXPLAIN {sql}"))
+    return "\n".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+
+
+def sequential_scans(plan: str, dialect: str) -> list:
+    if dialect == "postgresql":
+        return [line.strip() for line in plan.splitlines() if "Seq Scan" in line]
+    # SQLite: "SCAN t" reads the whole table; "SCAN t USING INDEX" walks an index in order
+    # and FTS5 tables are scanned through their own index ("VIRTUAL TABLE INDEX")
+    return [line.strip() for line in plan.splitlines()
+            if line.strip().startswith("SCAN") and "INDEX" not in line]
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_an_index(engine, name):
+    with engine.connect() as conn:
+        plan = explain(conn, HOT_QUERIES[name](conn.dialect.name))
+    assert sequential_scans(plan, engine.dialect.name) == [], f"{name} :\n{plan}"
@@ -0,0 +1,84 @@
+from datetime import date
+from typing import Dict
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.app import database
+from backend.app.database import Base, ReadYourWritesMiddleware
+from backend.app.models.classe import Classe
+from backend.app.models.teacher import Teacher
+from backend.app.models.user import User, UserRole
+
+
+def make_sqlite_session_factory(path):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def test_reads_use_replica_until_client_writes(client: TestClient, db_session: Session,
+                                               auth_headers: Dict[str, str], tmp_path, monkeypatch):
+    ReplicaSession = make_sqlite_session_factory(tmp_path / "replica.db")
+    with ReplicaSession() as replica:
+        replica.add(Classe(name="Réplique", level="CP", academic_year="2024-2025"))
+        replica.commit()
+    db_session.add(Classe(name="Principale", level="CP", academic_year="2024-2025"))
+    db_session.commit()
+    monkeypatch.setattr(database, "ReadSessionLocal", ReplicaSession)
+    database.recent_writers.clear()
+
+    assert [c["name"] for c in client.get("/classes/", headers=auth_headers).json()] == ["Réplique"]
+
+    # The middleware marks the client after a successful write
+    database.recent_writers.set(auth_headers["Authorization"], True)
+    assert [c["name"] for c in client.get("/classes/", headers=auth_headers).json()] == ["Principale"]
+    database.recent_writers.clear()
+
+
+def test_workloads_are_computed_on_the_primary(client: TestClient, db_session: Session,
+                                              auth_headers: Dict[str, str], tmp_path, monkeypatch):
+    # The result is cached for every client: a lagging replica must not feed it
+    ReplicaSession = make_sqlite_session_factory(tmp_path / "replica.db")
+    user = User(email="prof@ecole-prive.fr", username="prof", first_name="Prof", last_name="Principal",
+                hashed_password="x", role=UserRole.TEACHER)
+    teacher = Teacher(user=user, employee_number="EMP00001", hire_date=date(2015, 9, 1))
+    db_session.add(teacher)
+    db_session.commit()
+    teacher_id = teacher.id
+    monkeypatch.setattr(database, "ReadSessionLocal", ReplicaSession)
+    database.recent_writers.clear()
+
+    response = client.get("/teachers/workload", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert [w["teacher_id"] for w in response.json()] == [teacher_id]
+
+
+def test_middleware_marks_successful_writes_only():
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    @app.post("/ok")
+    def ok():
+        return {}
+
+    @app.post("/fail", status_code=400)
+    def fail():
+        return {}
+
+    @app.get("/read")
+    def read():
+        return {}
+
+    database.recent_writers.clear()
+    with TestClient(app) as client:
+        client.get("/read", headers={"Authorization": "Bearer reader"})
+        client.post("/fail", headers={"Authorization": "Bearer failing"})
+        client.post("/ok", headers={"Authorization": "Bearer writer"})
+
+    assert database.recent_writers.get("Bearer writer")
+    assert database.recent_writers.get("Bearer failing") is None
+    assert database.recent_writers.get("Bearer reader") is None
+    database.recent_writers.clear()
@@ -0,0 +1,166 @@
+import time
+from pathlib import Path
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+from backend.app.auth import principal_cache
+from backend.app.config import settings
+from backend.app.models.classe import Classe
+from backend.app.models.table_version import TableVersion
+from backend.app.workload import workload_cache
+from backend.app import reference_cache as reference_cache_module
+from backend.app.reference_cache import (
+    PRINCIPALS,
+    InvalidationListener,
+    apply_invalidation,
+    reference_cache,
+    signal_path,
+    start_reference_cache,
+    stop_reference_cache,
+)
+
+
+def test_reads_are_served_from_cache_until_a_write(client: TestClient, db_session: Session,
+                                                   auth_headers: Dict[str, str]):
+    classe = Classe(name="CM1 A", level="CM1", academic_year="2024-2025")
+    db_session.add(classe)
+    db_session.commit()
+    classe_id = classe.id
+
+    assert client.get(f"/classes/{classe_id}", headers=auth_headers).json()["name"] == "CM1 A"
+    assert [c["name"] for c in client.get("/classes/", headers=auth_headers).json()] == ["CM1 A"]
+    # Change behind the API's back: cached reads do not see it
+    db_session.execute(update(Classe).where(Classe.id == classe_id).values(name="CM1 Z"))
+    db_session.commit()
+    assert client.get(f"/classes/{classe_id}", headers=auth_headers).json()["name"] == "CM1 A"
+    assert [c["name"] for c in client.get("/classes/", headers=auth_headers).json()] == ["CM1 A"]
+    stats = reference_cache.stats()["classes"]
+    assert stats["hits"] >= 2 and stats["misses"] >= 2
+
+    # A write through the API invalidates the ids and the list pages
+    response = client.put(f"/classes/{classe_id}", json={"name": "CM1 B"}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert client.get(f"/classes/{classe_id}", headers=auth_headers).json()["name"] == "CM1 B"
+    assert [c["name"] for c in client.get("/classes/", headers=auth_headers).json()] == ["CM1 B"]
+    assert client.get("/classes/999999", headers=auth_headers).status_code == 404
+
+
+def test_new_table_version_is_a_cache_miss(client: TestClient, db_session: Session,
+                                          auth_headers: Dict[str, str]):
+    classe = Classe(name="CM2 A", level="CM2", academic_year="2024-2025")
+    db_session.add(classe)
+    db_session.commit()
+    classe_id = classe.id
+
+    first = client.get(f"/classes/{classe_id}", headers=auth_headers)
+    assert first.json()["name"] == "CM2 A"
+    assert [c["name"] for c in client.get("/classes/", headers=auth_headers).json()] == ["CM2 A"]
+    # Another worker committed a write and bumped the version; its invalidation has not arrived yet
+    db_session.execute(update(Classe).where(Classe.id == classe_id).values(name="CM2 B"))
+    db_session.execute(
+        update(TableVersion).where(TableVersion.name == "classes").values(version=TableVersion.version + 1)
+    )
+    db_session.commit()
+
+    second = client.get(f"/classes/{classe_id}", headers=auth_headers)
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.json()["name"] == "CM2 B"
+    assert [c["name"] for c in client.get("/classes/", headers=auth_headers).json()] == ["CM2 B"]
+
+
+def test_signal_file_invalidates_other_workers(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "reference_cache_poll_seconds", 0.01)
+    engine = create_engine(f"sqlite:///{tmp_path / 'workers.db'}")
+    listener = InvalidationListener(engine)
+    listener.start()
+    try:
+        reference_cache.put("subjects", ("item", 1), {"id": 1})
+        time.sleep(0.05)
+        # Another worker committed a write on subjects
+        Path(signal_path(engine.url.database, "subjects")).touch()
+        deadline = time.monotonic() + 2
+        while reference_cache.get("subjects", ("item", 1)) is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert reference_cache.get("subjects", ("item", 1)) is None
+    finally:
+        listener.stop()
+        listener.join()
+        engine.dispose()
+
+
+def test_user_changes_invalidate_principals_on_other_workers(tmp_path, monkeypatch):
+    # PostgreSQL payload: only the named user is dropped
+    principal_cache.set("kept", object())
+    principal_cache.set("changed", object())
+    apply_invalidation(f"{PRINCIPALS}:changed")
+    assert principal_cache.get("changed") is None and principal_cache.get("kept") is not None
+
+    # SQLite signal file: the user is unknown, the whole principal cache is dropped
+    monkeypatch.setattr(settings, "reference_cache_poll_seconds", 0.01)
+    engine = create_engine(f"sqlite:///{tmp_path / 'workers.db'}")
+    listener = InvalidationListener(engine)
+    listener.start()
+    try:
+        time.sleep(0.05)
+        Path(signal_path(engine.url.database, PRINCIPALS)).touch()
+        deadline = time.monotonic() + 2
+        while principal_cache.get("kept") is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert principal_cache.get("kept") is None
+    finally:
+        listener.stop()
+        listener.join()
+        engine.dispose()
+
+
+def test_subject_and_teacher_writes_invalidate_workloads_on_other_workers(tmp_path, monkeypatch):
+    workload_cache.set("all", {})
+    apply_invalidation("subjects")
+    assert workload_cache.get("all") is None
+
+    monkeypatch.setattr(settings, "reference_cache_poll_seconds", 0.01)
+    engine = create_engine(f"sqlite:///{tmp_path / 'workers.db'}")
+    listener = InvalidationListener(engine)
+    listener.start()
+    try:
+        workload_cache.set("all", {})
+        time.sleep(0.05)
+        # Another worker created or deleted a teacher (broadcast_invalidation)
+        Path(signal_path(engine.url.database, "teachers")).touch()
+        deadline = time.monotonic() + 2
+        while workload_cache.get("all") is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert workload_cache.get("all") is None
+    finally:
+        listener.stop()
+        listener.join()
+        engine.dispose()
+
+
+def test_listener_and_warm_up_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cache_invalidation_listener", False)
+    monkeypatch.setattr(settings, "reference_cache_warm_up", False)
+    engine = create_engine(f"sqlite:///{tmp_path / 'startup.db'}")
+
+    def no_session():
+        raise AssertionError("warm-up must not open a session")
+
+    try:
+        start_reference_cache(engine, no_session)
+        assert reference_cache_module._listener is None
+    finally:
+        stop_reference_cache()
+        engine.dispose()
+
+
+def test_admin_cache_stats(client: TestClient, auth_headers: Dict[str, str]):
+    client.get("/subjects/", headers=auth_headers)
+    response = client.get("/admin/cache", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert set(data["reference"]) == {"classes", "subjects"}
+    assert data["reference"]["subjects"]["misses"] >= 1
+    assert {"hits", "misses", "size", "invalidations"} <= set(data["reference"]["classes"])
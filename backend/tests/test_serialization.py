@@ -0,0 +1,58 @@
+from datetime import date
+from typing import Dict
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from backend.app.config import settings
+from backend.app.models.classe import Classe
+from backend.app.models.enrollment import Enrollment, EnrollmentStatus
+from backend.app.models.student import Student
+from backend.app.models.subject import Subject
+from backend.app.models.teacher import Teacher
+from backend.app.models.user import User, UserRole
+from backend.app.reference_cache import reference_cache
+
+LIST_URLS = [
+    "/users/", "/users/?limit=1", "/users/search?q=dupont",
+    "/students/", "/students/search?q=martin",
+    "/teachers/", "/classes/", "/classes/?limit=1", "/subjects/", "/enrollments/?limit=1",
+]
+
+
+@pytest.fixture
+def school(db_session: Session):
+    teacher_user = User(email="jean.dupont@ecole-prive.fr", username="jdupont", first_name="Jean",
+                        last_name="Dupont", hashed_password="x", role=UserRole.TEACHER, phone="01 02 03 04 05")
+    student_user = User(email="lea.martin@ecole-prive.fr", username="lmartin", first_name="Léa",
+                        last_name="Martin", hashed_password="x", role=UserRole.STUDENT)
+    teacher = Teacher(user=teacher_user, employee_number="ENS001", hire_date=date(2015, 9, 1), salary=320000)
+    student = Student(user=student_user, student_number="ETU0001", date_of_birth=date(2013, 4, 2),
+                      parent_name="Paul Martin", parent_email="paul.martin@example.com")
+    classes = [Classe(name=f"CM2 {s}", level="CM2", academic_year="2024-2025", max_students=25) for s in "AB"]
+    db_session.add_all([teacher, student, *classes])
+    db_session.flush()
+    db_session.add_all([
+        Subject(name="Français", code="FRA001", hours_per_week=5, teacher_id=teacher.id, classe_id=classes[0].id),
+        Enrollment(student_id=student.id, classe_id=classes[0].id, status=EnrollmentStatus.ACTIVE),
+        Enrollment(student_id=student.id, classe_id=classes[1].id, status=EnrollmentStatus.DROPPED),
+    ])
+    db_session.commit()
+
+
+@pytest.mark.parametrize("url", LIST_URLS)
+def test_fast_serialization_matches_validated_output(client: TestClient, school, auth_headers: Dict[str, str],
+                                                     monkeypatch, url):
+    responses = {}
+    for fast in (False, True):
+        monkeypatch.setattr(settings, "fast_serialization", fast)
+        reference_cache.clear()
+        responses[fast] = client.get(url, headers=auth_headers)
+        assert responses[fast].status_code == 200, responses[fast].text
+
+    assert responses[True].json() == responses[False].json()
+    assert responses[True].json(), url
+    assert responses[True].headers["content-type"] == "application/json"
+    for header in ("X-Next-Cursor", "ETag"):
+        assert responses[True].headers.get(header) == responses[False].headers.get(header)
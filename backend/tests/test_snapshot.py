@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from backend.app import seed_data
+from backend.app.clear_data import data_tables, truncate_statement, truncate_tables
+from backend.app.database import Base
+from backend.app.models.student import Student
+from backend.app.models.table_version import TableVersion
+from backend.app.models.user import User, UserRole
+from backend.app.search import search_students, search_users
+from backend.app.snapshot import dump_snapshot, restore_snapshot
+
+
+@pytest.fixture
+def seeded_engine(tmp_path, monkeypatch):
+    monkeypatch.setattr(seed_data, "get_password_hash", lambda password: f"hash:{password}")
+    engine = create_engine(f"sqlite:///{tmp_path / 'school.db'}")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        seed_data.generate_dataset(db, scale=1, workers=1)
+    yield engine
+    engine.dispose()
+
+
+def row_counts(engine):
+    with engine.connect() as connection:
+        return {table.name: connection.execute(select(func.count()).select_from(table)).scalar()
+                for table in data_tables()}
+
+
+def versions(engine):
+    with Session(engine) as db:
+        return dict(db.execute(select(TableVersion.name, TableVersion.version)).all())
+
+
+def test_truncate_empties_tables_and_keeps_search_triggers(seeded_engine):
+    with seeded_engine.begin() as connection:
+        truncate_tables(connection)
+    assert set(row_counts(seeded_engine).values()) == {0}
+
+    with Session(seeded_engine) as db:
+        assert search_students(db, "ETU") == []
+        # Ids restart at 1 and the FTS triggers were restored
+        user = User(email="lea.martin@ecole-prive.fr", username="lmartin", first_name="Léa", last_name="Martin",
+                    hashed_password="x", role=UserRole.STUDENT)
+        db.add(user)
+        db.commit()
+        assert user.id == 1
+        assert [u.id for u in search_users(db, "martin")] == [1]
+
+
+def test_postgresql_truncate_statement():
+    assert truncate_statement(data_tables()) == (
+        "TRUNCATE subjects, enrollments, teachers, students, users, classes RESTART IDENTITY CASCADE"
+    )
+
+
+def test_snapshot_round_trip(seeded_engine, tmp_path):
+    seeded = row_counts(seeded_engine)
+    with Session(seeded_engine) as db:
+        students = db.execute(select(Student.id, Student.student_number).order_by(Student.id)).all()
+    path = str(tmp_path / "snapshots" / "school.snapshot")
+    assert dump_snapshot(path, seeded_engine) > 0
+
+    with seeded_engine.begin() as connection:
+        truncate_tables(connection)
+    before = versions(seeded_engine)
+    restore_snapshot(path, seeded_engine)
+
+    assert row_counts(seeded_engine) == seeded
+    with Session(seeded_engine) as db:
+        assert db.execute(select(Student.id, Student.student_number).order_by(Student.id)).all() == students
+        assert search_students(db, students[0].student_number)[0].id == students[0].id
+    # ETags issued before the restore can no longer match
+    assert all(version > before[name] for name, version in versions(seeded_engine).items())
+
+
+def test_restore_rejects_foreign_files(seeded_engine, tmp_path):
+    path = tmp_path / "not-a-snapshot"
+    path.write_bytes(b"PK\x03\x04 zip archive")
+    with pytest.raises(ValueError):
+        restore_snapshot(str(path), seeded_engine)